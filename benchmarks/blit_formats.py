@@ -0,0 +1,102 @@
+"""Compare blit speed of the different surface format paths.
+
+Blits the same 40x40 sprite many times to a display-sized surface, once for
+each way a surface can be prepared, and checks that every path produces the
+same pixels as the plain SRCALPHA surface.
+
+    python benchmarks/blit_formats.py [--blits 20000] [--size 40] [--json]
+"""
+import argparse
+import time
+
+from common import print_results, setup_headless
+
+
+def make_sprite(size, alpha=True):
+    """An enemy-like sprite: a filled ellipse on a transparent (or colorkeyed) background."""
+    import pygame
+    if alpha:
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+    else:
+        sprite = pygame.Surface((size, size))
+        sprite.fill((255, 0, 255))
+        sprite.set_colorkey((255, 0, 255))
+    pygame.draw.ellipse(sprite, (200, 40, 40), (0, 0, size, size))
+    pygame.draw.ellipse(sprite, (0, 0, 0), (size // 4, size // 2, size // 2, size // 6))
+    return sprite
+
+
+def build_paths(size):
+    import pygame
+    from src.surface_factory import surface_factory
+
+    opaque = pygame.Surface((size, size), depth=24)
+    opaque.fill((200, 40, 40))
+    return [
+        ("srcalpha (unconverted)", make_sprite(size)),
+        ("convert_alpha", surface_factory.convert(make_sprite(size), alpha=True)),
+        ("convert_alpha + RLE", surface_factory.convert(make_sprite(size), alpha=True, rle=True)),
+        ("colorkey (unconverted)", make_sprite(size, alpha=False)),
+        ("colorkey + RLE", surface_factory.convert(make_sprite(size, alpha=False), rle=True)),
+        ("opaque 24-bit (unconverted)", opaque),
+        ("opaque display format", surface_factory.convert(opaque, alpha=False))
+    ]
+
+
+def time_blits(target, sprite, blits):
+    width = target.get_width() - sprite.get_width()
+    height = target.get_height() - sprite.get_height()
+    start = time.perf_counter()
+    for i in range(blits):
+        target.blit(sprite, (i * 37 % width, i * 53 % height))
+    return time.perf_counter() - start
+
+
+def render_once(screen, sprite):
+    """Draw a sprite on a fixed background and return the resulting pixels."""
+    import pygame
+    area = pygame.Surface(sprite.get_size()).convert(screen)
+    area.fill((30, 60, 90))
+    area.blit(sprite, (0, 0))
+    return pygame.image.tobytes(area, "RGB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blits", type=int, default=20000, help="blits per path")
+    parser.add_argument("--size", type=int, default=40, help="sprite width and height")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    setup_headless()
+    import pygame
+    from src.constants import SCREEN_SIZE
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+
+    paths = build_paths(args.size)
+    references = {
+        True: render_once(screen, paths[0][1]),   # Per-pixel alpha paths
+        False: render_once(screen, paths[3][1])   # Colorkey paths
+    }
+
+    results = []
+    for name, sprite in paths:
+        time_blits(screen, sprite, 500)  # Warm up
+        elapsed = time_blits(screen, sprite, args.blits)
+        if "opaque" in name:
+            same_pixels = "-"
+        else:
+            same_pixels = render_once(screen, sprite) == references["colorkey" not in name]
+        results.append({
+            "path": name,
+            "bits": sprite.get_bitsize(),
+            "rle": bool(sprite.get_flags() & pygame.RLEACCEL),
+            "us_per_blit": elapsed / args.blits * 1e6,
+            "same_pixels": same_pixels
+        })
+    print_results(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks run headless (SDL dummy video and audio drivers) from the project
+root, because the game loads its assets through relative paths.
+"""
+import contextlib
+import json
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def setup_headless(root=ROOT):
+    """Use SDL's dummy drivers and make the game at `root` importable."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # Keep stdout clean for JSON output
+    os.chdir(root)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+
+@contextlib.contextmanager
+def quiet(verbose=False):
+    """Silence the game's console output so benchmark results stay readable."""
+    if verbose:
+        yield
+        return
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def make_game(root=ROOT, verbose=False):
+    """Create a headless Game instance sitting on the main menu."""
+    setup_headless(root)
+    from src.game import Game
+    with quiet(verbose):
+        game = Game()
+    return game
+
+
+def make_invulnerable(player):
+    """Stop the player from dying so long benchmarks stay in the play state."""
+    if hasattr(player, "invulnerable"):
+        player.invulnerable = True
+    else:
+        # Trees from before invulnerability (compare.py baselines): outlast any benchmark instead
+        player.health = player.max_health = 10 ** 9
+
+
+def start_play(game, character="base", seed=0):
+    """Start a fresh, seeded game in the play state with an invulnerable player."""
+    from src.constants import STATE_PLAY
+    options = getattr(game, "options", None)
+    if options is not None:  # Trees from before launch options (compare.py baselines) have none
+        options["seed"] = seed
+    random.seed(seed)  # Trees from before the game had its own RNG (compare.py baselines)
+    game.selected_character = character
+    game.reset_game()
+    make_invulnerable(game.player)
+    game.change_state(STATE_PLAY)
+
+
+def populate(game, count, wave=1, types=("basic", "fast", "tank"), radius=None, bosses=0):
+    """Jump to `wave` and add `count` enemies (cycling through `types`) plus `bosses` bosses.
+
+    Enemies are scattered over the whole map, or within `radius` of the
+    player. The spawn cap is raised to the new population so regular
+    spawning only replaces enemies that die.
+    """
+    from src.constants import MAP_WIDTH, MAP_HEIGHT
+    rng = getattr(game, "rng", None) or random
+    manager = game.enemy_manager
+    manager.current_wave = wave
+    manager.update_enemy_types()
+
+    player = game.player
+    for i in range(count):
+        if radius is None:
+            x = rng.uniform(0, MAP_WIDTH - 40)
+            y = rng.uniform(0, MAP_HEIGHT - 40)
+        else:
+            x = min(max(0, player.x + rng.uniform(-radius, radius)), MAP_WIDTH - 40)
+            y = min(max(0, player.y + rng.uniform(-radius, radius)), MAP_HEIGHT - 40)
+        manager.spawn_enemy(types[i % len(types)], x, y)
+    if bosses:
+        manager.enemy_types.setdefault("boss", dict(manager.enemy_types["tank"], color=(128, 0, 128)))
+        for _ in range(bosses):
+            manager.spawn_boss()
+    manager.max_enemies = max(manager.max_enemies, len(manager.enemies))
+
+
+def print_results(results, as_json=False):
+    """Print a list of result dicts as JSON or as an aligned table."""
+    if as_json:
+        print(json.dumps(results, indent=2))
+        return
+    if not results:
+        return
+    columns = list(results[0].keys())
+    widths = [max(len(col), *(len(format_value(row[col])) for row in results)) for col in columns]
+    print("  ".join(col.ljust(width) for col, width in zip(columns, widths)))
+    for row in results:
+        print("  ".join(format_value(row[col]).ljust(width) for col, width in zip(columns, widths)))
+
+
+def format_value(value):
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
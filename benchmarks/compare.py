@@ -0,0 +1,272 @@
+"""Compare headless timings of two checkouts and flag performance regressions.
+
+Times a fixed set of workloads (EnemyManager.update, both projectile
+collision passes and PlayState.render) in a baseline and a candidate tree.
+Each side runs in its own process, alternating over --rounds so drift on
+the machine hits both equally. A workload is flagged as a regression when
+the candidate is more than --threshold percent slower and the 95%
+confidence interval of the difference (Welch's t) excludes zero. The exit
+status is 1 if anything regressed.
+
+Baseline and candidate are directories or git refs (checked out into a
+temporary worktree). The candidate defaults to this working tree.
+
+    python benchmarks/compare.py --baseline HEAD~1 [--candidate .] [--rounds 6] [--repeat 3] [--threshold 5]
+
+Each run's candidate throughput (ticks, passes or frames per second,
+depending on the workload) is appended to a local history file (--history)
+for plotting over time.
+
+The worker only uses what every checkout of the game has, so baselines
+from before the benchmark helpers' features (launch options, the surface
+factory, invulnerability) can still be measured.
+"""
+import argparse
+import gc
+import json
+import math
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import ROOT, print_results
+
+# Two-sided 95% critical values of Student's t for 1-30 degrees of freedom
+T_CRITICAL_95 = [
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042
+]
+
+WORKLOADS = [
+    "EnemyManager.update",
+    "collisions.enemy_projectiles",
+    "collisions.player_projectiles",
+    "PlayState.render",
+]
+
+# What one call of each workload is, for naming its throughput in the history file
+WORKLOAD_UNITS = {
+    "EnemyManager.update": "ticks_per_sec",
+    "collisions.enemy_projectiles": "passes_per_sec",
+    "collisions.player_projectiles": "passes_per_sec",
+    "PlayState.render": "frames_per_sec",
+}
+
+
+# --- Worker: runs inside the checkout being measured ---------------------
+
+def build_world(game, seed):
+    """Seeded wave 10 world with 100 enemies and Ashe's volleys in flight."""
+    from common import populate, start_play
+    start_play(game, "ashe", seed)
+    populate(game, 100, wave=10, radius=700)
+    player = game.player
+    for tick in range(60):
+        if tick % 10 == 0:
+            player.volley_cooldown = 0
+            player.volley(player.x + 300, player.y)
+        game.update()
+
+
+def time_calls(function, calls, batches=5):
+    """Ms per call: the best of `batches` batches that together make `calls` calls.
+
+    Taking the best batch filters out time lost to other processes, which
+    otherwise makes whole samples twice as slow on busy machines. The
+    garbage collector is held off while timing (like timeit).
+    """
+    per_batch = max(1, calls // batches)
+    gc.collect()
+    gc.disable()
+    try:
+        best = None
+        for _ in range(batches):
+            start = time.perf_counter()
+            for _ in range(per_batch):
+                function()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best * 1000 / per_batch
+    finally:
+        gc.enable()
+
+
+def run_worker(root, repeat, seed):
+    from common import make_game, quiet
+    game = make_game(root)
+    import pygame
+    # Plain display-format surface: older checkouts have no surface factory
+    surface = pygame.Surface(game.screen.get_size()).convert()
+
+    functions = {
+        "EnemyManager.update": lambda: game.enemy_manager.update(),
+        "collisions.enemy_projectiles": lambda: game.enemy_manager.check_projectile_collisions(),
+        "collisions.player_projectiles": lambda: game.check_projectile_collisions(),
+        "PlayState.render": lambda: game.state.render(surface),
+    }
+    calls = {"EnemyManager.update": 300, "PlayState.render": 50}  # About 50 ms per sample
+
+    samples = {name: [] for name in WORKLOADS}
+    with quiet():
+        for _ in range(repeat):
+            for name in WORKLOADS:
+                # Rebuild the same world for every sample so samples are independent
+                build_world(game, seed)
+                samples[name].append(time_calls(functions[name], calls.get(name, 2000)))
+    json.dump(samples, sys.stdout)
+
+
+# --- Driver ---------------------------------------------------------------
+
+def checkout(source, temp_dirs):
+    """Return a directory for `source`: itself if it's a directory, else a worktree of that git ref."""
+    if os.path.isdir(source):
+        return os.path.abspath(source)
+    path = tempfile.mkdtemp(prefix="compare-")
+    subprocess.run(["git", "-C", ROOT, "worktree", "add", "--detach", path, source],
+                   check=True, capture_output=True)
+    temp_dirs.append(path)
+    return path
+
+
+def remove_checkouts(temp_dirs):
+    for path in temp_dirs:
+        subprocess.run(["git", "-C", ROOT, "worktree", "remove", "--force", path], capture_output=True)
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def describe(root):
+    """Commit id of a checkout, marked "+dirty" when it has local changes."""
+    def git(*args):
+        result = subprocess.run(["git", "-C", root, *args], capture_output=True, text=True)
+        return result.stdout.strip() if result.returncode == 0 else ""
+    commit = git("rev-parse", "--short", "HEAD") or "unknown"
+    return commit + ("+dirty" if git("status", "--porcelain", "--untracked-files=no") else "")
+
+
+def run_side(root, repeat, seed):
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", root, "--repeat", str(repeat), "--seed", str(seed)],
+        capture_output=True, text=True,
+        env=dict(os.environ, PYTHONHASHSEED="0")  # Same dict/set layouts in every run
+    )
+    if result.returncode != 0:
+        sys.exit(f"Benchmark failed in {root}:\n{result.stderr}")
+    return json.loads(result.stdout)
+
+
+def compare(baseline, candidate, threshold):
+    """Delta and 95% confidence interval (as % of the baseline mean) for one workload's samples."""
+    base_mean, cand_mean = statistics.mean(baseline), statistics.mean(candidate)
+    base_var = statistics.variance(baseline) / len(baseline)
+    cand_var = statistics.variance(candidate) / len(candidate)
+    diff = cand_mean - base_mean
+    error = math.sqrt(base_var + cand_var)
+
+    # Welch-Satterthwaite degrees of freedom
+    if error > 0:
+        df = (base_var + cand_var) ** 2 / (
+            base_var ** 2 / (len(baseline) - 1) + cand_var ** 2 / (len(candidate) - 1))
+    else:
+        df = len(baseline) + len(candidate) - 2
+    t = T_CRITICAL_95[int(df) - 1] if 1 <= df <= len(T_CRITICAL_95) else 1.96
+
+    delta = 100 * diff / base_mean
+    low = 100 * (diff - t * error) / base_mean
+    high = 100 * (diff + t * error) / base_mean
+    if delta > threshold and low > 0:
+        verdict = "REGRESSION"
+    elif delta < -threshold and high < 0:
+        verdict = "improved"
+    else:
+        verdict = "ok"
+    return {
+        "baseline_ms": base_mean,
+        "candidate_ms": cand_mean,
+        "delta_pct": delta,
+        "ci_low_pct": low,
+        "ci_high_pct": high,
+        "verdict": verdict
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", help="baseline directory or git ref")
+    parser.add_argument("--candidate", default=ROOT, help="candidate directory or git ref (default: this tree)")
+    parser.add_argument("--rounds", type=int, default=6, help="alternating baseline/candidate runs")
+    parser.add_argument("--repeat", type=int, default=3, help="samples per workload in each run")
+    parser.add_argument("--seed", type=int, default=1, help="random seed used to build the world")
+    parser.add_argument("--threshold", type=float, default=5.0, help="percent slowdown that counts as a regression")
+    parser.add_argument("--output", help="write samples and comparison as JSON to this file")
+    parser.add_argument("--history", default=os.path.join(ROOT, "benchmarks", "history.jsonl"),
+                        help="file the candidate's throughput is appended to ('' to skip)")
+    parser.add_argument("--json", action="store_true", help="print the comparison as JSON")
+    parser.add_argument("--worker", metavar="ROOT", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.repeat, args.seed)
+        return
+    if not args.baseline:
+        parser.error("--baseline is required")
+
+    temp_dirs = []
+    try:
+        baseline_root = checkout(args.baseline, temp_dirs)
+        candidate_root = checkout(args.candidate, temp_dirs)
+        samples = {"baseline": {name: [] for name in WORKLOADS}, "candidate": {name: [] for name in WORKLOADS}}
+        for round_number in range(args.rounds):
+            # Alternate which side goes first so slow drift doesn't favor one
+            sides = [("baseline", baseline_root), ("candidate", candidate_root)]
+            if round_number % 2:
+                sides.reverse()
+            for side, root in sides:
+                for name, values in run_side(root, args.repeat, args.seed).items():
+                    samples[side][name].extend(values)
+        candidate_commit = describe(candidate_root)
+        baseline_commit = describe(baseline_root)
+    finally:
+        remove_checkouts(temp_dirs)
+
+    results = []
+    for name in WORKLOADS:
+        row = {"workload": name}
+        row.update(compare(samples["baseline"][name], samples["candidate"][name], args.threshold))
+        results.append(row)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "baseline": {"source": args.baseline, "commit": baseline_commit},
+                "candidate": {"source": args.candidate, "commit": candidate_commit},
+                "threshold_pct": args.threshold,
+                "samples": samples,
+                "results": results
+            }, f, indent=2)
+
+    if args.history:
+        with open(args.history, "a") as f:
+            f.write(json.dumps({
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "commit": candidate_commit,
+                "throughput": {
+                    row["workload"]: {WORKLOAD_UNITS[row["workload"]]: 1000 / row["candidate_ms"]}
+                    for row in results
+                }
+            }) + "\n")
+
+    print_results(results, args.json)
+    regressions = [row["workload"] for row in results if row["verdict"] == "REGRESSION"]
+    if regressions:
+        print(f"Regressions beyond {args.threshold:g}%: {', '.join(regressions)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""A/B the default and low-latency loop orderings on input latency.
+
+Injects right clicks from a background thread at random times while the
+game runs headless in the play state, then prints latency percentiles for
+each loop ordering.
+
+    python benchmarks/input_latency.py [--seconds 5] [--json]
+"""
+import argparse
+import random
+import threading
+import time
+
+import pygame
+
+from common import make_game, make_invulnerable, print_results, quiet
+
+
+def inject_clicks(stop, seed):
+    """Post right clicks at random intervals, like a player spamming movement."""
+    rng = random.Random(seed)
+    while not stop.is_set():
+        pos = (rng.randrange(100, 1180), rng.randrange(100, 620))
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=3))
+        time.sleep(rng.uniform(0.02, 0.12))
+
+
+def measure(game, low_latency, seconds, seed):
+    from src.constants import STATE_PLAY
+    from src.latency import LatencyTracker
+
+    with quiet():
+        game.change_state(STATE_PLAY)
+        make_invulnerable(game.player)
+        game.low_latency = low_latency
+        game.latency = LatencyTracker(enabled=True)
+
+        stop = threading.Event()
+        thread = threading.Thread(target=inject_clicks, args=(stop, seed), daemon=True)
+        thread.start()
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            game.run_frame()
+        stop.set()
+        thread.join()
+
+    stats = game.latency.report().get("move", {})
+    return {
+        "loop": "low_latency" if low_latency else "default",
+        "inputs": stats.get("count", 0),
+        "p50_ms": stats.get("p50", 0.0),
+        "p95_ms": stats.get("p95", 0.0),
+        "p99_ms": stats.get("p99", 0.0),
+        "p95_with_queue_ms": stats.get("p95_with_queue", 0.0)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0, help="measurement time per loop ordering")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the injected input timing")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    game = make_game()
+    results = [measure(game, low_latency, args.seconds, args.seed) for low_latency in (False, True)]
+    print_results(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
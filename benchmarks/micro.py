@@ -0,0 +1,151 @@
+"""Micro-benchmarks for hot functions, timed in isolation with timeit.
+
+Each benchmark sets up a small seeded world, runs its function once to
+warm up, picks a loop count that takes about --min-time seconds, and then
+times --repeat loops. Results are per call: best, median, mean and
+standard deviation across the repeats. timeit turns the garbage collector
+off while timing, so collections don't add noise.
+
+    python benchmarks/micro.py [--only Camera.apply] [--repeat 7] [--min-time 0.2] [--json]
+"""
+import argparse
+import statistics
+import timeit
+
+from common import make_game, populate, print_results, quiet, start_play
+
+
+def still_projectile():
+    """A projectile that never moves, so every update takes the same path."""
+    from src.projectile import Projectile
+    return Projectile(500, 500, 500, 500, range=float("inf"))
+
+
+def still_enemy(game, distance):
+    """A stationary enemy `distance` pixels to the right of the player."""
+    manager = game.enemy_manager
+    enemy = manager.spawn_enemy("basic", game.player.x + distance, game.player.y)
+    manager.enemies.remove(enemy)
+    enemy.speed = 0
+    enemy.set_velocity_from_angle()
+    return enemy
+
+
+def bench_projectile_update(game):
+    return still_projectile().update
+
+
+def bench_enemy_update_wander(game):
+    enemy = still_enemy(game, 2000)  # Outside the detection radius
+    return enemy.update
+
+
+def bench_enemy_update_chase(game):
+    enemy = still_enemy(game, 0)
+    enemy.x = game.player.x + (enemy.detection_radius + enemy.attack_range) / 2  # Chasing, not shooting
+    return enemy.update
+
+
+def bench_create_enemy_surface(game):
+    return still_enemy(game, 300).create_enemy_surface
+
+
+def bench_select_enemy_type(game):
+    populate(game, 0, wave=10)
+    return game.enemy_manager.select_enemy_type
+
+
+def bench_spawn_enemy(game):
+    manager = game.enemy_manager
+    enemies = manager.enemies
+
+    def spawn():
+        manager.spawn_enemy("basic", 400, 400)
+        enemies.pop()
+    return spawn
+
+
+def bench_projectile_collisions(game):
+    # 50 enemies and 20 player projectiles that miss them all, so every pair is checked each call
+    populate(game, 50, wave=5, radius=300)
+    for enemy in game.enemy_manager.enemies:
+        enemy.speed = 0
+    projectiles = []
+    for i in range(20):
+        projectile = still_projectile()
+        projectile.x = projectile.rect.x = 50 + i * 60
+        projectile.y = projectile.rect.y = 5
+        projectiles.append(projectile)
+    game.player.projectiles = projectiles
+    return game.check_projectile_collisions
+
+
+def bench_camera_apply(game):
+    camera = game.camera
+    camera.update(game.player.x, game.player.y)
+    projectile = still_projectile()
+    return lambda: camera.apply(projectile)
+
+
+BENCHMARKS = {
+    "Projectile.update": bench_projectile_update,
+    "Enemy.update (wander)": bench_enemy_update_wander,
+    "Enemy.update (chase)": bench_enemy_update_chase,
+    "Enemy.create_enemy_surface": bench_create_enemy_surface,
+    "EnemyManager.select_enemy_type": bench_select_enemy_type,
+    "EnemyManager.spawn_enemy": bench_spawn_enemy,
+    "Game.check_projectile_collisions": bench_projectile_collisions,
+    "Camera.apply": bench_camera_apply,
+}
+
+
+def time_function(function, repeat, min_time):
+    """Return per-call times (ns) for `repeat` timed loops of `function`."""
+    timer = timeit.Timer(function)
+    timer.timeit(1)  # Warm up caches and lazily created state
+
+    # Smallest loop count (1, 2, 5, 10, 20, ...) that runs for at least min_time
+    number = 1
+    while True:
+        for factor in (1, 2, 5):
+            loops = number * factor
+            if timer.timeit(loops) >= min_time:
+                break
+        else:
+            number *= 10
+            continue
+        break
+    return loops, [total * 1e9 / loops for total in timer.repeat(repeat, loops)]
+
+
+def measure(game, name, seed, repeat, min_time):
+    with quiet():
+        start_play(game, seed=seed)
+        function = BENCHMARKS[name](game)
+        loops, times = time_function(function, repeat, min_time)
+    return {
+        "function": name,
+        "loops": loops,
+        "best_ns": min(times),
+        "median_ns": statistics.median(times),
+        "mean_ns": statistics.mean(times),
+        "stdev_ns": statistics.stdev(times) if len(times) > 1 else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="run only these benchmarks")
+    parser.add_argument("--repeat", type=int, default=7, help="timed loops per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per timed loop")
+    parser.add_argument("--seed", type=int, default=1, help="random seed used to build each world")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    game = make_game()
+    results = [measure(game, name, args.seed, args.repeat, args.min_time) for name in args.only or BENCHMARKS]
+    print_results(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
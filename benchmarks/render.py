@@ -0,0 +1,116 @@
+"""Measure rendering throughput against an offscreen surface.
+
+Draws into a display-format surface of screen size (no flips), with SDL's
+dummy video driver, so it runs on build agents without a display. Gameplay
+targets are measured on seeded worlds of each --enemies size: the world is
+simulated for --settle ticks first so enemies have spread out and fired,
+then frozen while the same frame is drawn repeatedly. Per-layer costs come
+from the game's frame profiler scopes.
+
+    python benchmarks/render.py [--enemies 10 100 1000] [--frames 300] [--render-resolution 640x360] [--json]
+"""
+import argparse
+import time
+
+from common import make_game, populate, print_results, quiet, start_play
+
+
+def time_frames(draw, frames, profiler):
+    """Call draw() `frames` times and return each frame's duration in ms."""
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        draw()
+        elapsed = (time.perf_counter() - start) * 1000
+        profiler.end_frame(elapsed)
+        times.append(elapsed)
+    return times
+
+
+def measure(game, target, draw, frames, enemies=None):
+    from src.latency import percentile
+    from src.profiler import FrameProfiler
+
+    profiler = game.profiler = FrameProfiler(window=frames)
+    profiler.enabled = True
+    profiler.show_overlay = False
+    with quiet():
+        draw()  # Warm up caches (text, grid, scaled surfaces)
+        times = time_frames(draw, frames, profiler)
+
+    mean = sum(times) / len(times)
+    return {
+        "target": target,
+        "enemies": enemies if enemies is not None else "",
+        "fps": 1000 / mean,
+        "mean_ms": mean,
+        "p99_ms": percentile(times, 99),
+        "layers": {name: average for name, average, peak in profiler.report()}
+    }
+
+
+def gameplay_world(game, enemies, settle, seed):
+    """Seeded game with `enemies` enemies around the player, simulated for `settle` ticks."""
+    with quiet():
+        start_play(game, "ashe", seed)
+        populate(game, enemies, wave=10, radius=900)
+        player = game.player
+        for tick in range(settle):
+            if tick % 10 == 0:
+                # Keep some player projectiles in flight too
+                player.volley_cooldown = 0
+                player.volley(player.x + 400, player.y)
+            game.update()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--enemies", type=int, nargs="+", default=[10, 100, 1000], help="world sizes to draw")
+    parser.add_argument("--frames", type=int, default=300, help="frames drawn per measurement")
+    parser.add_argument("--settle", type=int, default=120, help="ticks simulated before drawing")
+    parser.add_argument("--seed", type=int, default=1, help="random seed used to build each world")
+    parser.add_argument("--quality", default="high", help="quality preset to draw at")
+    parser.add_argument("--render-resolution", default="native", help="internal resolution of the world view")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    game = make_game()
+    from src.constants import STATE_MENU, STATE_GAME_OVER
+    from src.surface_factory import surface_factory
+    game.quality.set_preset(args.quality)
+    game.set_render_resolution(args.render_resolution)
+    surface = surface_factory.create(game.screen.get_size())
+
+    results = []
+    for count in args.enemies:
+        gameplay_world(game, count, args.settle, args.seed)
+        results.append(measure(game, "PlayState.render", lambda: game.state.render(surface), args.frames, count))
+
+        # Enemies alone, drawn onto the world view
+        world = game.render_target or surface
+        results.append(measure(game, "EnemyManager.draw", lambda: game.enemy_manager.draw(world), args.frames, count))
+
+    for name, target in ((STATE_MENU, "MenuState.render"), (STATE_GAME_OVER, "GameOverState.render")):
+        with quiet():
+            game.change_state(name, score=12345)
+            for _ in range(300):
+                game.state.update()  # Let entry animations finish
+        results.append(measure(game, target, lambda: game.state.render(surface), args.frames))
+
+    if args.json:
+        print_results(results, as_json=True)
+        return
+
+    print_results([{key: value for key, value in row.items() if key != "layers"} for row in results])
+    layers = [
+        {"target": row["target"], "enemies": row["enemies"], "layer": name, "mean_ms": average}
+        for row in results if row["target"] == "PlayState.render"
+        for name, average in row["layers"].items()
+    ]
+    if layers:
+        print()
+        print_results(layers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Scripted gameplay scenarios timed through headless PlayState ticks.
+
+Each scenario builds a seeded world, then runs the game's update step (no
+drawing) for a number of ticks while a script plays the player's part. It
+reports ticks per second, median and 99th percentile tick time, and the
+peak Python memory traced while building and running the scenario (from
+a second, shorter run under tracemalloc so tracing doesn't skew timings).
+
+    python benchmarks/scenarios.py [--only stress_10k] [--ticks 300] [--seed 1] [--output results.json]
+
+Results are printed as JSON unless --table is given.
+"""
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+
+from common import make_game, populate, print_results, quiet, start_play
+
+
+def crowd_center(game):
+    """Middle of the living enemies (or a point to the player's right if there are none)."""
+    enemies = [enemy for enemy in game.enemy_manager.enemies if enemy.alive]
+    if not enemies:
+        return game.player.x + 300, game.player.y
+    return (sum(enemy.x for enemy in enemies) / len(enemies),
+            sum(enemy.y for enemy in enemies) / len(enemies))
+
+
+def setup_wave_1(game):
+    pass  # Regular spawning from an empty map
+
+
+def setup_wave_10(game):
+    populate(game, 50, wave=10)
+
+
+def setup_wave_20(game):
+    populate(game, 30, wave=20, bosses=4)
+
+
+def bosses_fire(game, tick):
+    """Every boss fires its spread attack twice a second."""
+    if tick % 30:
+        return
+    player = game.player
+    for enemy in game.enemy_manager.enemies:
+        if enemy.enemy_type == "boss" and enemy.alive:
+            enemy.fire_spread_attack(enemy.x + enemy.width / 2, enemy.y + enemy.height / 2,
+                                     player.x + player.width / 2, player.y + player.height / 2)
+
+
+def setup_crowd(game):
+    populate(game, 120, wave=5, radius=600)
+
+
+def ashe_volley(game, tick):
+    """Volley into the crowd every tick (cooldown skipped)."""
+    game.player.volley_cooldown = 0
+    game.player.volley(*crowd_center(game))
+
+
+def ezreal_barrage(game, tick):
+    """Trueshot Barrage through the crowd every 10 ticks (cooldown skipped)."""
+    if tick % 10 == 0:
+        game.player.r_cooldown = 0
+        game.player.trueshot_barrage(*crowd_center(game))
+
+
+def setup_stress(game):
+    populate(game, 10000, wave=10)
+
+
+# name -> (character, setup, per-tick script, default ticks)
+SCENARIOS = {
+    "wave1_baseline": ("base", setup_wave_1, None, 1800),
+    "wave10_mixed": ("base", setup_wave_10, None, 600),
+    "wave20_bosses": ("base", setup_wave_20, bosses_fire, 600),
+    "ashe_volley": ("ashe", setup_crowd, ashe_volley, 600),
+    "ezreal_barrage": ("ezreal", setup_crowd, ezreal_barrage, 600),
+    "stress_10k": ("base", setup_stress, None, 60),
+}
+
+
+def build(game, name, seed):
+    character, setup, script, default_ticks = SCENARIOS[name]
+    start_play(game, character, seed)
+    setup(game)
+    return script
+
+
+def run_ticks(game, script, ticks):
+    """Run the update step `ticks` times and return each tick's duration in ms."""
+    times = []
+    for tick in range(ticks):
+        start = time.perf_counter_ns()
+        if script:
+            script(game, tick)
+        game.update()
+        times.append((time.perf_counter_ns() - start) / 1e6)
+    return times
+
+
+def measure(game, name, ticks, seed, memory_ticks):
+    from src.latency import percentile
+    ticks = ticks or SCENARIOS[name][3]
+
+    with quiet():
+        script = build(game, name, seed)
+        times = run_ticks(game, script, ticks)
+        enemies = len(game.enemy_manager.enemies)
+        projectiles = len(game.player.projectiles) + game.enemy_manager.count_projectiles()
+
+        # Same scenario again under tracemalloc, only for its memory peak
+        tracemalloc.start()
+        script = build(game, name, seed)
+        run_ticks(game, script, min(ticks, memory_ticks))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    total = sum(times) / 1000
+    return {
+        "scenario": name,
+        "ticks": ticks,
+        "ticks_per_sec": ticks / total,
+        "p50_ms": percentile(times, 50),
+        "p99_ms": percentile(times, 99),
+        "max_ms": max(times),
+        "peak_memory_kib": peak / 1024,
+        "enemies": enemies,
+        "projectiles": projectiles
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=list(SCENARIOS), help="run only these scenarios")
+    parser.add_argument("--ticks", type=int, help="ticks per scenario (default: per scenario)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed used to build every scenario")
+    parser.add_argument("--memory-ticks", type=int, default=120, help="ticks run under tracemalloc for the memory peak")
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    parser.add_argument("--table", action="store_true", help="print a table instead of JSON")
+    args = parser.parse_args()
+
+    game = make_game()
+    import pygame
+    results = [measure(game, name, args.ticks, args.seed, args.memory_ticks) for name in args.only or SCENARIOS]
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "seed": args.seed,
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "results": results
+            }, f, indent=2)
+    print_results(results, as_json=not args.table)
+
+
+if __name__ == "__main__":
+    main()
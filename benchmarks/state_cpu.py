@@ -0,0 +1,76 @@
+"""Measure CPU usage of the main loop in each game state.
+
+Runs the real frame loop (Game.run_frame) headless for a few seconds per
+state and reports the share of one core it used. Use --no-idle to force
+every state to run at the full frame rate for comparison.
+
+    python benchmarks/state_cpu.py [--seconds 3] [--no-idle] [--json]
+"""
+import argparse
+import time
+
+from common import make_game, make_invulnerable, print_results, quiet
+
+
+def enter_state(game, name):
+    """Put the game into the named state."""
+    from src.constants import STATE_PLAY, STATE_PAUSE
+    if name == STATE_PAUSE:
+        # The pause menu needs a game underneath it
+        game.change_state(STATE_PLAY)
+        game.push_state(STATE_PAUSE, previous_state=game.state)
+    else:
+        game.change_state(name)
+
+
+def measure_state(game, name, seconds, warmup):
+    """Run the loop in one state and return its CPU usage."""
+    with quiet():
+        enter_state(game, name)
+        make_invulnerable(game.player)
+
+        # Let entry animations (e.g. the game over fade) settle first
+        end = time.perf_counter() + warmup
+        while time.perf_counter() < end:
+            game.run_frame()
+
+        frames = 0
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        while time.perf_counter() - wall_start < seconds:
+            game.run_frame()
+            frames += 1
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+
+    return {
+        "state": name,
+        "idle": game.is_idle(),
+        "fps": frames / wall,
+        "cpu_percent": 100 * cpu / wall,
+        "cpu_ms_per_frame": 1000 * cpu / max(1, frames)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=3.0, help="measurement time per state")
+    parser.add_argument("--warmup", type=float, default=1.5, help="settle time before measuring")
+    parser.add_argument("--no-idle", action="store_true", help="disable idle throttling")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    game = make_game()
+    if args.no_idle:
+        game.is_idle = lambda: False
+
+    from src.constants import (
+        STATE_MENU, STATE_CHAMPION_SELECT, STATE_OPTIONS, STATE_PAUSE, STATE_GAME_OVER, STATE_PLAY
+    )
+    states = [STATE_MENU, STATE_CHAMPION_SELECT, STATE_OPTIONS, STATE_PAUSE, STATE_GAME_OVER, STATE_PLAY]
+    results = [measure_state(game, name, args.seconds, args.warmup) for name in states]
+    print_results(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,132 @@
-from src.game import Game
-from src.constants import GAME_TITLE, VERSION
+import argparse
+import os
+import sys
+from src.constants import GAME_TITLE, VERSION, RENDER_RESOLUTIONS
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=f"{GAME_TITLE} v{VERSION}")
+    parser.add_argument("--measure-latency", action="store_true", default=None,
+                        help="measure input-to-display latency and print percentiles on exit")
+    parser.add_argument("--low-latency", action="store_true", default=None,
+                        help="sample input right before simulating and pace frames with a busy loop")
+    parser.add_argument("--render-resolution", choices=list(RENDER_RESOLUTIONS),
+                        help="internal resolution the world is drawn at before scaling to the screen")
+
+    # Unattended runs
+    parser.add_argument("--headless", action="store_true", default=None,
+                        help="no window or sound: start straight in gameplay and run uncapped")
+    parser.add_argument("--frames", type=int, dest="max_frames",
+                        help="quit after this many frames")
+    parser.add_argument("--seed", type=int,
+                        help="seed for everything random in the simulation (default: a new seed each game)")
+    parser.add_argument("--invulnerable", action="store_true", default=None,
+                        help="the player can't die (keeps long unattended runs in gameplay)")
+
+    # Diagnostics
+    parser.add_argument("--telemetry", metavar="PATH",
+                        help="append per-frame timing and entity counts to a JSON Lines file")
+    parser.add_argument("--telemetry-interval", type=int, metavar="N",
+                        help="write a telemetry record every N frames (default: 1)")
+    parser.add_argument("--gc-policy", choices=["wave", "off"],
+                        help="hold garbage collection back during waves and collect between them (default: wave)")
+    parser.add_argument("--trace-state", metavar="PATH",
+                        help="write a hash of the world after every gameplay tick (see --compare-traces)")
+    parser.add_argument("--trace-full", action="store_true", default=None,
+                        help="include every traced value, so comparisons can name the field that changed")
+    parser.add_argument("--compare-traces", nargs=2, metavar=("A", "B"),
+                        help="report the first tick and field where two state traces differ, then exit")
+    parser.add_argument("--record-inputs", metavar="PATH",
+                        help="record every gameplay input with the seed and character, for --replay")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="re-run a recorded session headless at uncapped speed, then exit")
+    parser.add_argument("--replay-session", type=int, default=1, metavar="N",
+                        help="which session of the recording to replay (default: 1)")
+    parser.add_argument("--replay-until-wave", type=int, metavar="N",
+                        help="stop the replay when wave N ends")
+    parser.add_argument("--replay-info", metavar="PATH",
+                        help="list a recording's sessions, input counts and wave start ticks, then exit")
+    parser.add_argument("--track-memory", action="store_true", default=None,
+                        help="report live objects and allocations at each wave and flag steady growth")
+
+    # Profiling a window of gameplay
+    parser.add_argument("--profile", choices=["cprofile", "sample", "both"],
+                        help="profile gameplay with cProfile, a stack sampler for flamegraphs, or both")
+    window = parser.add_mutually_exclusive_group()
+    window.add_argument("--profile-waves", type=parse_range, metavar="FIRST-LAST",
+                        help="only profile these waves, e.g. 5-7 (default: all gameplay)")
+    window.add_argument("--profile-frames", type=parse_range, metavar="FIRST-LAST",
+                        help="only profile these gameplay frames, e.g. 600-1800")
+    parser.add_argument("--profile-output", default="profile", metavar="PREFIX",
+                        help="output files are PREFIX.prof, PREFIX.txt and PREFIX.collapsed")
+    parser.add_argument("--sample-interval", type=float, dest="sample_interval_ms", metavar="MS",
+                        help="time between stack samples (default: 1 ms)")
+    return parser.parse_args()
+
+def parse_range(text):
+    """Parse "FIRST-LAST" (or a single number) into an inclusive (first, last) pair."""
+    try:
+        first, _, last = text.partition("-")
+        first = int(first)
+        last = int(last) if last else first
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected FIRST-LAST, got '{text}'")
+    if last < first:
+        raise argparse.ArgumentTypeError(f"range '{text}' ends before it starts")
+    return first, last
 
 def main():
+    args = parse_args()
+    if args.compare_traces:
+        from src.state_trace import compare_traces
+        sys.exit(0 if compare_traces(*args.compare_traces) else 1)
+    if args.replay_info:
+        from src.replay import ReplayFile
+        try:
+            ReplayFile(args.replay_info).print_summary()
+        except (OSError, ValueError) as e:
+            sys.exit(f"Can't read {args.replay_info}: {e}")
+        return
+
+    options = {
+        "measure_latency": args.measure_latency,
+        "low_latency": args.low_latency,
+        "render_resolution": args.render_resolution,
+        "headless": args.headless,
+        "max_frames": args.max_frames,
+        "invulnerable": args.invulnerable,
+        "seed": args.seed,
+        "profile": args.profile,
+        "profile_waves": args.profile_waves,
+        "profile_frames": args.profile_frames,
+        "profile_output": args.profile_output,
+        "sample_interval_ms": args.sample_interval_ms,
+        "telemetry": args.telemetry,
+        "telemetry_interval": args.telemetry_interval,
+        "track_memory": args.track_memory,
+        "gc_policy": args.gc_policy,
+        "trace_state": args.trace_state,
+        "trace_full": args.trace_full,
+        "record_inputs": args.record_inputs
+    }
+    if args.replay:
+        from src.replay import load_replay, replay_options
+        try:
+            header, inputs, end = load_replay(args.replay, args.replay_session, args.replay_until_wave)
+        except (OSError, ValueError) as e:
+            sys.exit(f"Can't replay {args.replay}: {e}")
+        # The recorded seed, character and invulnerability, headless
+        options.update(replay_options(header))
+        options["replay_inputs"] = (inputs, end)
+
+    if options["headless"]:
+        # Must be set before pygame initializes its display and mixer
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    from src.game import Game
+
     print(f"Starting {GAME_TITLE} v{VERSION}")
-    game = Game()
+    game = Game(options=options)
     game.run()
 
 if __name__ == "__main__":
     main()
-    
\ No newline at end of file
@@ -1,10 +1,14 @@
 # asset_manager.py
 import os
+import hashlib
 import pygame
 from src.constants import (
-    ASSET_DIR, IMAGE_DIR, SOUND_DIR, FONT_DIR,
-    DEFAULT_MUSIC_VOLUME, DEFAULT_SFX_VOLUME
+    ASSET_DIR, IMAGE_DIR, SOUND_DIR, FONT_DIR, SOUND_CACHE_DIR,
+    DEFAULT_MUSIC_VOLUME, DEFAULT_SFX_VOLUME, DEFAULT_FONT, UI_FONTS
 )
+from src.voice_manager import VoiceManager
+from src.music_controller import MusicController
+from src.surface_factory import surface_factory
 
 class AssetManager:
     """A simple asset manager to load and store game resources."""
@@ -16,6 +20,7 @@ class AssetManager:
         self.image_dir = os.path.join(self.asset_dir, IMAGE_DIR)
         self.sound_dir = os.path.join(self.asset_dir, SOUND_DIR)
         self.font_dir = os.path.join(self.asset_dir, FONT_DIR)
+        self.sound_cache_dir = os.path.join(self.base_dir, SOUND_CACHE_DIR)
         
         # Create directories if they don't exist
         os.makedirs(self.image_dir, exist_ok=True)
@@ -25,9 +30,17 @@ class AssetManager:
         
         # Dictionaries to store loaded assets
         self.images = {}
+        self.image_formats = {}  # Image name -> (alpha, rle), for converting again after a display change
         self.sounds = {}
         self.fonts = {}
         self.music_tracks = {}
+        self.sound_memory = {}  # Bytes of PCM held by each loaded sound
+
+        # Font files by name (None is pygame's built-in font)
+        self.font_files = {
+            "main": DEFAULT_FONT,
+            "default": None
+        }
         
         # Volume settings
         self.music_volume = DEFAULT_MUSIC_VOLUME
@@ -37,6 +50,13 @@ class AssetManager:
         if not pygame.mixer.get_init():
             pygame.mixer.init()
 
+        # Channel allocation for sound effects
+        self.voices = VoiceManager()
+        self.missing_sounds = set()  # Sounds we've already warned about
+
+        # Background music streaming
+        self.music = MusicController(self.sound_dir, self.music_tracks)
+
         print(f"Asset Manager initialized. Base directory: {self.asset_dir}")
         print(f"Sound directory: {self.sound_dir}")
         print(f"Sound directory exists: {os.path.exists(self.sound_dir)}")
@@ -111,11 +131,6 @@ class AssetManager:
 
     def preload_common_assets(self):
         """Preload commonly used assets to avoid loading delays during gameplay."""
-        from src.constants import (
-            DEFAULT_FONT, NORMAL_FONT_SIZE, SMALL_FONT_SIZE, 
-            TITLE_FONT_SIZE, HEADING_FONT_SIZE
-        )
-        
         print("Preloading common assets...")
         
         # Load common UI images
@@ -145,23 +160,16 @@ class AssetManager:
         
         # Print loaded sounds for debugging
         print(f"Loaded sounds: {list(self.sounds.keys())}")
+        print(f"Audio memory: {self.get_sound_memory() / 1024:.0f} KB")
         
-        # Load common fonts at different sizes
-        try:
-            self.load_font("main", DEFAULT_FONT, SMALL_FONT_SIZE)
-            self.load_font("main", DEFAULT_FONT, NORMAL_FONT_SIZE)
-            self.load_font("main", DEFAULT_FONT, HEADING_FONT_SIZE)
-            self.load_font("main", DEFAULT_FONT, TITLE_FONT_SIZE)
-        except Exception as e:
-            print(f"Error loading fonts: {e}")
+        # Load every font size the UI uses
+        self.prewarm_fonts()
         
-        # Load common music
-        try:
-            self.load_music("menu_music.mp3")
-            self.music_tracks["menu_music"] = "menu_music.mp3"
-            self.music_tracks["game_music"] = "game_music.mp3"
-        except Exception as e:
-            print(f"Error preloading music: {e}")
+        # Register music tracks and start reading them in the background
+        self.music_tracks["menu_music"] = "menu_music.mp3"
+        self.music_tracks["game_music"] = "game_music.mp3"
+        self.prefetch_music("menu_music")
+        self.prefetch_music("game_music")
         
         print("Common assets preloaded successfully")
 
@@ -174,21 +182,26 @@ class AssetManager:
             filepath = os.path.join(self.image_dir, filename)
             image = pygame.image.load(filepath)
             
-            if convert_alpha:
-                image = image.convert_alpha()
-            else:
-                image = image.convert()
+            # Loaded images are only ever blitted, so transparent ones can be RLE-accelerated
+            image = surface_factory.convert(image, alpha=convert_alpha, rle=convert_alpha)
                 
             self.images[name] = image
+            self.image_formats[name] = (convert_alpha, convert_alpha)
             return image
             
         except Exception as e:
             print(f"Error loading image '{filename}': {e}")
             # Create a placeholder for missing images
-            surf = pygame.Surface((64, 64))
-            surf.fill((255, 0, 255))  # Magenta for missing texture
+            surf = surface_factory.create((64, 64), fill=(255, 0, 255))  # Magenta for missing texture
             self.images[name] = surf
+            self.image_formats[name] = (False, False)
             return surf
+
+    def reconvert_images(self):
+        """Convert every loaded image to the current display format (after the display is recreated)."""
+        for name, image in self.images.items():
+            alpha, rle = self.image_formats.get(name, (None, False))
+            self.images[name] = surface_factory.convert(image, alpha, rle)
     
     def load_sound(self, name, filename):
         """Load a sound effect and store it in the sounds dictionary."""
@@ -204,9 +217,10 @@ class AssetManager:
                 self.sounds[name] = None
                 return None
                 
-            sound = pygame.mixer.Sound(filepath)
+            sound, size = self.load_converted_sound(filepath)
             sound.set_volume(self.sfx_volume)  # Apply current volume setting
             self.sounds[name] = sound
+            self.sound_memory[name] = size
             print(f"Successfully loaded sound: {name}")
             return sound
             
@@ -215,18 +229,73 @@ class AssetManager:
             self.sounds[name] = None
             return None
     
+    def load_converted_sound(self, filepath):
+        """Load a sound as PCM in the mixer's format, reusing the on-disk cache when possible.
+
+        Returns the sound and the size of its sample buffer in bytes.
+        """
+        with open(filepath, 'rb') as f:
+            source = f.read()
+
+        # The cache key covers the source contents and the mixer format
+        frequency, sample_format, channels = pygame.mixer.get_init()
+        source_hash = hashlib.sha1(source).hexdigest()[:16]
+        # Name the cache after the path within the sound folder, so e.g. projectiles/hit.wav and
+        # enemies/hit.wav don't share a prefix (and delete each other's cache as "stale")
+        relative = os.path.relpath(filepath, self.sound_dir)
+        prefix = relative.replace(os.sep, "_").replace("/", "_") + "."
+        cache_name = f"{prefix}{source_hash}.{frequency}_{sample_format}_{channels}.pcm"
+        cache_path = os.path.join(self.sound_cache_dir, cache_name)
+
+        if os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                pcm = f.read()
+            return pygame.mixer.Sound(buffer=pcm), len(pcm)
+
+        # Decode and convert once, then keep the converted samples for next time
+        sound = pygame.mixer.Sound(filepath)
+        pcm = sound.get_raw()
+        try:
+            os.makedirs(self.sound_cache_dir, exist_ok=True)
+            # Remove stale conversions of the same file
+            for old_name in os.listdir(self.sound_cache_dir):
+                if old_name.startswith(prefix) and old_name != cache_name:
+                    os.remove(os.path.join(self.sound_cache_dir, old_name))
+            with open(cache_path, 'wb') as f:
+                f.write(pcm)
+        except OSError as e:
+            print(f"Could not cache converted sound {filepath}: {e}")
+        return sound, len(pcm)
+
+    def get_sound_memory(self, name=None):
+        """Return the PCM bytes used by one sound, or by all loaded sounds if no name is given."""
+        if name is not None:
+            return self.sound_memory.get(name, 0)
+        return sum(self.sound_memory.values())
+
+    def get_audio_memory_report(self):
+        """Return per-sound memory usage in bytes, largest first."""
+        return sorted(self.sound_memory.items(), key=lambda item: item[1], reverse=True)
+
     def play_sound(self, name):
-        """Play a sound by name."""
+        """Play a sound by name through the voice manager."""
         if name in self.sounds and self.sounds[name] is not None:
             try:
-                self.sounds[name].play()
+                self.voices.play(name, self.sounds[name])
             except Exception as e:
                 print(f"Error playing sound '{name}': {e}")
-        else:
+        elif name not in self.missing_sounds:
+            # Only warn once per sound so a busy frame doesn't flood the console
+            self.missing_sounds.add(name)
             print(f"Sound '{name}' not found or not loaded properly")
+
+    def update(self):
+        """Per-frame audio housekeeping."""
+        self.voices.begin_frame()
+        self.music.update()
     
     def load_music(self, filename):
-        """Load and play background music."""
+        """Load music synchronously (blocks on file I/O, prefer prefetch_music)."""
         try:
             filepath = os.path.join(self.sound_dir, filename)
             if not os.path.exists(filepath):
@@ -239,36 +308,30 @@ class AssetManager:
         except Exception as e:
             print(f"Error loading music '{filename}': {e}")
             return False
+
+    def prefetch_music(self, track_name):
+        """Read a music track into memory in the background so switching to it won't stall."""
+        self.music.prefetch(track_name)
     
     def play_music(self, track_name=None, loops=-1):
-        """Play the specified music track or the currently loaded one."""
-        try:
-            if track_name:
-                # Load the track if a name is provided
-                if track_name in self.music_tracks:
-                    filename = self.music_tracks[track_name]
-                    self.load_music(filename)
-                else:
-                    self.load_music(track_name)
-            
-            # Check if music is loaded before playing
-            pygame.mixer.music.play(loops)
-            print(f"Playing music track: {track_name if track_name else 'current track'}")
-        except Exception as e:
-            print(f"Error playing music: {e}")
-            # Try to recover by loading a default track
-            try:
-                if "menu_music" in self.music_tracks:
-                    print("Attempting to play default menu music...")
-                    self.load_music(self.music_tracks["menu_music"])
-                    pygame.mixer.music.play(loops)
-            except:
-                print("Could not recover music playback")
+        """Switch to the specified music track, or restart the current one.
+
+        The switch happens on a later frame once the track is in memory,
+        fading out the old track first.
+        """
+        self.music.play(track_name, loops)
     
     def stop_music(self):
         """Stop the currently playing music."""
-        pygame.mixer.music.stop()
+        self.music.stop()
     
+    def prewarm_fonts(self):
+        """Load all UI fonts up front so states never open font files themselves."""
+        for name, sizes in UI_FONTS.items():
+            for size in sizes:
+                self.load_font(name, self.font_files.get(name), size)
+        print(f"Loaded fonts: {list(self.fonts.keys())}")
+
     def load_font(self, name, filename, size):
         """Load a font and store it in the fonts dictionary."""
         key = f"{name}_{size}"
@@ -276,7 +339,16 @@ class AssetManager:
             return self.fonts[key]
         
         try:
+            if filename is None:
+                # pygame's built-in font
+                font = pygame.font.Font(None, size)
+                self.fonts[key] = font
+                return font
+
             filepath = os.path.join(self.font_dir, filename)
+            if not os.path.exists(filepath):
+                # Paths like DEFAULT_FONT are relative to the project root
+                filepath = os.path.join(self.base_dir, filename)
             font = pygame.font.Font(filepath, size)
             self.fonts[key] = font
             return font
@@ -295,4 +367,4 @@ class AssetManager:
             return self.fonts[key]
         
         # Try to load the font file
-        return self.load_font(name, f"{name}.ttf", size)
+        return self.load_font(name, self.font_files.get(name, f"{name}.ttf"), size)
@@ -1,14 +1,32 @@
 # Create a new file: src/camera.py
 import pygame
+from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 class Camera:
     def __init__(self, width, height):
         self.width = width
         self.height = height
         self.x = 0
         self.y = 0
+
+        # Size of the world view being rendered, and how much it's stretched to fill the display
+        self.view_width = SCREEN_WIDTH
+        self.view_height = SCREEN_HEIGHT
+        self.scale_x = 1.0
+        self.scale_y = 1.0
+
+    def set_viewport(self, view_size, display_size):
+        """Set the render resolution of the world view and the display size it's scaled to."""
+        self.view_width, self.view_height = view_size
+        self.scale_x = display_size[0] / self.view_width
+        self.scale_y = display_size[1] / self.view_height
         
-    def update(self, target_x, target_y, screen_width, screen_height):
-        """Update camera position to follow a target"""
+    def update(self, target_x, target_y, screen_width=None, screen_height=None):
+        """Update camera position to follow a target (the view defaults to the viewport size)"""
+        if screen_width is None:
+            screen_width = self.view_width
+        if screen_height is None:
+            screen_height = self.view_height
+
         # Center the camera on the target
         self.x = target_x - screen_width // 2
         self.y = target_y - screen_height // 2
@@ -24,3 +42,7 @@ class Camera:
     def apply_rect(self, rect):
         """Adjust a rect's position based on camera"""
         return pygame.Rect(rect.x - self.x, rect.y - self.y, rect.width, rect.height)
+
+    def screen_to_world(self, pos):
+        """Convert a display position (e.g. the mouse) to world coordinates"""
+        return (pos[0] / self.scale_x + self.x, pos[1] / self.scale_y + self.y)
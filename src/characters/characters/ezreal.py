@@ -3,6 +3,7 @@ import pygame
 import math
 from .player import BasePlayer
 from src.projectile import Projectile
+from src.surface_factory import surface_factory
 
 class Ezreal(BasePlayer):
     def __init__(self, x, y):
@@ -17,8 +18,7 @@ class Ezreal(BasePlayer):
         # If image loading failed, use a blue color as fallback
         if not hasattr(self, 'image') or self.image is None:
             self.color = (0, 100, 255)  # Blue color for Ezreal
-            self.image = pygame.Surface((self.width, self.height))
-            self.image.fill(self.color)
+            self.image = surface_factory.create((self.width, self.height), fill=self.color)
         else:
             self.color = (0, 100, 255)  # Keep color reference for other uses
         
@@ -2,6 +2,7 @@ import pygame
 import math
 from src.constants import RED, GREEN, MAP_WIDTH, MAP_HEIGHT, FLASH_COOLDOWN
 from src.projectile import Projectile
+from src.surface_factory import surface_factory
 
 class BasePlayer:
     def __init__(self, x, y, image_path=None):
@@ -24,12 +25,11 @@ class BasePlayer:
             except pygame.error as e:
                 print(f"Error loading image: {e}")
                 # Fallback to colored surface if image loading fails
-                self.image = pygame.Surface((self.width, self.height))
-                self.image.fill(self.color)
+                self.image = surface_factory.create((self.width, self.height), fill=self.color)
         else:
             # No image path provided, use colored surface
-            self.image = pygame.Surface((self.width, self.height))
-            self.image.fill(self.color)
+            self.image = surface_factory.create((self.width, self.height), fill=self.color)
+        surface_factory.track(self, "image")
 
         # Movement system
         self.target_x = None 
@@ -39,6 +39,7 @@ class BasePlayer:
         # Health Attribute
         self.health = 100
         self.max_health = 100
+        self.invulnerable = False  # Set for unattended runs (profiling, benchmarks)
 
         # Cooldown system
         self.flash_cooldown = 0  # Start with ability ready
@@ -202,6 +203,8 @@ class BasePlayer:
     
     def take_damage(self, amount):
         """Handle player taking damage"""
+        if self.invulnerable:
+            return False
         self.health = max(0, self.health - amount)
         return self.health <= 0  # Returns True if player died
 
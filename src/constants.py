@@ -8,6 +8,7 @@ Game constants and configuration values.
 GAME_TITLE = "LoL Dodge Game"
 VERSION = "0.1.0"
 FPS = 60
+IDLE_WAKEUP_MS = 250  # Longest an idle screen sleeps before running a frame anyway
 
 # Screen dimensions
 SCREEN_WIDTH = 1280
@@ -15,6 +16,12 @@ SCREEN_HEIGHT = 720
 MAP_WIDTH = 3000
 MAP_HEIGHT = 3000
 SCREEN_SIZE = (SCREEN_WIDTH, SCREEN_HEIGHT)
+# Internal resolutions the world can be rendered at before being scaled up to the screen
+RENDER_RESOLUTIONS = {
+    "native": SCREEN_SIZE,
+    "960x540": (960, 540),
+    "640x360": (640, 360)
+}
 
 # Colors (RGB)
 BLACK = (0, 0, 0)
@@ -50,6 +57,8 @@ ASSET_DIR = "assets"
 IMAGE_DIR = f"{ASSET_DIR}/images"
 SOUND_DIR = f"{ASSET_DIR}/sounds"
 FONT_DIR = f"{ASSET_DIR}/fonts"
+CACHE_DIR = ".cache"
+SOUND_CACHE_DIR = f"{CACHE_DIR}/sounds"
 
 # Font settings
 DEFAULT_FONT = "assets/fonts/main_font.ttf"
@@ -57,10 +66,17 @@ TITLE_FONT_SIZE = 64
 HEADING_FONT_SIZE = 48
 NORMAL_FONT_SIZE = 32
 SMALL_FONT_SIZE = 24
+# Every font the UI uses, loaded once at startup: font name -> sizes
+# ("main" is DEFAULT_FONT, "default" is pygame's built-in font)
+UI_FONTS = {
+    "main": [SMALL_FONT_SIZE, NORMAL_FONT_SIZE, 36, HEADING_FONT_SIZE, 60, TITLE_FONT_SIZE],
+    "default": [24, 36]
+}
 
 # Sound settings
 DEFAULT_MUSIC_VOLUME = 0.7  # 70%
 DEFAULT_SFX_VOLUME = 0.8    # 80%
+MUSIC_FADE_MS = 500         # Cross-fade time when switching tracks
 
 # Game settings
 DIFFICULTY_EASY = "easy"
@@ -86,15 +102,68 @@ FRICTION = 0.8
 # Menu settings
 MENU_SPACING = 60
 MENU_START_Y = 250
+OPTIONS_START_Y = 180  # The options screen has more rows than the other menus
 
 # Debug
 DEBUG_MODE = False
 SHOW_FPS = True
 SHOW_HITBOXES = False
+PROFILER_WINDOW = 120  # Frames kept by the frame profiler (2 seconds at 60 FPS)
+PROFILER_REFRESH_FRAMES = 15  # How often the profiler overlay is redrawn
+TELEMETRY_QUEUE_SIZE = 4096  # Records buffered for the telemetry writer before new ones are dropped
+TELEMETRY_FLUSH_SECONDS = 1.0  # How often the telemetry file is flushed to disk
+MEMORY_LEAK_WAVES = 3  # Waves in a row a count must grow before it's flagged as a possible leak
+MEMORY_TOP_ALLOCATIONS = 8  # Rows shown in each per-wave memory diff
+GC_WAVE_THRESHOLD = 10000  # Youngest-generation GC threshold during waves (Python's default is 700)
+REPLAY_COORD_SCALE = 16  # Recorded world coordinates are rounded to 1/16 pixel
+REPLAY_COORD_MARGIN = 512  # How far outside the map a recorded coordinate can be (clicks past the edge)
+REPLAY_BLOCK_EVENTS = 1024  # Inputs per compressed block of a replay file
+REPLAY_BLOCK_TICKS = 600  # A replay block is also closed after this many ticks (10 seconds), limiting loss on a crash
 
 #Enemy Manager settings
 SPAWN_DELAY = 180
 MAX_ENEMIES = 10
 
 #Abilities and Summoner Spells
-FLASH_COOLDOWN = 60
\ No newline at end of file
+FLASH_COOLDOWN = 60
+
+#Quality governor
+FRAME_BUDGET_MS = 1000 / FPS
+QUALITY_WINDOW = 60              # Frames averaged before deciding
+QUALITY_DOWNGRADE_RATIO = 0.9    # Lower quality above 90% of the frame budget
+QUALITY_UPGRADE_RATIO = 0.6      # Raise it again below 60%
+QUALITY_HOLD_FRAMES = 120        # Minimum frames between a change and raising quality
+QUALITY_MAX_HOLD_FRAMES = 1920
+# Tiers from full quality to minimal, each turning off one more optional effect
+QUALITY_TIERS = [
+    ("high", {"trails": True, "grid": True, "enemy_type_indicators": True, "hit_flash": True, "full_health_bars": True}),
+    ("no trails", {"trails": False, "grid": True, "enemy_type_indicators": True, "hit_flash": True, "full_health_bars": True}),
+    ("no grid", {"trails": False, "grid": False, "enemy_type_indicators": True, "hit_flash": True, "full_health_bars": True}),
+    ("no indicators", {"trails": False, "grid": False, "enemy_type_indicators": False, "hit_flash": True, "full_health_bars": True}),
+    ("no flashes", {"trails": False, "grid": False, "enemy_type_indicators": False, "hit_flash": False, "full_health_bars": True}),
+    ("minimal", {"trails": False, "grid": False, "enemy_type_indicators": False, "hit_flash": False, "full_health_bars": False})
+]
+
+#Mixer voices
+# Channels reserved for each sound category
+VOICE_CATEGORIES = {
+    "ui": 4,
+    "combat": 10,
+    "stinger": 2
+}
+# Per-sound voice rules: name -> (category, max simultaneous instances, priority)
+SOUND_VOICES = {
+    "click": ("ui", 1, 2),
+    "hover": ("ui", 1, 1),
+    "select": ("ui", 1, 2),
+    "back": ("ui", 1, 2),
+    "projectile_fire": ("combat", 3, 1),
+    "projectile_hit": ("combat", 3, 2),
+    "enemy_hit": ("combat", 3, 1),
+    "enemy_death": ("combat", 4, 3),
+    "ezreal_q_sound": ("combat", 2, 2),
+    "ashe_q_sound": ("combat", 2, 2),
+    "flash": ("combat", 1, 3),
+    "game_over": ("stinger", 1, 5)
+}
+DEFAULT_SOUND_VOICE = ("combat", 2, 1)
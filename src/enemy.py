@@ -1,10 +1,10 @@
 # src/enemy.py
 import pygame
-import random
 import math
 import os
 from src.constants import MAP_WIDTH, MAP_HEIGHT, RED, GREEN
 from src.projectile import Projectile  # Import your existing Projectile class
+from src.surface_factory import surface_factory
 
 class Enemy:
     def __init__(self, game, speed, health, enemy_type="basic", x=None, y=None):
@@ -24,8 +24,8 @@ class Enemy:
         self.color = (255, 0, 0)  # Default color, will be set by EnemyManager
         
         # Position
-        self.x = x if x is not None else random.randint(0, MAP_WIDTH - self.width)
-        self.y = y if y is not None else random.randint(0, MAP_HEIGHT - self.height)
+        self.x = x if x is not None else self.game.rng.randint(0, MAP_WIDTH - self.width)
+        self.y = y if y is not None else self.game.rng.randint(0, MAP_HEIGHT - self.height)
         
         # Collision detection
         self.rect = pygame.Rect(int(self.x), int(self.y), self.width, self.height)
@@ -38,9 +38,9 @@ class Enemy:
         # Movement
         self.velocity_x = 0
         self.velocity_y = 0
-        self.angle = random.uniform(0, 2 * math.pi)
+        self.angle = self.game.rng.uniform(0, 2 * math.pi)
         self.direction_change_timer = 0
-        self.direction_change_delay = random.randint(60, 120)
+        self.direction_change_delay = self.game.rng.randint(60, 120)
         
         # Set initial velocity
         self.set_velocity_from_angle()
@@ -52,6 +52,7 @@ class Enemy:
         # Image will be set later by EnemyManager
         self.image = None
         self.mask = None
+        self.flash_image = None  # The sprite with the hit flash on top, built on the first hit
         
         # Projectile system
         self.projectiles = []
@@ -106,7 +107,7 @@ class Enemy:
         self.velocity_y = math.sin(self.angle) * self.speed
 
     def update(self):
-        """Update enemy position and state"""
+        """Update enemy position and state (projectiles are updated separately by update_projectiles)"""
         if not self.alive:
             return
             
@@ -150,10 +151,10 @@ class Enemy:
             # Random wandering
             self.direction_change_timer += 1
             if self.direction_change_timer >= self.direction_change_delay:
-                self.angle += random.uniform(-math.pi/2, math.pi/2)
+                self.angle += self.game.rng.uniform(-math.pi/2, math.pi/2)
                 self.set_velocity_from_angle()
                 self.direction_change_timer = 0
-                self.direction_change_delay = random.randint(60, 120)
+                self.direction_change_delay = self.game.rng.randint(60, 120)
         
         # Update attack cooldown
         if self.attack_cooldown > 0:
@@ -185,9 +186,6 @@ class Enemy:
         # Update hitbox position
         self.rect.x = int(self.x)
         self.rect.y = int(self.y)
-        
-        # Update projectiles
-        self.update_projectiles()
 
     def shoot_at_player(self, player_x, player_y):
         """Shoot a projectile at the player"""
@@ -202,7 +200,7 @@ class Enemy:
         if self.enemy_type != "boss":
             spread = 0.1  # Radians
             angle = math.atan2(player_y - start_y, player_x - start_x)
-            angle += random.uniform(-spread, spread)
+            angle += self.game.rng.uniform(-spread, spread)
             
             # Recalculate target position with spread
             target_distance = math.sqrt((player_x - start_x)**2 + (player_y - start_y)**2)
@@ -238,13 +236,13 @@ class Enemy:
         self.projectiles.append(projectile)
         
         # Special attack patterns for different enemy types
-        if self.enemy_type == "fast" and random.random() < 0.3:
+        if self.enemy_type == "fast" and self.game.rng.random() < 0.3:
             # Fast enemies sometimes shoot a burst of 3 projectiles
             self.attack_cooldown = 15  # Short cooldown for next shot
         
         if self.enemy_type == "boss":
             # Boss sometimes fires multiple projectiles in a spread pattern
-            if random.random() < 0.4:
+            if self.game.rng.random() < 0.4:
                 self.fire_spread_attack(start_x, start_y, player_x, player_y)
 
     def fire_spread_attack(self, start_x, start_y, player_x, player_y):
@@ -332,7 +330,7 @@ class Enemy:
                 if os.path.exists(path):
                     image = pygame.image.load(path).convert_alpha()
                     image = pygame.transform.scale(image, (self.width, self.height))
-                    return image
+                    return self._finish_sprite(image)
             
             return None
             
@@ -342,7 +340,7 @@ class Enemy:
     def create_enemy_surface(self):
         """Create and return a surface with the enemy drawn on it"""
         # Create a surface with per-pixel alpha
-        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        surface = surface_factory.create((self.width, self.height), alpha=True)
         
         # Draw the base shape
         pygame.draw.ellipse(surface, self.color, (0, 0, self.width, self.height))
@@ -418,7 +416,25 @@ class Enemy:
                            self.width*2//3, self.height*2//3), 
                           math.pi/4, math.pi*7/4, 3)
         
-        return surface
+        return self._finish_sprite(surface)
+
+    def _finish_sprite(self, surface):
+        """Build the collision mask from a new sprite, then RLE-encode it for drawing."""
+        # Masks read every pixel, which would decode the RLE data, so use the plain surface
+        self.mask = pygame.mask.from_surface(surface)
+        self.flash_image = None
+        # The sprite doesn't change after this, so let blits skip its transparent pixels
+        return surface_factory.convert(surface, alpha=True, rle=True)
+
+    def get_flash_image(self):
+        """The sprite with the white hit flash on top, made once per enemy (without RLE, since it's drawn on)."""
+        if self.flash_image is None:
+            self.flash_image = surface_factory.convert(self.image.copy(), alpha=True)
+            flash_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            flash_overlay.fill((255, 255, 255, 150))
+            self.flash_image.blit(flash_overlay, (0, 0))
+            surface_factory.track(self, "flash_image", alpha=True)
+        return self.flash_image
 
     def draw(self, surface):
         """Draw the enemy directly to the surface"""
@@ -428,16 +444,9 @@ class Enemy:
         # Create image if it doesn't exist yet
         if self.image is None:
             self.image = self.create_enemy_surface()
-            self.mask = pygame.mask.from_surface(self.image)
         
-        # Use the pre-rendered image
-        enemy_surface = self.image.copy() if self.hit_flash > 0 else self.image
-        
-        # Apply hit flash effect
-        if self.hit_flash > 0:
-            flash_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            flash_overlay.fill((255, 255, 255, 150))
-            enemy_surface.blit(flash_overlay, (0, 0))
+        # Use the pre-rendered image, or its hit flash version
+        enemy_surface = self.get_flash_image() if self.hit_flash > 0 else self.image
         
         # Draw enemy
         surface.blit(enemy_surface, (int(self.x), int(self.y)))
@@ -466,31 +475,29 @@ class Enemy:
         # Create image if it doesn't exist yet
         if self.image is None:
             self.image = self.create_enemy_surface()
-            self.mask = pygame.mask.from_surface(self.image)
         
-        # Use the pre-rendered image
-        enemy_surface = self.image.copy() if self.hit_flash > 0 else self.image
+        # Optional effects can be turned off by the quality governor
+        quality = self.game.quality
+        show_flash = self.hit_flash > 0 and quality.allows("hit_flash")
         
-        # Apply hit flash effect
-        if self.hit_flash > 0:
-            flash_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            flash_overlay.fill((255, 255, 255, 150))
-            enemy_surface.blit(flash_overlay, (0, 0))
+        # Use the pre-rendered image, or its hit flash version
+        enemy_surface = self.get_flash_image() if show_flash else self.image
         
         # Draw enemy at camera position
         surface.blit(enemy_surface, camera_pos)
 
         # Draw health bar with camera offset
-        health_bar_width = self.width - 10
-        health_ratio = max(0, self.health / self.max_health)
+        if self.health < self.max_health or quality.allows("full_health_bars"):
+            health_bar_width = self.width - 10
+            health_ratio = max(0, self.health / self.max_health)
 
-        # Health bar background
-        pygame.draw.rect(surface, RED, 
-                        (camera_pos[0] + 5, camera_pos[1] - 10, health_bar_width, 5))
-        
-        # Health bar foreground
-        pygame.draw.rect(surface, GREEN, 
-                        (camera_pos[0] + 5, camera_pos[1] - 10, int(health_bar_width * health_ratio), 5))
+            # Health bar background
+            pygame.draw.rect(surface, RED, 
+                            (camera_pos[0] + 5, camera_pos[1] - 10, health_bar_width, 5))
+            
+            # Health bar foreground
+            pygame.draw.rect(surface, GREEN, 
+                            (camera_pos[0] + 5, camera_pos[1] - 10, int(health_bar_width * health_ratio), 5))
         
         # Draw projectiles with camera offset
         for projectile in self.projectiles:
@@ -499,4 +506,4 @@ class Enemy:
                 camera_pos[0] - (self.x + self.width/2 - projectile.x),
                 camera_pos[1] - (self.y + self.height/2 - projectile.y)
             )
-            projectile.draw_with_camera(surface, proj_camera_pos)
+            projectile.draw_with_camera(surface, proj_camera_pos, trail=quality.allows("trails"))
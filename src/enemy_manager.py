@@ -1,6 +1,6 @@
 from src.constants import MAX_ENEMIES, SPAWN_DELAY, MAP_WIDTH, MAP_HEIGHT
 from src.enemy import Enemy
-import random
+from src.surface_factory import surface_factory
 import pygame
 import math
 import time
@@ -40,39 +40,59 @@ class EnemyManager:
         self.boss_waves = [5, 10, 15, 20]  # Waves that spawn boss enemies
 
     def update(self):
+        profiler = self.game.profiler
+
         # Update wave system
-        self.update_wave()
+        with profiler.scope("update.enemies.wave"):
+            self.update_wave()
         
-        # Remove dead enemies
-        enemies_to_remove = []
-        for enemy in self.enemies:
-            enemy.update()
-            if not enemy.alive:
-                enemies_to_remove.append(enemy)
-                
-        for enemy in enemies_to_remove:
-            if enemy in self.enemies:
-                self.enemies.remove(enemy)
+        # Move enemies and remove dead ones
+        with profiler.scope("update.enemies.ai"):
+            enemies_to_remove = []
+            for enemy in self.enemies:
+                enemy.update()
+                if not enemy.alive:
+                    enemies_to_remove.append(enemy)
+                    
+            for enemy in enemies_to_remove:
+                if enemy in self.enemies:
+                    self.enemies.remove(enemy)
+
+        # Move enemy projectiles
+        with profiler.scope("update.enemies.projectiles"):
+            for enemy in self.enemies:
+                enemy.update_projectiles()
         
         # Handle enemy spawning
-        if not self.in_wave_cooldown:
-            # Calculate spawn delay based on wave (gets faster as waves progress)
-            current_spawn_delay = max(15, self.spawn_delay * (1 - (self.current_wave - 1) * self.scaling["spawn_rate"]))
-            
-            self.spawn_timer += 1
-            if self.spawn_timer >= current_spawn_delay and len(self.enemies) < self.max_enemies:
-                # Select enemy type with weighted probability
-                enemy_type = self.select_enemy_type()
-                
-                # Get spawn position
-                spawn_pos = self.get_spawn_position()
-                if spawn_pos is not None:
-                    x, y = spawn_pos
-                    self.spawn_enemy(enemy_type, x, y)
-                    self.spawn_timer = 0
+        with profiler.scope("update.enemies.spawning"):
+            if not self.in_wave_cooldown:
+                self.spawn_timer += 1
+                if self.spawn_timer >= self.get_spawn_delay() and len(self.enemies) < self.max_enemies:
+                    # Select enemy type with weighted probability
+                    enemy_type = self.select_enemy_type()
+                    
+                    # Get spawn position
+                    spawn_pos = self.get_spawn_position()
+                    if spawn_pos is not None:
+                        x, y = spawn_pos
+                        self.spawn_enemy(enemy_type, x, y)
+                        self.spawn_timer = 0
         
         # Check for projectile collisions with player
-        self.check_projectile_collisions()
+        with profiler.scope("update.enemies.collisions"):
+            self.check_projectile_collisions()
+
+        if profiler.enabled:
+            profiler.set_count("enemies", len(self.enemies))
+            profiler.set_count("enemy projectiles", self.count_projectiles())
+
+    def get_spawn_delay(self):
+        """Frames between spawns for the current wave (gets shorter as waves progress)."""
+        return max(15, self.spawn_delay * (1 - (self.current_wave - 1) * self.scaling["spawn_rate"]))
+
+    def count_projectiles(self):
+        """Number of projectiles fired by enemies that are still in play."""
+        return sum(len(enemy.projectiles) for enemy in self.enemies)
 
     def check_projectile_collisions(self):
         """Check if any enemy projectiles hit the player"""
@@ -121,12 +141,12 @@ class EnemyManager:
             if "boss" in self.enemy_types:
                 weights["boss"] = 15
                 
-        # Convert weights to a list for random.choices
+        # Convert weights to a list for rng.choices
         enemy_types = list(weights.keys())
         enemy_weights = list(weights.values())
         
         # Select and return an enemy type
-        return random.choices(enemy_types, weights=enemy_weights, k=1)[0]
+        return self.game.rng.choices(enemy_types, weights=enemy_weights, k=1)[0]
 
     def update_wave(self):
         """Update wave timer and handle wave transitions"""
@@ -148,12 +168,15 @@ class EnemyManager:
                     
                 print(f"Wave {self.current_wave} started!")
         else:
+            if self.wave_timer == 0:
+                self.game.on_wave_started(self.current_wave)
             self.wave_timer += 1
             if self.wave_timer >= self.wave_duration:
                 # End current wave
                 self.in_wave_cooldown = True
                 self.wave_timer = 0
                 print(f"Wave {self.current_wave} completed!")
+                self.game.on_wave_completed(self.current_wave)
 
     def update_enemy_types(self):
         """Update enemy stats based on current wave"""
@@ -208,8 +231,7 @@ class EnemyManager:
             boss.rect = pygame.Rect(int(boss.x), int(boss.y), boss.width, boss.height)
             
             # Create a new image for the boss
-            boss.image = boss.create_enemy_surface()
-            boss.mask = pygame.mask.from_surface(boss.image)
+            boss.image = boss.create_enemy_surface()  # Also rebuilds its mask
             
             print(f"Boss spawned with {boss.health} health!")
             return boss
@@ -279,8 +301,8 @@ class EnemyManager:
         if enemy.image is None:
             enemy.image = enemy.create_enemy_surface()
             
-        # Create mask for collision detection
-        enemy.mask = pygame.mask.from_surface(enemy.image)
+        # The collision mask was built along with the image
+        surface_factory.track(enemy, "image", alpha=True, rle=True)
         
         # Add enemy to the list
         self.enemies.append(enemy)
@@ -295,8 +317,8 @@ class EnemyManager:
         max_distance = 500
         
         # Random position around player
-        angle = random.uniform(0, 2 * math.pi)
-        distance = random.randint(min_distance, max_distance)
+        angle = self.game.rng.uniform(0, 2 * math.pi)
+        distance = self.game.rng.randint(min_distance, max_distance)
         x = player_x + math.cos(angle) * distance
         y = player_y + math.sin(angle) * distance
         
@@ -307,22 +329,28 @@ class EnemyManager:
         return (x, y)
 
     def draw(self, surface):
+        quality = self.game.quality
+        show_trails = quality.allows("trails")
+        show_full_health_bars = quality.allows("full_health_bars")
+        show_type_indicators = quality.allows("enemy_type_indicators")
+
         for enemy in self.enemies:
             # Get camera-adjusted position
             camera_pos = self.game.camera.apply(enemy)
             
             # Only draw if on screen (with some margin)
-            if (-100 <= camera_pos[0] <= self.game.screen.get_width() + 100 and 
-                -100 <= camera_pos[1] <= self.game.screen.get_height() + 100):
+            if (-100 <= camera_pos[0] <= surface.get_width() + 100 and 
+                -100 <= camera_pos[1] <= surface.get_height() + 100):
                 
                 # Draw enemy at camera-adjusted position
                 enemy.draw_with_camera(surface, camera_pos)
                 
                 # Draw health bar
-                self.draw_health_bar(surface, enemy, camera_pos)
+                if enemy.health < enemy.max_health or show_full_health_bars:
+                    self.draw_health_bar(surface, enemy, camera_pos)
                 
                 # Draw enemy type indicator (optional)
-                if self.current_wave >= 5:  # Only show enemy type after wave 5
+                if self.current_wave >= 5 and show_type_indicators:  # Only show enemy type after wave 5
                     self.draw_enemy_type(surface, enemy, camera_pos)
                 
                 # Draw enemy projectiles
@@ -334,7 +362,7 @@ class EnemyManager:
                         proj_camera_pos = (proj_camera_x, proj_camera_y)
                         
                         # Draw projectile with camera offset
-                        projectile.draw_with_camera(surface, proj_camera_pos)
+                        projectile.draw_with_camera(surface, proj_camera_pos, trail=show_trails)
 
     def draw_health_bar(self, surface, enemy, camera_pos):
         """Draw health bar above enemy"""
@@ -0,0 +1,71 @@
+# src/event_dispatcher.py
+import pygame
+
+class EventDispatcher:
+    """Fetches input once per frame, thins it out and routes each event by type.
+
+    Only the event types the game handles are let into the SDL queue, and a
+    burst of mouse motion events is collapsed into the latest position.
+    """
+
+    # Event types any part of the game reacts to
+    ALLOWED_EVENTS = [
+        pygame.QUIT,
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP
+    ]
+
+    def __init__(self):
+        # Keep everything we never handle (window, joystick, text input...) out of the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.ALLOWED_EVENTS)
+
+        # Latest known cursor position, for handlers of events without a pos (key presses)
+        self.mouse_pos = pygame.mouse.get_pos()
+
+        # Statistics
+        self.fetched = 0
+        self.coalesced = 0
+
+    def poll(self, pending=()):
+        """Get this frame's events (after any picked up earlier) with mouse motion coalesced."""
+        events = list(pending) + pygame.event.get()
+        self.fetched += len(events)
+
+        result = []
+        for event in events:
+            if event.type == pygame.MOUSEMOTION and result and result[-1].type == pygame.MOUSEMOTION:
+                # Merge with the previous motion event, keeping the newest position
+                previous = result[-1]
+                result[-1] = pygame.event.Event(
+                    pygame.MOUSEMOTION,
+                    pos=event.pos,
+                    rel=(previous.rel[0] + event.rel[0], previous.rel[1] + event.rel[1]),
+                    buttons=event.buttons
+                )
+                self.coalesced += 1
+            else:
+                result.append(event)
+
+        return result
+
+    def dispatch(self, event, handlers):
+        """Call the handler registered for this event's type. Returns True if there was one."""
+        if hasattr(event, "pos"):
+            self.mouse_pos = event.pos
+
+        handler = handlers.get(event.type)
+        if handler is None:
+            return False
+        handler(event)
+        return True
+
+    def report(self):
+        """Return event statistics for debugging."""
+        return {
+            "fetched": self.fetched,
+            "coalesced": self.coalesced
+        }
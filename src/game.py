@@ -1,23 +1,38 @@
 import pygame 
 import json
 import os
+import random
+import time
 from src.characters.characters.player import BasePlayer  # Import your champion classes
 from src.characters.characters.ezreal import Ezreal
 from src.characters.characters.ashe import Ashe
 from src.asset_manager import AssetManager
 from src.enemy_manager import EnemyManager  
 from src.camera import Camera
+from src.event_dispatcher import EventDispatcher
+from src.latency import LatencyTracker
+from src.quality_governor import QualityGovernor
+from src.profiler import FrameProfiler
+from src.profile_capture import ProfileCapture
+from src.telemetry import JsonlWriter, TelemetryRecorder
+from src.memory_tracker import MemoryTracker
+from src.gc_policy import GCPolicy
+from src.state_trace import StateTrace
+from src.replay import InputRecorder, InputReplayer
+from src.surface_factory import surface_factory
 from src.game_states import *
 from src.constants import (
-    GAME_TITLE, MAP_WIDTH, MAP_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT, FPS, STATE_MENU,
-    DEFAULT_MUSIC_VOLUME, DEFAULT_SFX_VOLUME
+    GAME_TITLE, MAP_WIDTH, MAP_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT, FPS, IDLE_WAKEUP_MS, STATE_MENU, STATE_PLAY,
+    DEFAULT_MUSIC_VOLUME, DEFAULT_SFX_VOLUME, RENDER_RESOLUTIONS
 )
 
 class Game:
 
-    def __init__(self):
+    def __init__(self, options=None):
         pygame.init()
         
+        # Launch options (command line) take priority over saved settings
+        self.options = options or {}
         self.settings = {}
         self.load_settings()
         
@@ -28,14 +43,88 @@ class Game:
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
             
         pygame.display.set_caption(GAME_TITLE)
+        self.display_generation = 0  # Bumped whenever the display surface is recreated
         self.clock = pygame.time.Clock()
         self.running = True
+        self.frame_count = 0
+        self.max_frames = self.get_option("max_frames")  # Quit after this many frames (unattended runs)
+        self.pending_events = []  # Events picked up while waiting on an idle screen
+
+        # Input pipeline, plus the events the game handles itself before any state sees them
+        self.events = EventDispatcher()
+        self.event_handlers = {
+            pygame.QUIT: self.on_quit,
+            pygame.KEYDOWN: self.on_key_down
+        }
+
+        # Input latency instrumentation and the alternative loop ordering to compare it with
+        self.latency = LatencyTracker(enabled=self.get_option("measure_latency", False))
+        self.low_latency = self.get_option("low_latency", False)
+
+        # Headless runs skip the menus and simulate as fast as possible
+        self.headless = self.get_option("headless", False)
+        self.fps_limit = 0 if self.headless else FPS
+
+        # Optional effects are dropped when frames run over budget (or pinned by a preset)
+        self.quality = QualityGovernor(self.settings.get("quality", "auto"))
+        self.show_debug_overlay = False
+
+        # Per-phase frame timing, switched on from the play screen
+        self.profiler = FrameProfiler()
+
+        # cProfile / stack sampling over a window of gameplay, written out when the window ends
+        self.profile_capture = None
+        if self.get_option("profile"):
+            self.profile_capture = ProfileCapture(
+                self,
+                mode=self.get_option("profile"),
+                waves=self.get_option("profile_waves"),
+                frames=self.get_option("profile_frames"),
+                output=self.get_option("profile_output", "profile"),
+                sample_interval_ms=self.get_option("sample_interval_ms", 1.0)
+            )
+
+        # Per-frame timing and entity counts streamed to a JSONL file
+        self.telemetry = None
+        if self.get_option("telemetry"):
+            self.telemetry = TelemetryRecorder(
+                self,
+                JsonlWriter(self.get_option("telemetry")),
+                interval=self.get_option("telemetry_interval", 1)
+            )
+
+        # Live object counts and allocation diffs at each wave, to catch leaks in long sessions
+        self.memory = MemoryTracker(self, enabled=self.get_option("track_memory", False))
+        self.memory.start()
+
+        # Garbage collection is held back during waves and done in the cooldown between them
+        self.gc_policy = GCPolicy(enabled=self.get_option("gc_policy", "wave") == "wave")
+
+        # World hashes after every gameplay tick, to check that a change didn't alter the simulation
+        self.state_trace = None
+        if self.get_option("trace_state"):
+            self.state_trace = StateTrace(self, self.get_option("trace_state"), full=self.get_option("trace_full", False))
+
+        # Gameplay inputs logged for replay, or a recorded session's inputs fed back in
+        self.input_recorder = None
+        if self.get_option("record_inputs"):
+            self.input_recorder = InputRecorder(self, self.get_option("record_inputs"))
+        self.input_replayer = None
+        if self.get_option("replay_inputs"):
+            inputs, end = self.get_option("replay_inputs")
+            self.input_replayer = InputReplayer(self, inputs, end)
 
         # Initialize camera
         self.camera = Camera(MAP_WIDTH, MAP_HEIGHT)
 
+        # The world can be drawn at a lower internal resolution and scaled up to the screen
+        self.render_target = None
+        self.render_resolution = "native"
+        self.native_hud = self.settings.get("native_hud", True)  # Draw the HUD after scaling, at full sharpness
+        self.set_render_resolution(self.get_option("render_resolution", "native"))
+
         # Character selection - default to "base"
-        self.selected_character = self.settings.get("selected_character", "base")
+        self.selected_character = self.get_option("selected_character", "base")
         
         # Initialize player in the center of the map with selected character
         player_x = MAP_WIDTH // 2
@@ -59,6 +148,11 @@ class Game:
 
         # Initialize game variables
         self.score = 0
+
+        # Everything random in the simulation draws from this, so a seed reproduces a run
+        self.seed = None
+        self.rng = random.Random()
+        self.seed_rng()
         
         # Initialize enemy manager
         self.enemy_manager = EnemyManager(self)
@@ -66,7 +160,35 @@ class Game:
         # Load enemy assets
         self.load_enemy_assets()
         
-        self.state = StateFactory.create_state(STATE_MENU, self)
+        # Game states live on a stack and are reused between visits
+        self.states = StateManager(self)
+        self.change_state(STATE_PLAY if self.headless else STATE_MENU)
+        self.gc_policy.loading_finished()
+
+    def get_option(self, key, default=None):
+        """Look up a launch option, falling back to saved settings."""
+        if self.options.get(key) is not None:
+            return self.options[key]
+        return self.settings.get(key, default)
+
+    def set_render_resolution(self, name):
+        """Pick the internal resolution the world is drawn at (a key of RENDER_RESOLUTIONS)."""
+        if name not in RENDER_RESOLUTIONS:
+            print(f"Unknown render resolution '{name}', using native")
+            name = "native"
+        self.render_resolution = name
+
+        size = RENDER_RESOLUTIONS[name]
+        if size == self.screen.get_size():
+            self.render_target = None  # Draw straight to the screen
+        else:
+            self.render_target = surface_factory.create(size)
+        self.camera.set_viewport(size, self.screen.get_size())
+
+    @property
+    def state(self):
+        """The active game state (top of the state stack)."""
+        return self.states.current
 
     def create_player(self, x, y):
         """Create a player based on the selected character"""
@@ -76,6 +198,7 @@ class Game:
             self.player = Ashe(x, y)
         else:  # Default to base player
             self.player = BasePlayer(x, y)
+        self.player.invulnerable = self.get_option("invulnerable", False)
     
     def set_character(self, character_id):
         """Set the selected character and save to settings"""
@@ -126,13 +249,6 @@ class Game:
         self.assets.load_sound("enemy_hit", "enemies/hit.wav")
         self.assets.load_sound("enemy_death", "enemies/death.wav")
 
-    def __setattr__(self, name, value):
-        if name == 'state' and value is None:
-            import traceback
-            print("WARNING: Setting game state to None!")
-            traceback.print_stack()
-        super().__setattr__(name, value)
-
     def load_settings(self):
         """Load game settings from a file or use defaults."""
         settings_path = "settings.json"
@@ -184,24 +300,43 @@ class Game:
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
         else:
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.display_generation += 1
+
+        # The new display may use a different pixel format, so convert cached surfaces to match
+        self.set_render_resolution(self.render_resolution)
+        self.assets.reconvert_images()
+        reconverted = surface_factory.reconvert_all()
+        print(f"Converted {len(self.assets.images)} images and {reconverted} sprites to the new display format")
         
         return self.fullscreen
 
     def handle_events(self):
-        events = pygame.event.get()
+        with self.profiler.scope("events"):
+            self.dispatch_events()
+
+    def dispatch_events(self):
+        events = self.events.poll(self.pending_events)
+        self.pending_events = []
+        self.latency.inputs_polled()
         for event in events:
-            
-            # Quit
-            if event.type == pygame.QUIT:
-                self.running = False
+            # Game-wide events (quit)
+            self.events.dispatch(event, self.event_handlers)
+            if not self.running:
+                break
+
+            if self.state is None:
+                print("ERROR: Game state is None! Switching to default state...")
+                self.change_state(STATE_MENU)  # Switch to a safe default state
 
-            # Change game state
-            if self.running:
-                if self.state is None:
-                    print("ERROR: Game state is None! Switching to default state...")
-                    self.change_state(STATE_MENU)  # Switch to a safe default state
-                else:
-                    self.state.handle_events(events)
+            # Route to whichever state is active now (an earlier event may have changed it)
+            self.state.handle_event(event)
+
+    def on_quit(self, event):
+        self.running = False
+
+    def on_key_down(self, event):
+        if event.key == pygame.K_F3:
+            self.show_debug_overlay = not self.show_debug_overlay
 
     def update(self):
         if self.state is None:
@@ -209,18 +344,31 @@ class Game:
             self.change_state(STATE_MENU)  # Switch to a safe default state
             return
         
-        # Update the current game state with delta time
-        self.state.update()
-        
-        # If we're in gameplay state, update camera and check for collisions
-        if isinstance(self.state, PlayState):
-            # Update camera to follow player
-            self.camera.update(
-                self.player.x + self.player.width // 2,
-                self.player.y + self.player.height // 2,
-                SCREEN_WIDTH, SCREEN_HEIGHT
-            )
-            self.check_projectile_collisions()
+        with self.profiler.scope("update"):
+            if self.input_replayer and isinstance(self.state, PlayState):
+                self.input_replayer.before_tick(self.state)
+
+            # Update the current game state with delta time
+            self.state.update()
+            
+            # If we're in gameplay state, update camera and check for collisions
+            if isinstance(self.state, PlayState):
+                # Update camera to follow player
+                self.camera.update(
+                    self.player.x + self.player.width // 2,
+                    self.player.y + self.player.height // 2
+                )
+                with self.profiler.scope("update.projectile_hits"):
+                    self.check_projectile_collisions()
+                if self.state_trace:
+                    self.state_trace.record()
+                if self.input_recorder:
+                    self.input_recorder.tick_finished()
+                if self.input_replayer:
+                    self.input_replayer.tick_finished()
+            elif self.input_replayer:
+                # The replayed session left gameplay (the player died), so there's nothing more to replay
+                self.running = False
 
     def check_projectile_collisions(self):
         """Check for collisions between projectiles and enemies"""
@@ -264,16 +412,57 @@ class Game:
                     break
 
     def render(self):
-        if self.state:
-            self.state.render(self.screen)
-        pygame.display.flip()
+        with self.profiler.scope("render"):
+            if self.state:
+                self.state.render(self.screen)
+            if self.show_debug_overlay:
+                self.draw_debug_overlay(self.screen)
+        with self.profiler.scope("flip"):
+            pygame.display.flip()
+        self.latency.presented()
+
+    def draw_debug_overlay(self, screen):
+        """Show frame timing and the active quality tier in the top right corner."""
+        font = self.assets.get_font("default", 24)
+        mode = "auto" if self.quality.auto else "fixed"
+        lines = [
+            f"FPS: {self.clock.get_fps():.0f}",
+            f"Frame: {self.quality.average_frame_time():.1f} ms",
+            f"Quality: {self.quality.tier_name} ({mode})"
+        ]
+        y = 40
+        for line in lines:
+            text = font.render(line, True, (255, 255, 0))
+            screen.blit(text, (screen.get_width() - text.get_width() - 10, y))
+            y += 20
 
     def change_state(self, new_state, **kwargs):
+        """Replace the whole state stack with a new state."""
         print(f"Changing state to: {new_state}")
-        self.state = StateFactory.create_state(new_state, self, **kwargs)
+        self.states.change_state(new_state, **kwargs)
+
+    def push_state(self, new_state, **kwargs):
+        """Open a state on top of the current one (e.g. pause over gameplay)."""
+        print(f"Pushing state: {new_state}")
+        self.states.push_state(new_state, **kwargs)
+
+    def pop_state(self):
+        """Close the top state and return to the one beneath it."""
+        self.states.pop_state()
+        print(f"Returning to state: {type(self.state).__name__}")
+
+    def seed_rng(self):
+        """Seed the simulation's RNG from the "seed" option, or with a fresh seed that's printed for reruns."""
+        seed = self.get_option("seed")
+        if seed is None:
+            seed = random.randrange(1 << 32)
+        self.seed = seed
+        self.rng.seed(seed)
+        print(f"Random seed: {seed}")
 
     def reset_game(self):
         """Reset the game to its initial state."""
+        self.seed_rng()
         # Reset player position to center of map
         player_x = MAP_WIDTH // 2
         player_y = MAP_HEIGHT // 2
@@ -282,15 +471,121 @@ class Game:
         
         # Reset enemy manager
         self.enemy_manager = EnemyManager(self)
+        self.memory.reset()
+        self.gc_policy.reset()
+        if self.input_recorder:
+            self.input_recorder.reset()
+
+    def on_wave_started(self, wave):
+        """Called by the enemy manager on the first frame of each wave."""
+        self.memory.wave_started(wave)
+        self.gc_policy.wave_started(wave)
+        if self.input_recorder:
+            self.input_recorder.wave_started(wave)
+
+    def on_wave_completed(self, wave):
+        """Called by the enemy manager when a wave ends and the cooldown begins."""
+        self.gc_policy.wave_completed(wave)
     
+    def is_idle(self):
+        """True when the current screen has nothing to animate."""
+        if self.state is None or not self.state.is_idle():
+            return False
+        # Keep ticking while a music switch is waiting to start
+        return not self.assets.music.is_switching()
+
+    def wait_for_events(self, timeout_ms):
+        """Sleep until an event arrives or the timeout passes."""
+        event = pygame.event.wait(timeout_ms)
+        if event.type != pygame.NOEVENT:
+            self.pending_events.append(event)
+
+    def run_frame(self):
+        """Run one iteration of the main loop."""
+        self.frame_count += 1
+        if self.profile_capture:
+            self.profile_capture.begin_frame()
+            if self.profile_capture.finished and self.headless:
+                self.running = False  # Nothing left to measure
+                return
+
+        if self.low_latency:
+            self.run_frame_low_latency()
+            return
+
+        if self.is_idle():
+            # Nothing is animating, so don't spin at full frame rate
+            self.wait_for_events(IDLE_WAKEUP_MS)
+
+        self.step()
+        self.clock.tick(self.fps_limit)
+
+    def run_frame_low_latency(self):
+        """Loop ordering for low input latency: pace first, then sample input right before simulating."""
+        if self.is_idle():
+            self.wait_for_events(IDLE_WAKEUP_MS)
+            self.clock.tick()
+        else:
+            # Busy-wait for accurate frame pacing (tick() can oversleep by a few ms)
+            self.clock.tick_busy_loop(self.fps_limit)
+
+        self.step()
+
+    def step(self):
+        """Do one frame's work (input, simulation, drawing), timing each part."""
+        frame_start = time.perf_counter()
+        self.housekeeping()
+        self.handle_events()
+        update_start = time.perf_counter()
+        self.update()
+        render_start = time.perf_counter()
+        self.render()
+        self.end_frame(frame_start, update_start, render_start)
+
+    def end_frame(self, frame_start, update_start, render_start):
+        """Report how long this frame's work took to the quality governor, profiler and telemetry."""
+        frame_end = time.perf_counter()
+        work_ms = (frame_end - frame_start) * 1000
+        self.quality.frame_finished(work_ms)
+        self.profiler.end_frame(work_ms)
+        if self.telemetry:
+            self.telemetry.frame_finished(
+                work_ms,
+                (update_start - frame_start) * 1000,
+                (render_start - update_start) * 1000,
+                (frame_end - render_start) * 1000
+            )
+
+    def housekeeping(self):
+        """Per-frame work that doesn't depend on input."""
+        # Let the audio system know a new frame started
+        self.assets.update()
+
     def run(self):
         """Main game loop."""
-        # Start menu music
-        self.assets.play_music("menu_music")
-        
+        # Music is started by each state's enter()
         while self.running:
-            self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(FPS)
+            self.run_frame()
+            if self.max_frames and self.frame_count >= self.max_frames:
+                self.running = False
+
+        if self.profile_capture:
+            self.profile_capture.finish()
+        if self.telemetry:
+            self.telemetry.close()
+        if self.state_trace:
+            self.state_trace.close()
+        if self.input_recorder:
+            self.input_recorder.close()
+        if self.input_replayer:
+            self.input_replayer.print_report()
+        if self.memory.enabled:
+            self.memory.print_report()
+        self.gc_policy.print_report()
+        self.gc_policy.close()
+
+        print(f"Voice stats: {self.assets.voices.report()}")
+        print(f"Event stats: {self.events.report()}")
+        if self.latency.enabled:
+            self.latency.print_report()
         pygame.quit()
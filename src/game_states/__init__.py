@@ -3,5 +3,6 @@ from .menu_state import MenuState
 from .play_state import PlayState
 from .state_factory import StateFactory
 from .paused_state import PausedState
+from .state_manager import StateManager
 
-__all__ = ["GameState", "MenuState", "PlayState", "StateFactory", "PausedState"]
\ No newline at end of file
+__all__ = ["GameState", "MenuState", "PlayState", "StateFactory", "PausedState", "StateManager"]
\ No newline at end of file
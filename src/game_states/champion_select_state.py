@@ -1,22 +1,17 @@
 # src/game_states/champion_select_state.py
 
 import pygame
-from src.constants import STATE_MENU, STATE_PLAY, SCREEN_WIDTH, SCREEN_HEIGHT, DEFAULT_FONT
+from src.game_states.game_state import GameState
+from src.constants import STATE_MENU, STATE_PLAY, SCREEN_WIDTH, SCREEN_HEIGHT, SMALL_FONT_SIZE
 
-class ChampionSelectState:
+class ChampionSelectState(GameState):
     def __init__(self, game):
-        self.game = game
+        super().__init__(game)
         
-        # Font setup with custom font
-        try:
-            self.title_font = pygame.font.Font(DEFAULT_FONT, 60)
-            self.font = pygame.font.Font(DEFAULT_FONT, 36)
-            self.small_font = pygame.font.Font(DEFAULT_FONT, 24)
-        except:
-            print("Warning: Custom font not found. Using fallback font.")
-            self.title_font = pygame.font.SysFont(None, 60)
-            self.font = pygame.font.SysFont(None, 36)
-            self.small_font = pygame.font.SysFont(None, 24)
+        # Fonts come from the asset manager (loaded once at startup)
+        self.title_font = game.assets.get_font("main", 60)
+        self.font = game.assets.get_font("main", 36)
+        self.small_font = game.assets.get_font("main", SMALL_FONT_SIZE)
         
         # Champion data
         self.champions = [
@@ -46,52 +41,60 @@ class ChampionSelectState:
         
         # Selection variables
         self.selected_index = 0
-        for i, champion in enumerate(self.champions):
-            if champion["id"] == self.game.selected_character:
-                self.selected_index = i
-                break
         
         # Layout variables
         self.portrait_size = 150
         self.portrait_spacing = 50
         self.start_x = (SCREEN_WIDTH - (len(self.champions) * (self.portrait_size + self.portrait_spacing) - self.portrait_spacing)) // 2
+
+        self.event_handlers = {
+            pygame.KEYDOWN: self.on_key_down,
+            pygame.MOUSEBUTTONDOWN: self.on_mouse_down
+        }
+
+    def enter(self, **kwargs):
+        # Start on the currently selected champion
+        self.selected_index = 0
+        for i, champion in enumerate(self.champions):
+            if champion["id"] == self.game.selected_character:
+                self.selected_index = i
+                break
+        
+    def on_key_down(self, event):
+        if event.key == pygame.K_ESCAPE:
+            # Return to menu
+            self.game.change_state(STATE_MENU)
+            
+        elif event.key == pygame.K_LEFT:
+            # Move selection left
+            self.selected_index = (self.selected_index - 1) % len(self.champions)
+            
+        elif event.key == pygame.K_RIGHT:
+            # Move selection right
+            self.selected_index = (self.selected_index + 1) % len(self.champions)
+            
+        elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
+            # Select champion and start game
+            self.select_champion()
+
+    def on_mouse_down(self, event):
+        if event.button != 1:  # Left click only
+            return
+        mouse_pos = event.pos
+        
+        # Check if clicked on any champion portrait
+        for i in range(len(self.champions)):
+            portrait_x = self.start_x + i * (self.portrait_size + self.portrait_spacing)
+            portrait_rect = pygame.Rect(portrait_x, 150, self.portrait_size, self.portrait_size)
+            
+            if portrait_rect.collidepoint(mouse_pos):
+                self.selected_index = i
+                break
         
-    def handle_events(self, events):
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    # Return to menu
-                    self.game.change_state(STATE_MENU)
-                    
-                elif event.key == pygame.K_LEFT:
-                    # Move selection left
-                    self.selected_index = (self.selected_index - 1) % len(self.champions)
-                    
-                elif event.key == pygame.K_RIGHT:
-                    # Move selection right
-                    self.selected_index = (self.selected_index + 1) % len(self.champions)
-                    
-                elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                    # Select champion and start game
-                    self.select_champion()
-                    
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    mouse_pos = pygame.mouse.get_pos()
-                    
-                    # Check if clicked on any champion portrait
-                    for i in range(len(self.champions)):
-                        portrait_x = self.start_x + i * (self.portrait_size + self.portrait_spacing)
-                        portrait_rect = pygame.Rect(portrait_x, 150, self.portrait_size, self.portrait_size)
-                        
-                        if portrait_rect.collidepoint(mouse_pos):
-                            self.selected_index = i
-                            break
-                    
-                    # Check if clicked on start button
-                    start_button_rect = pygame.Rect(SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT - 100, 200, 50)
-                    if start_button_rect.collidepoint(mouse_pos):
-                        self.select_champion()
+        # Check if clicked on start button
+        start_button_rect = pygame.Rect(SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT - 100, 200, 50)
+        if start_button_rect.collidepoint(mouse_pos):
+            self.select_champion()
     
     def select_champion(self):
         # Set the selected champion
@@ -105,6 +108,10 @@ class ChampionSelectState:
         # Any animations or effects
         pass
     
+    def is_idle(self):
+        # Static screen: only redraw when input arrives
+        return True
+
     def render(self, screen):
         # Fill background
         screen.fill((20, 20, 40))
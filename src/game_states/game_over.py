@@ -2,7 +2,7 @@ import pygame
 from src.game_states.game_state import GameState
 from src.constants import (
     WHITE, YELLOW, STATE_MENU, STATE_PLAY,
-    TITLE_FONT_SIZE, DEFAULT_FONT, NORMAL_FONT_SIZE, HEADING_FONT_SIZE,
+    TITLE_FONT_SIZE, NORMAL_FONT_SIZE, HEADING_FONT_SIZE,
     SCREEN_WIDTH, SCREEN_HEIGHT, FPS
 )
 
@@ -19,15 +19,10 @@ class GameOverState(GameState):
         self.quit_button_color = (180, 70, 70)  # Reddish
         self.quit_button_hover_color = (210, 100, 100)
         
-        # Load fonts
-        try:
-            self.title_font = pygame.font.Font(DEFAULT_FONT, TITLE_FONT_SIZE)
-            self.score_font = pygame.font.Font(DEFAULT_FONT, HEADING_FONT_SIZE)
-            self.button_font = pygame.font.Font(DEFAULT_FONT, NORMAL_FONT_SIZE)
-        except:
-            self.title_font = pygame.font.Font(None, 84)
-            self.score_font = pygame.font.Font(None, 64)
-            self.button_font = pygame.font.Font(None, 36)
+        # Fonts come from the asset manager (loaded once at startup)
+        self.title_font = game.assets.get_font("main", TITLE_FONT_SIZE)
+        self.score_font = game.assets.get_font("main", HEADING_FONT_SIZE)
+        self.button_font = game.assets.get_font("main", NORMAL_FONT_SIZE)
         
         # Prepare text surfaces
         self.title_text = self.title_font.render("Game Over", True, self.title_color)
@@ -69,8 +64,18 @@ class GameOverState(GameState):
         }
         
         # Animation variables
-        self.fade_alpha = 0
         self.fade_speed = 5
+
+        self.event_handlers = {
+            pygame.KEYDOWN: self.on_key_down,
+            pygame.MOUSEBUTTONDOWN: self.on_mouse_down
+        }
+
+    def enter(self, score=None, **kwargs):
+        self.score = score if score is not None else self.game.score
+        
+        # Restart the animations
+        self.fade_alpha = 0
         self.score_counter = 0
         self.score_speed = max(1, self.score // 100)  # Adjust speed based on score
         
@@ -90,25 +95,23 @@ class GameOverState(GameState):
         """Update the score text surface with the current counter value"""
         self.score_text = self.score_font.render(f"Score: {self.score_counter}", True, self.score_color)
         
-    def handle_events(self, events):
-        mouse_pos = pygame.mouse.get_pos()
-        
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                # Check if any button was clicked
-                for button_name, button in self.buttons.items():
-                    if button["rect"].collidepoint(mouse_pos):
-                        try:
-                            self.game.assets.play_sound("select")
-                        except:
-                            pass
-                        button["action"]()
-                        
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.go_to_main_menu()
-                elif event.key == pygame.K_RETURN:
-                    self.retry_game()
+    def on_mouse_down(self, event):
+        if event.button != 1:
+            return
+        # Check if any button was clicked
+        for button_name, button in self.buttons.items():
+            if button["rect"].collidepoint(event.pos):
+                try:
+                    self.game.assets.play_sound("select")
+                except:
+                    pass
+                button["action"]()
+
+    def on_key_down(self, event):
+        if event.key == pygame.K_ESCAPE:
+            self.go_to_main_menu()
+        elif event.key == pygame.K_RETURN:
+            self.retry_game()
     
     def update(self):
         # Handle fade in animation
@@ -124,6 +127,10 @@ class GameOverState(GameState):
                 self.score_counter = self.score
             self.update_score_text()
     
+    def is_idle(self):
+        # Run at full rate until the fade and score count-up finish
+        return self.fade_alpha >= 255 and self.score_counter >= self.score
+
     def render(self, screen):
         # Draw dark background
         screen.fill((20, 20, 40))
@@ -3,9 +3,13 @@ class GameState:
 
     def __init__(self, game):
         self.game = game
-    
-    def handle_events(self, events):
-        pass
+        self.event_handlers = {}  # Event type -> handler method, filled in by each state
+
+    def handle_event(self, event):
+
+        """ Route one event to the handler registered for its type """
+
+        self.game.events.dispatch(event, self.event_handlers)
 
     def update(self):
         pass
@@ -13,14 +17,22 @@ class GameState:
     def render(self):
         pass
 
-    def enter(self):
+    def is_idle(self):
 
-        """ Called when entering this state """
+        """ True when nothing on screen animates, so the game loop can sleep until input arrives """
+
+        return False
+
+    def enter(self, **kwargs):
+
+        """ Called when entering this state (the instance is reused between visits) """
 
         pass
 
     def exit(self):
 
+        """ Called when leaving this state """
+
         pass
 
 
@@ -1,8 +1,9 @@
 import pygame
 from src.game_states.game_state import GameState
+from src.surface_factory import surface_factory
 from src.constants import (
     WHITE, YELLOW, STATE_PLAY, STATE_OPTIONS, STATE_CHAMPION_SELECT,
-    TITLE_FONT_SIZE, DEFAULT_FONT, NORMAL_FONT_SIZE, HEADING_FONT_SIZE,
+    TITLE_FONT_SIZE, NORMAL_FONT_SIZE, HEADING_FONT_SIZE,
     MENU_START_Y, MENU_SPACING, FPS
 )
 
@@ -20,15 +21,11 @@ class MenuState(GameState):
         self.selected_color = YELLOW
         self.normal_color = WHITE
 
-        try:
-            self.font = pygame.font.Font(DEFAULT_FONT, NORMAL_FONT_SIZE)
-            self.title_font = pygame.font.Font(DEFAULT_FONT, TITLE_FONT_SIZE)
-            self.subtitle_font = pygame.font.Font(DEFAULT_FONT, HEADING_FONT_SIZE)
-        
-        except:
-            self.font = pygame.font.Font(None, 48)
-            self.title_font = pygame.font.Font(None, 72)
-            self.subtitle_font = pygame.font.Font(None, 72)
+        # Fonts come from the asset manager (loaded once at startup)
+        self.font = game.assets.get_font("main", NORMAL_FONT_SIZE)
+        self.title_font = game.assets.get_font("main", TITLE_FONT_SIZE)
+        self.subtitle_font = game.assets.get_font("main", HEADING_FONT_SIZE)
+        self.instruction_font = game.assets.get_font("default", 24)
         
         # Load the background image
         try:
@@ -39,45 +36,54 @@ class MenuState(GameState):
         except (pygame.error, FileNotFoundError):
             print("Warning: Menu background image not found. Using solid color instead.")
             self.bg_image = None
-            
-        game.assets.play_music()
-
-    def handle_events(self, events):
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    self.selected = (self.selected - 1) % len(self.options)
-                    self.game.assets.play_sound("hover")
-                elif event.key == pygame.K_DOWN:
-                    self.selected = (self.selected + 1) % len(self.options)
-                    self.game.assets.play_sound("hover")
-                elif event.key == pygame.K_RETURN:
-                    self.game.assets.play_sound("select")
-                    self.select_option(self.selected)
-            
-            # Handle mouse movement for hover effect
-            elif event.type == pygame.MOUSEMOTION:
-                mouse_pos = pygame.mouse.get_pos()
-                old_hovered = self.hovered
-                self.hovered = -1  # Reset hover
-                
-                for i, rect in enumerate(self.option_rects):
-                    if rect.collidepoint(mouse_pos):
-                        self.hovered = i
-                        break
-                
-                # Play sound only if hover changed
-                if old_hovered != self.hovered and self.hovered != -1:
-                    self.game.assets.play_sound("hover")
-            
-            # Handle mouse clicks
-            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click
-                mouse_pos = pygame.mouse.get_pos()
-                for i, rect in enumerate(self.option_rects):
-                    if rect.collidepoint(mouse_pos):
-                        self.game.assets.play_sound("select")
-                        self.select_option(i)
-                        break
+        surface_factory.track(self, "bg_image", alpha=False)
+
+        self.event_handlers = {
+            pygame.KEYDOWN: self.on_key_down,
+            pygame.MOUSEMOTION: self.on_mouse_motion,
+            pygame.MOUSEBUTTONDOWN: self.on_mouse_down
+        }
+
+    def enter(self, **kwargs):
+        self.hovered = -1
+        self.game.assets.play_music("menu_music")
+
+        # Read the gameplay track now so starting a game doesn't wait on disk
+        self.game.assets.prefetch_music("game_music")
+
+    def on_key_down(self, event):
+        if event.key == pygame.K_UP:
+            self.selected = (self.selected - 1) % len(self.options)
+            self.game.assets.play_sound("hover")
+        elif event.key == pygame.K_DOWN:
+            self.selected = (self.selected + 1) % len(self.options)
+            self.game.assets.play_sound("hover")
+        elif event.key == pygame.K_RETURN:
+            self.game.assets.play_sound("select")
+            self.select_option(self.selected)
+
+    def on_mouse_motion(self, event):
+        # Hover effect
+        old_hovered = self.hovered
+        self.hovered = -1  # Reset hover
+
+        for i, rect in enumerate(self.option_rects):
+            if rect.collidepoint(event.pos):
+                self.hovered = i
+                break
+
+        # Play sound only if hover changed
+        if old_hovered != self.hovered and self.hovered != -1:
+            self.game.assets.play_sound("hover")
+
+    def on_mouse_down(self, event):
+        if event.button != 1:  # Left click only
+            return
+        for i, rect in enumerate(self.option_rects):
+            if rect.collidepoint(event.pos):
+                self.game.assets.play_sound("select")
+                self.select_option(i)
+                break
 
     def select_option(self, option_index):
         if self.options[option_index] == "Play":
@@ -86,13 +92,17 @@ class MenuState(GameState):
             # Add this new option to navigate to the champion select screen
             self.game.change_state(STATE_CHAMPION_SELECT)
         elif self.options[option_index] == "Options":
-            self.game.change_state(STATE_OPTIONS)
+            self.game.push_state(STATE_OPTIONS, previous_state=self)
         elif self.options[option_index] == "Quit":
             self.game.running = False
 
     def update(self):
         pass
 
+    def is_idle(self):
+        # Static screen: only redraw when input arrives
+        return True
+
     def render(self, screen):
         # Draw the background image or fill with black if no image
         if self.bg_image:
@@ -142,9 +152,8 @@ class MenuState(GameState):
         ]
         
         instruction_y = screen.get_height() - 100
-        instruction_font = pygame.font.Font(None, 24)
         for instruction in instructions:
-            text = instruction_font.render(instruction, True, (180, 180, 180))
+            text = self.instruction_font.render(instruction, True, (180, 180, 180))
             text_rect = text.get_rect(center=(screen.get_width() // 2, instruction_y))
             screen.blit(text, text_rect)
             instruction_y += 20
@@ -1,24 +1,26 @@
 from src.game_states.game_state import GameState
 import pygame
 from src.constants import (
-    WHITE, YELLOW, DEFAULT_FONT, NORMAL_FONT_SIZE, HEADING_FONT_SIZE,
-    MENU_START_Y, MENU_SPACING, FONT_DIR, UI_ACCENT, UI_BACKGROUND
+    WHITE, YELLOW, NORMAL_FONT_SIZE, HEADING_FONT_SIZE, SMALL_FONT_SIZE,
+    OPTIONS_START_Y, MENU_SPACING, UI_ACCENT, UI_BACKGROUND, STATE_MENU, QUALITY_TIERS, RENDER_RESOLUTIONS
 )
-import os
 
 class OptionsState(GameState):
     
-    def __init__(self, game, **kwargs):
+    def __init__(self, game):
         super().__init__(game)
         
-        # Store previous state to return to
-        self.previous_state = kwargs.get("previous_state", None)
+        # State to return to (set on enter)
+        self.previous_state = None
         
-        # Options and their current values
+        # Options and their current values (refreshed from settings on enter)
         self.options = [
-            {"name": "Music Volume", "value": int(game.settings.get("music_volume", 70)), "min": 0, "max": 100, "step": 10},
-            {"name": "Sound Effects Volume", "value": int(game.settings.get("sfx_volume", 70)), "min": 0, "max": 100, "step": 10},
-            {"name": "Fullscreen", "value": bool(game.settings.get("fullscreen", False)), "toggle": True},
+            {"name": "Music Volume", "value": 70, "min": 0, "max": 100, "step": 10},
+            {"name": "Sound Effects Volume", "value": 70, "min": 0, "max": 100, "step": 10},
+            {"name": "Fullscreen", "value": False, "toggle": True},
+            {"name": "Quality", "value": "auto", "choices": ["auto"] + [name for name, features in QUALITY_TIERS]},
+            {"name": "Render Resolution", "value": "native", "choices": list(RENDER_RESOLUTIONS)},
+            {"name": "Native HUD", "value": True, "toggle": True},
             {"name": "Back"}
         ]
         
@@ -33,93 +35,111 @@ class OptionsState(GameState):
         self.selected_color = YELLOW
         self.normal_color = WHITE
         
-        # Use the default font from constants
-        try:
-            self.font = pygame.font.Font(DEFAULT_FONT, NORMAL_FONT_SIZE)
-            self.title_font = pygame.font.Font(DEFAULT_FONT, HEADING_FONT_SIZE)
-            self.instruction_font = pygame.font.Font(DEFAULT_FONT, 24)
-        except Exception as e:
-            print(f"Error loading font: {e}")
-            self.font = pygame.font.Font(None, NORMAL_FONT_SIZE)
-            self.title_font = pygame.font.Font(None, HEADING_FONT_SIZE)
-            self.instruction_font = pygame.font.Font(None, 24)
+        # Fonts come from the asset manager (loaded once at startup)
+        self.font = game.assets.get_font("main", NORMAL_FONT_SIZE)
+        self.title_font = game.assets.get_font("main", HEADING_FONT_SIZE)
+        self.instruction_font = game.assets.get_font("main", SMALL_FONT_SIZE)
         
         # Track if user is dragging a slider
         self.dragging_slider = None
 
-    def handle_events(self, events):
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    self.selected = (self.selected - 1) % len(self.options)
-                    self.game.assets.play_sound("hover")
-                elif event.key == pygame.K_DOWN:
-                    self.selected = (self.selected + 1) % len(self.options)
-                    self.game.assets.play_sound("hover")
-                elif event.key == pygame.K_LEFT:
-                    self.adjust_option(-1)
-                    self.game.assets.play_sound("hover")
-                elif event.key == pygame.K_RIGHT:
-                    self.adjust_option(1)
-                    self.game.assets.play_sound("hover")
-                elif event.key == pygame.K_RETURN:
-                    self.select_option()
-                    self.game.assets.play_sound("select")
-                elif event.key == pygame.K_ESCAPE:
-                    self.save_and_exit()
-                    self.game.assets.play_sound("back")
-            
-            # Mouse movement for hover effect
-            elif event.type == pygame.MOUSEMOTION:
-                mouse_pos = pygame.mouse.get_pos()
-                
-                # Handle slider dragging
-                if self.dragging_slider is not None:
-                    idx, slider_rect, min_val, max_val = self.dragging_slider
-                    self.handle_slider_drag(idx, slider_rect, mouse_pos, min_val, max_val)
-                
-                # Hover effect on options
-                else:
-                    for i, rect in enumerate(self.option_rects):
-                        if rect.collidepoint(mouse_pos):
-                            if self.selected != i:
-                                self.selected = i
-                                self.game.assets.play_sound("hover")
-            
-            # Mouse click
-            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click
-                mouse_pos = pygame.mouse.get_pos()
-                
-                # Check option text clicks
-                for i, rect in enumerate(self.option_rects):
-                    if rect.collidepoint(mouse_pos):
+        self.event_handlers = {
+            pygame.KEYDOWN: self.on_key_down,
+            pygame.MOUSEMOTION: self.on_mouse_motion,
+            pygame.MOUSEBUTTONDOWN: self.on_mouse_down,
+            pygame.MOUSEBUTTONUP: self.on_mouse_up
+        }
+
+    def enter(self, previous_state=None, **kwargs):
+        # Store previous state to return to
+        self.previous_state = previous_state
+        
+        # Show the current settings
+        settings = self.game.settings
+        self.options[0]["value"] = int(settings.get("music_volume", 70))
+        self.options[1]["value"] = int(settings.get("sfx_volume", 70))
+        self.options[2]["value"] = bool(settings.get("fullscreen", False))
+        self.options[3]["value"] = self.game.quality.preset
+        self.options[4]["value"] = self.game.render_resolution
+        self.options[5]["value"] = self.game.native_hud
+        
+        self.selected = 0
+        self.dragging_slider = None
+
+    def on_key_down(self, event):
+        if event.key == pygame.K_UP:
+            self.selected = (self.selected - 1) % len(self.options)
+            self.game.assets.play_sound("hover")
+        elif event.key == pygame.K_DOWN:
+            self.selected = (self.selected + 1) % len(self.options)
+            self.game.assets.play_sound("hover")
+        elif event.key == pygame.K_LEFT:
+            self.adjust_option(-1)
+            self.game.assets.play_sound("hover")
+        elif event.key == pygame.K_RIGHT:
+            self.adjust_option(1)
+            self.game.assets.play_sound("hover")
+        elif event.key == pygame.K_RETURN:
+            self.select_option()
+            self.game.assets.play_sound("select")
+        elif event.key == pygame.K_ESCAPE:
+            self.save_and_exit()
+            self.game.assets.play_sound("back")
+
+    def on_mouse_motion(self, event):
+        mouse_pos = event.pos
+
+        # Handle slider dragging
+        if self.dragging_slider is not None:
+            idx, slider_rect, min_val, max_val = self.dragging_slider
+            self.handle_slider_drag(idx, slider_rect, mouse_pos, min_val, max_val)
+
+        # Hover effect on options
+        else:
+            for i, rect in enumerate(self.option_rects):
+                if rect.collidepoint(mouse_pos):
+                    if self.selected != i:
                         self.selected = i
-                        self.select_option()
-                        self.game.assets.play_sound("select")
-                        break
-                
-                # Check slider clicks
-                for i, rect in enumerate(self.slider_rects):
-                    if rect.collidepoint(mouse_pos) and i < len(self.options) - 1:
-                        option = self.options[i]
-                        if "min" in option and "max" in option and not option.get("toggle", False):
-                            self.dragging_slider = (i, rect, option["min"], option["max"])
-                            self.handle_slider_drag(i, rect, mouse_pos, option["min"], option["max"])
-                            break
-                
-                # Check toggle clicks
-                for i, rect in enumerate(self.toggle_rects):
-                    if rect.collidepoint(mouse_pos) and i < len(self.options) - 1:
-                        option = self.options[i]
-                        if option.get("toggle", False):
-                            option["value"] = not option["value"]
-                            self.apply_setting(option["name"], option["value"])
-                            self.game.assets.play_sound("select")
-                            break
-            
-            # Mouse button release
-            elif event.type == pygame.MOUSEBUTTONUP:
-                self.dragging_slider = None
+                        self.game.assets.play_sound("hover")
+
+    def on_mouse_down(self, event):
+        if event.button != 1:  # Left click only
+            return
+        mouse_pos = event.pos
+
+        # Check option text clicks
+        for i, rect in enumerate(self.option_rects):
+            if rect.collidepoint(mouse_pos):
+                self.selected = i
+                self.select_option()
+                self.game.assets.play_sound("select")
+                break
+
+        # Check slider clicks
+        for i, rect in enumerate(self.slider_rects):
+            if rect.collidepoint(mouse_pos) and i < len(self.options) - 1:
+                option = self.options[i]
+                if "min" in option and "max" in option and not option.get("toggle", False):
+                    self.dragging_slider = (i, rect, option["min"], option["max"])
+                    self.handle_slider_drag(i, rect, mouse_pos, option["min"], option["max"])
+                    break
+
+        # Check toggle clicks
+        for i, rect in enumerate(self.toggle_rects):
+            if rect.collidepoint(mouse_pos) and i < len(self.options) - 1:
+                option = self.options[i]
+                if option.get("toggle", False):
+                    option["value"] = not option["value"]
+                    self.apply_setting(option["name"], option["value"])
+                    self.game.assets.play_sound("select")
+                    break
+                elif "choices" in option:
+                    self.cycle_choice(option, 1)
+                    self.game.assets.play_sound("select")
+                    break
+
+    def on_mouse_up(self, event):
+        self.dragging_slider = None
 
     def handle_slider_drag(self, idx, slider_rect, mouse_pos, min_val, max_val):
         """Handle dragging a slider with the mouse"""
@@ -147,6 +167,8 @@ class OptionsState(GameState):
             if "toggle" in option and option["toggle"]:
                 option["value"] = not option["value"]
                 self.apply_setting(option["name"], option["value"])
+            elif "choices" in option:
+                self.cycle_choice(option, direction)
             elif "min" in option and "max" in option:
                 old_value = option["value"]
                 step = option.get("step", 1)
@@ -158,6 +180,13 @@ class OptionsState(GameState):
                     return True
         return False
 
+    def cycle_choice(self, option, direction):
+        """Step a multiple choice option to the next (or previous) value."""
+        choices = option["choices"]
+        index = choices.index(option["value"]) if option["value"] in choices else 0
+        option["value"] = choices[(index + direction) % len(choices)]
+        self.apply_setting(option["name"], option["value"])
+
     def apply_setting(self, name, value):
         if name == "Music Volume":
             self.game.settings["music_volume"] = value
@@ -168,6 +197,15 @@ class OptionsState(GameState):
         elif name == "Fullscreen":
             self.game.settings["fullscreen"] = value
             self.game.toggle_fullscreen(value)
+        elif name == "Quality":
+            self.game.settings["quality"] = value
+            self.game.quality.set_preset(value)
+        elif name == "Render Resolution":
+            self.game.settings["render_resolution"] = value
+            self.game.set_render_resolution(value)
+        elif name == "Native HUD":
+            self.game.settings["native_hud"] = value
+            self.game.native_hud = value
 
     def select_option(self):
         if self.selected == len(self.options) - 1:  # "Back" option
@@ -177,19 +215,25 @@ class OptionsState(GameState):
             if "toggle" in option and option["toggle"]:
                 option["value"] = not option["value"]
                 self.apply_setting(option["name"], option["value"])
+            elif "choices" in option:
+                self.cycle_choice(option, 1)
 
     def save_and_exit(self):
         # Save settings
         if self.game.save_settings():
             # Return to previous state or menu
             if self.previous_state:
-                self.game.state = self.previous_state
+                self.game.pop_state()
             else:
-                self.game.change_state("menu")
+                self.game.change_state(STATE_MENU)
 
     def update(self):
         pass
 
+    def is_idle(self):
+        # Static screen: only redraw when input arrives
+        return True
+
     def render(self, screen):
         screen.fill(UI_BACKGROUND)
         
@@ -204,7 +248,7 @@ class OptionsState(GameState):
         screen.blit(title, title_rect)
         
         # Options
-        menu_y = MENU_START_Y
+        menu_y = OPTIONS_START_Y
         for i, option in enumerate(self.options):
             color = self.selected_color if i == self.selected else self.normal_color
             
@@ -227,6 +271,13 @@ class OptionsState(GameState):
                     # Store toggle rect for mouse interaction
                     toggle_rect = value_rect.inflate(40, 20)
                     self.toggle_rects.append(toggle_rect)
+                elif "choices" in option:
+                    value_text = self.font.render(f"< {option['value']} >", True, color)
+                    value_rect = value_text.get_rect(midleft=(screen.get_width() // 2 + 20, menu_y + i * MENU_SPACING))
+                    screen.blit(value_text, value_rect)
+                    
+                    # Clicking the value cycles through the choices like a toggle
+                    self.toggle_rects.append(value_rect.inflate(40, 20))
                 else:
                     value_text = self.font.render(str(option["value"]), True, color)
                     value_rect = value_text.get_rect(midleft=(screen.get_width() // 2 + 20, menu_y + i * MENU_SPACING))
@@ -1,107 +1,135 @@
 from src.game_states.game_state import GameState
 import pygame
-import os
+from src.surface_factory import surface_factory
 from src.constants import (
-    WHITE, YELLOW, DEFAULT_FONT, NORMAL_FONT_SIZE, HEADING_FONT_SIZE,
-    MENU_START_Y, MENU_SPACING, FONT_DIR, UI_ACCENT, UI_BACKGROUND
+    WHITE, YELLOW, NORMAL_FONT_SIZE, HEADING_FONT_SIZE, SMALL_FONT_SIZE,
+    MENU_START_Y, MENU_SPACING, UI_ACCENT, UI_BACKGROUND, STATE_MENU, STATE_OPTIONS
 )
 
 class PausedState(GameState):
     
-    def __init__(self, game, **kwargs):
+    def __init__(self, game):
         super().__init__(game)
 
-        self.previous_state = kwargs.get("previous_state", game.state)
+        self.previous_state = None
 
         self.options = ["Resume", "Options", "Quit to Menu", "Quit"]
         self.selected = 0
         self.option_rects = []  # Store rectangles for mouse interaction
 
-        # Use custom font
-        try:
-            self.font = pygame.font.Font(DEFAULT_FONT, NORMAL_FONT_SIZE)
-            self.title_font = pygame.font.Font(DEFAULT_FONT, HEADING_FONT_SIZE)
-            self.instruction_font = pygame.font.Font(DEFAULT_FONT, 24)
-        except Exception as e:
-            print(f"Error loading custom font: {e}")
-            # Fallback to original font loading
-            try:
-                font_path = os.path.join(FONT_DIR, DEFAULT_FONT)
-                self.font = pygame.font.Font(font_path, NORMAL_FONT_SIZE)
-                self.title_font = pygame.font.Font(font_path, HEADING_FONT_SIZE)
-                self.instruction_font = pygame.font.Font(font_path, 24)
-            except Exception as e:
-                print(f"Error loading fallback font: {e}")
-                self.font = pygame.font.Font(None, NORMAL_FONT_SIZE)
-                self.title_font = pygame.font.Font(None, HEADING_FONT_SIZE)
-                self.instruction_font = pygame.font.Font(None, 24)
+        # Fonts come from the asset manager (loaded once at startup)
+        self.font = game.assets.get_font("main", NORMAL_FONT_SIZE)
+        self.title_font = game.assets.get_font("main", HEADING_FONT_SIZE)
+        self.instruction_font = game.assets.get_font("main", SMALL_FONT_SIZE)
             
         self.selected_color = YELLOW
         self.normal_color = WHITE
 
         # Create semi-transparent overlay
-        self.overlay = pygame.Surface((self.game.screen.get_width(), self.game.screen.get_height()))
+        self.overlay = surface_factory.create(self.game.screen.get_size(), fill=UI_BACKGROUND)
         self.overlay.set_alpha(120)
-        self.overlay.fill(UI_BACKGROUND)
 
-    def handle_events(self, events):
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    self.selected = (self.selected - 1) % len(self.options)
-                    self.game.assets.play_sound("hover")
-                elif event.key == pygame.K_DOWN:
-                    self.selected = (self.selected + 1) % len(self.options)
+        # Frozen copy of the paused game with the overlay already applied
+        self.snapshot = None
+        self.snapshot_key = None
+
+        self.event_handlers = {
+            pygame.KEYDOWN: self.on_key_down,
+            pygame.MOUSEMOTION: self.on_mouse_motion,
+            pygame.MOUSEBUTTONDOWN: self.on_mouse_down
+        }
+
+    def enter(self, previous_state=None, **kwargs):
+        # The state we paused is drawn underneath the menu. By the time enter() runs this state
+        # is already on top of the stack, so the paused one is the state beneath it.
+        if previous_state is None:
+            stack = self.game.states.stack
+            if len(stack) < 2 or stack[-2] is self:
+                raise ValueError("The pause screen needs a state to pause")
+            previous_state = stack[-2]
+        self.previous_state = previous_state
+        self.selected = 0
+        
+        # Capture a fresh backdrop on the first frame
+        self.snapshot = None
+
+    def exit(self):
+        # Don't hold on to a screen-sized surface while not paused
+        self.snapshot = None
+
+    def capture_snapshot(self, screen):
+        """Render the paused game once and dim it, to be reused as the backdrop every frame."""
+        size = screen.get_size()
+        if self.overlay.get_size() != size:
+            self.overlay = surface_factory.create(size, fill=UI_BACKGROUND)
+            self.overlay.set_alpha(120)
+
+        self.snapshot = surface_factory.create(size)
+        self.previous_state.render(self.snapshot)
+        self.snapshot.blit(self.overlay, (0, 0))
+        self.snapshot_key = (size, self.game.display_generation)
+
+    def on_key_down(self, event):
+        if event.key == pygame.K_UP:
+            self.selected = (self.selected - 1) % len(self.options)
+            self.game.assets.play_sound("hover")
+        elif event.key == pygame.K_DOWN:
+            self.selected = (self.selected + 1) % len(self.options)
+            self.game.assets.play_sound("hover")
+        elif event.key == pygame.K_RETURN:
+            self.select_option()
+            self.game.assets.play_sound("select")
+        elif event.key == pygame.K_ESCAPE:
+            self.resume_game()
+            self.game.assets.play_sound("back")
+
+    def on_mouse_motion(self, event):
+        # Hover effect
+        for i, rect in enumerate(self.option_rects):
+            if rect.collidepoint(event.pos):
+                if self.selected != i:
+                    self.selected = i
                     self.game.assets.play_sound("hover")
-                elif event.key == pygame.K_RETURN:
-                    self.select_option()
-                    self.game.assets.play_sound("select")
-                elif event.key == pygame.K_ESCAPE:
-                    self.resume_game()
-                    self.game.assets.play_sound("back")
-            
-            # Handle mouse movement for hover effect
-            elif event.type == pygame.MOUSEMOTION:
-                mouse_pos = pygame.mouse.get_pos()
-                for i, rect in enumerate(self.option_rects):
-                    if rect.collidepoint(mouse_pos):
-                        if self.selected != i:
-                            self.selected = i
-                            self.game.assets.play_sound("hover")
-            
-            # Handle mouse clicks
-            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click
-                mouse_pos = pygame.mouse.get_pos()
-                for i, rect in enumerate(self.option_rects):
-                    if rect.collidepoint(mouse_pos):
-                        self.selected = i
-                        self.select_option()
-                        self.game.assets.play_sound("select")
-                        break
+
+    def on_mouse_down(self, event):
+        if event.button != 1:  # Left click only
+            return
+        for i, rect in enumerate(self.option_rects):
+            if rect.collidepoint(event.pos):
+                self.selected = i
+                self.select_option()
+                self.game.assets.play_sound("select")
+                break
 
     def select_option(self):
         if self.options[self.selected] == "Resume":
             self.resume_game()
         elif self.options[self.selected] == "Options":
-            self.game.change_state("options", previous_state=self)
+            self.game.push_state(STATE_OPTIONS, previous_state=self)
         elif self.options[self.selected] == "Quit to Menu":
             self.game.reset_game()
-            self.game.change_state("menu")
+            self.game.change_state(STATE_MENU)
         elif self.options[self.selected] == "Quit":
             self.game.running = False
 
     def resume_game(self):
-        self.game.state = self.previous_state
+        self.game.pop_state()
 
     def update(self):
         pass
 
+    def is_idle(self):
+        # Static screen: only redraw when input arrives
+        return True
+
     def render(self, screen):
-        # Render the previous state first (game screen)
-        self.previous_state.render(screen)
+        # The game underneath is frozen, so only re-render it when the display changed
+        snapshot_key = (screen.get_size(), self.game.display_generation)
+        if self.snapshot is None or self.snapshot_key != snapshot_key:
+            self.capture_snapshot(screen)
 
-        # Apply semi-transparent overlay
-        screen.blit(self.overlay, (0, 0))
+        # Draw the dimmed game screen
+        screen.blit(self.snapshot, (0, 0))
 
         # Render pause title
         title = self.title_font.render("PAUSED", True, UI_ACCENT)
@@ -1,9 +1,37 @@
 from src.game_states.game_state import GameState
 import pygame
-from src.constants import STATE_GAME_OVER, SCREEN_WIDTH, SCREEN_HEIGHT, MAP_WIDTH, MAP_HEIGHT
+from src.constants import STATE_GAME_OVER, STATE_PAUSE, MAP_WIDTH, MAP_HEIGHT, FRAME_BUDGET_MS, PROFILER_REFRESH_FRAMES
 
 class PlayState(GameState):
-    
+
+    # Character ability configuration
+    CHARACTER_ABILITIES = {
+        "ezreal": {
+            "primary": "mystic_shot",
+            "secondary": "essence_flux",
+            "movement": "arcane_shift",
+            "ultimate": "trueshot_barrage",
+            "cooldowns": {
+                "primary": ("q_cooldown", "q_cooldown_max"),
+                "secondary": ("w_cooldown", "w_cooldown_max"),
+                "movement": ("e_cooldown", "e_cooldown_max"),
+                "ultimate": ("r_cooldown", "r_cooldown_max")
+            }
+        },
+        "ashe": {
+            "primary": "attack",  # Ashe uses basic attack as primary
+            "secondary": "volley",
+            "movement": "hawkshot",
+            "ultimate": "enchanted_arrow",
+            "cooldowns": {
+                "primary": ("attack_cooldown", "attack_cooldown_max"),
+                "secondary": ("volley_cooldown", "volley_cooldown_max"),
+                "movement": ("hawkshot_cooldown", "hawkshot_cooldown_max"),
+                "ultimate": ("ultimate_cooldown", "ultimate_cooldown_max")
+            }
+        }
+    }
+
     def __init__(self, game):
         super().__init__(game)
         self.player = game.player
@@ -22,116 +50,127 @@ class PlayState(GameState):
         self.movement_indicator_pos = (0, 0)
         self.movement_indicator_timer = 0
         self.movement_indicator_max_time = 60  # 1 second at 60 FPS
-        
-        # Character ability configuration
-        self.character_abilities = {
-            "ezreal": {
-                "primary": "mystic_shot",
-                "secondary": "essence_flux",
-                "movement": "arcane_shift",
-                "ultimate": "trueshot_barrage",
-                "cooldowns": {
-                    "primary": ("q_cooldown", "q_cooldown_max"),
-                    "secondary": ("w_cooldown", "w_cooldown_max"),
-                    "movement": ("e_cooldown", "e_cooldown_max"),
-                    "ultimate": ("r_cooldown", "r_cooldown_max")
-                }
-            },
-            "ashe": {
-                "primary": "attack",  # Ashe uses basic attack as primary
-                "secondary": "volley",
-                "movement": "hawkshot",
-                "ultimate": "enchanted_arrow",
-                "cooldowns": {
-                    "primary": ("attack_cooldown", "attack_cooldown_max"),
-                    "secondary": ("volley_cooldown", "volley_cooldown_max"),
-                    "movement": ("hawkshot_cooldown", "hawkshot_cooldown_max"),
-                    "ultimate": ("ultimate_cooldown", "ultimate_cooldown_max")
-                }
-            }
+
+        # Cached frame profiler panel
+        self.profiler_panel = None
+        self.profiler_panel_age = 0
+
+        self.event_handlers = {
+            pygame.MOUSEBUTTONDOWN: self.on_mouse_down,
+            pygame.KEYDOWN: self.on_key_down
         }
         
+    def enter(self, **kwargs):
+        # The game may have been reset since the last visit, so pick up its current objects
+        self.player = self.game.player
+        self.enemy_manager = self.game.enemy_manager
+        self.score = self.game.score
+
+        # Clear the movement indicator from the previous run
+        self.movement_indicator_active = False
+        self.movement_indicator_timer = 0
+        
         # Start gameplay music
-        self.game.assets.play_music("gameplay_music")
+        self.game.assets.play_music("game_music")
         
-    def handle_events(self, events):
-        for event in events:
-            # Point and click right click movement
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 3:  # Right click
-                    self._handle_movement()
-                elif event.button == 1:  # Left click
-                    self._handle_ability("primary")
-                
+        # Have the menu track ready for when the game ends
+        self.game.assets.prefetch_music("menu_music")
+        
+    def on_mouse_down(self, event):
+        # Point and click right click movement
+        if event.button == 3:  # Right click
+            self._handle_movement(event.pos)
+        elif event.button == 1:  # Left click
+            self._handle_ability("primary", event.pos)
+
+    def on_key_down(self, event):
+        # Key presses carry no position, so aim at where the cursor was when the key went down
+        mouse_pos = self.game.events.mouse_pos
 
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.game.change_state("pause", previous_state=self)
-                if event.key == pygame.K_d:
-                    self._handle_flash()
-                if event.key == pygame.K_q:
-                    # Q key for primary ability
-                    self._handle_ability("primary")
-                if event.key == pygame.K_w:
-                    # W key for secondary ability
-                    self._handle_ability("secondary")
-                if event.key == pygame.K_e:
-                    # E key for movement ability
-                    self._handle_ability("movement")
-                if event.key == pygame.K_r:
-                    # R key for ultimate ability
-                    self._handle_ability("ultimate")
-                if event.key == pygame.K_g:
-                    # Toggle grid display
-                    self.draw_grid = not self.draw_grid
+        if event.key == pygame.K_ESCAPE:
+            self.game.push_state(STATE_PAUSE, previous_state=self)
+        elif event.key == pygame.K_d:
+            self._handle_flash(mouse_pos)
+        elif event.key == pygame.K_q:
+            # Q key for primary ability
+            self._handle_ability("primary", mouse_pos)
+        elif event.key == pygame.K_w:
+            # W key for secondary ability
+            self._handle_ability("secondary", mouse_pos)
+        elif event.key == pygame.K_e:
+            # E key for movement ability
+            self._handle_ability("movement", mouse_pos)
+        elif event.key == pygame.K_r:
+            # R key for ultimate ability
+            self._handle_ability("ultimate", mouse_pos)
+        elif event.key == pygame.K_g:
+            # Toggle grid display
+            self.draw_grid = not self.draw_grid
+        elif event.key == pygame.K_p:
+            # Toggle the frame profiler overlay
+            self.game.profiler.toggle()
+            self.profiler_panel = None
                       
-    def _handle_movement(self):
-        # Get mouse position in screen coordinates
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        
+    def _handle_movement(self, mouse_pos):
+        # Convert screen coordinates to world coordinates (accounts for the render scale)
+        world_x, world_y = self.game.camera.screen_to_world(mouse_pos)
+        self.perform("move", world_x, world_y)
+    
+    def _handle_flash(self, mouse_pos):
+        # Convert screen coordinates to world coordinates
+        world_x, world_y = self.game.camera.screen_to_world(mouse_pos)
+        self.perform("flash", world_x, world_y)
+    
+    def _handle_ability(self, ability_type, mouse_pos):
+        """Generic ability handler for any character ability, aimed at a screen position"""
         # Convert to world coordinates
-        world_x = mouse_x + self.game.camera.x
-        world_y = mouse_y + self.game.camera.y
-        
+        world_x, world_y = self.game.camera.screen_to_world(mouse_pos)
+        return self.perform(ability_type, world_x, world_y)
+
+    def perform(self, action, world_x, world_y):
+        """Carry out a player command ("move", "flash" or an ability type) aimed at a world position.
+
+        Every gameplay input goes through here, so it can be recorded and
+        replayed without the camera or screen that produced it.
+        """
+        if self.game.input_recorder:
+            world_x, world_y = self.game.input_recorder.record(action, world_x, world_y)
+
+        if action == "move":
+            self._move_to(world_x, world_y)
+            return True
+        if action == "flash":
+            return self._flash_to(world_x, world_y)
+        return self._use_ability(action, world_x, world_y)
+
+    def _move_to(self, world_x, world_y):
         # Set destination in world coordinates
         self.player.set_destination(world_x, world_y)
+        self.game.latency.effect("move")
         
         # Set movement indicator
         self.movement_indicator_active = True
         self.movement_indicator_pos = (world_x, world_y)
         self.movement_indicator_timer = self.movement_indicator_max_time
-    
-    def _handle_flash(self):
-        # Get mouse position in screen coordinates
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        
-        # Convert to world coordinates
-        world_x = mouse_x + self.game.camera.x
-        world_y = mouse_y + self.game.camera.y
-        
+
+    def _flash_to(self, world_x, world_y):
         flash_success = self.player.flash(world_x, world_y)
         if flash_success:
+            self.game.latency.effect("flash")
             # Play flash sound effect if you have one
             self.game.assets.play_sound("flash")
-    
-    def _handle_ability(self, ability_type):
-        """Generic ability handler for any character ability"""
-        # Get mouse position in screen coordinates
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        
-        # Convert to world coordinates
-        world_x = mouse_x + self.game.camera.x
-        world_y = mouse_y + self.game.camera.y
-        
+        return flash_success
+
+    def _use_ability(self, ability_type, world_x, world_y):
         # Get the current character
         character = self.game.selected_character
         
         # Check if we have ability config for this character
-        if character not in self.character_abilities:
+        if character not in self.CHARACTER_ABILITIES:
             return False
             
         # Get the ability name for this character and ability type
-        ability_name = self.character_abilities[character].get(ability_type)
+        ability_name = self.CHARACTER_ABILITIES[character].get(ability_type)
         if not ability_name:
             return False
             
@@ -145,6 +184,7 @@ class PlayState(GameState):
         
         # Play sound if successful
         if ability_success:
+            self.game.latency.effect(ability_type)
             # Try character-specific sound first
             sound_key = f"{character}_{ability_type[0]}_sound"  # e.g., "ezreal_p_sound"
             
@@ -202,26 +242,30 @@ class PlayState(GameState):
                     break
 
     def update(self): 
+        profiler = self.game.profiler
 
         # Update player
-        self.player.update()
-        
-        # Keep player within map bounds
-        self.player.x = max(0, min(self.player.x, MAP_WIDTH - self.player.width))
-        self.player.y = max(0, min(self.player.y, MAP_HEIGHT - self.player.height))
+        with profiler.scope("update.player"):
+            self.player.update()
+            
+            # Keep player within map bounds
+            self.player.x = max(0, min(self.player.x, MAP_WIDTH - self.player.width))
+            self.player.y = max(0, min(self.player.y, MAP_HEIGHT - self.player.height))
         
         # Update camera to follow player
         self.game.camera.update(
             self.player.x + self.player.width // 2,
-            self.player.y + self.player.height // 2,
-            SCREEN_WIDTH, SCREEN_HEIGHT
+            self.player.y + self.player.height // 2
         )
         
         # Update all enemies
-        self.enemy_manager.update()
+        with profiler.scope("update.enemies"):
+            self.enemy_manager.update()
         
         # Check for collisions
-        self.check_collisions()
+        with profiler.scope("update.collisions"):
+            self.check_collisions()
+        profiler.set_count("player projectiles", len(self.player.projectiles))
         
         # Update movement indicator
         if self.movement_indicator_timer > 0:
@@ -235,13 +279,65 @@ class PlayState(GameState):
             self.game.change_state(STATE_GAME_OVER, score=self.score)
 
     def render(self, screen):
+        # The world may be drawn at a lower resolution and scaled up afterwards
+        target = self.game.render_target
+        native_hud = target is not None and self.game.native_hud
+        world = target if target is not None else screen
+        self._draw_world(world)
+
+        # Draw UI elements (these are in screen coordinates, not world coordinates)
+        profiler = self.game.profiler
+        if not native_hud:
+            with profiler.scope("render.hud"):
+                self._draw_ui(world)
+        if target is not None:
+            with profiler.scope("render.scale"):
+                pygame.transform.scale(target, screen.get_size(), screen)
+        if native_hud:
+            with profiler.scope("render.hud"):
+                self._draw_ui(screen)
+
+        # Frame profiler overlay (always at full resolution so it stays readable)
+        if profiler.enabled and profiler.show_overlay:
+            with profiler.scope("render.profiler"):
+                self._draw_profiler(screen)
+
+    def _draw_world(self, screen):
+        profiler = self.game.profiler
+
         # Clear screen
         screen.fill((20, 20, 20))  # Dark background
         
-        # Draw grid if enabled
-        if self.draw_grid:
-            self._draw_grid(screen)
+        # Draw grid if enabled (and the quality tier allows it)
+        if self.draw_grid and self.game.quality.allows("grid"):
+            with profiler.scope("render.grid"):
+                self._draw_grid(screen)
+        
+        with profiler.scope("render.indicator"):
+            self._draw_movement_indicator(screen)
         
+        # Use the enemy manager's draw method instead of manually drawing enemies
+        with profiler.scope("render.enemies"):
+            self.enemy_manager.draw(screen)
+        
+        # Draw player with camera offset
+        with profiler.scope("render.player"):
+            player_pos = self.game.camera.apply(self.player)
+            screen.blit(self.player.image, player_pos)
+        
+        # Draw projectiles with camera offset
+        with profiler.scope("render.projectiles"):
+            for projectile in self.player.get_active_projectiles():
+                if projectile.active:
+                    # Get camera-adjusted rect
+                    proj_rect = self.game.camera.apply_rect(projectile.rect)
+                    # If the projectile has an image, use it; otherwise use a rectangle
+                    if hasattr(projectile, 'image') and projectile.image:
+                        screen.blit(projectile.image, proj_rect)
+                    else:
+                        pygame.draw.rect(screen, projectile.color, proj_rect)
+
+    def _draw_movement_indicator(self, screen):
         # Draw movement indicator if active
         if self.movement_indicator_active:
             # Get screen position for the indicator
@@ -288,47 +384,27 @@ class PlayState(GameState):
                 indicator_surface,
                 (indicator_screen_x - indicator_size // 2, indicator_screen_y - indicator_size // 2)
             )
-        
-        # Use the enemy manager's draw method instead of manually drawing enemies
-        self.enemy_manager.draw(screen)
-        
-        # Draw player with camera offset
-        player_pos = self.game.camera.apply(self.player)
-        screen.blit(self.player.image, player_pos)
-        
-        # Draw projectiles with camera offset
-        for projectile in self.player.get_active_projectiles():
-            if projectile.active:
-                # Get camera-adjusted rect
-                proj_rect = self.game.camera.apply_rect(projectile.rect)
-                # If the projectile has an image, use it; otherwise use a rectangle
-                if hasattr(projectile, 'image') and projectile.image:
-                    screen.blit(projectile.image, proj_rect)
-                else:
-                    pygame.draw.rect(screen, projectile.color, proj_rect)
-        
-        # Draw UI elements (these are in screen coordinates, not world coordinates)
-        self._draw_ui(screen)
 
-    
     def _draw_grid(self, screen):
         # Draw a grid to visualize the map
         grid_color = (50, 50, 50)  # Dark gray
         grid_spacing = 200  # Space between grid lines
         
+        view_width, view_height = screen.get_size()
+        
         # Vertical lines
         for x in range(0, MAP_WIDTH, grid_spacing):
-            if 0 <= x - self.game.camera.x <= SCREEN_WIDTH:
+            if 0 <= x - self.game.camera.x <= view_width:
                 pygame.draw.line(screen, grid_color, 
                                 (x - self.game.camera.x, 0), 
-                                (x - self.game.camera.x, SCREEN_HEIGHT))
+                                (x - self.game.camera.x, view_height))
         
         # Horizontal lines
         for y in range(0, MAP_HEIGHT, grid_spacing):
-            if 0 <= y - self.game.camera.y <= SCREEN_HEIGHT:
+            if 0 <= y - self.game.camera.y <= view_height:
                 pygame.draw.line(screen, grid_color, 
                                 (0, y - self.game.camera.y), 
-                                (SCREEN_WIDTH, y - self.game.camera.y))
+                                (view_width, y - self.game.camera.y))
                                 
         # Draw map boundaries
         boundary_color = (100, 100, 255)  # Light blue
@@ -338,7 +414,7 @@ class PlayState(GameState):
     
     def _draw_ui(self, screen):
         # Example of drawing score
-        font = pygame.font.Font(None, 36)
+        font = self.game.assets.get_font("default", 36)
         score_text = font.render(f"Score: {self.score}", True, (255, 255, 255))
         screen.blit(score_text, (10, 10))
         
@@ -353,13 +429,76 @@ class PlayState(GameState):
         # Draw character name
         character_name = self.game.selected_character.capitalize()
         char_text = font.render(f"Character: {character_name}", True, (255, 255, 255))
-        screen.blit(char_text, (SCREEN_WIDTH - 250, 10))
+        screen.blit(char_text, (screen.get_width() - 250, 10))
             
         # Display current position and map size
         pos_text = font.render(f"Pos: ({int(self.player.x)}, {int(self.player.y)}) | Map: {MAP_WIDTH}x{MAP_HEIGHT}", 
                               True, (200, 200, 200))
-        screen.blit(pos_text, (10, SCREEN_HEIGHT - 40))
+        screen.blit(pos_text, (10, screen.get_height() - 40))
     
+    def _draw_profiler(self, screen):
+        """Draw the frame profiler panel, rebuilding it a few times a second"""
+        self.profiler_panel_age += 1
+        if self.profiler_panel is None or self.profiler_panel_age >= PROFILER_REFRESH_FRAMES:
+            # Rendering all the text every frame would cost more than most of the phases it shows
+            self.profiler_panel = self._build_profiler_panel()
+            self.profiler_panel_age = 0
+        screen.blit(self.profiler_panel, (screen.get_width() - self.profiler_panel.get_width() - 10, 110))
+
+    def _build_profiler_panel(self):
+        """Render per-phase frame times, entity counts and a frame time sparkline"""
+        profiler = self.game.profiler
+        font = self.game.assets.get_font("default", 24)
+        rows = profiler.report()
+        line_height = 18
+        width = 300
+        graph_height = 60
+        height = (len(rows) + len(profiler.counts) + 2) * line_height + graph_height + 20
+
+        # Background panel
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+
+        text_x = 8
+        text_y = 6
+        frame_avg = sum(profiler.frame_times) / max(1, len(profiler.frame_times))
+        text = font.render(f"Frame {frame_avg:.2f} ms (budget {FRAME_BUDGET_MS:.1f})", True, (255, 255, 0))
+        panel.blit(text, (text_x, text_y))
+        text_y += line_height
+
+        # One row per phase, sub-phases indented under their parent
+        for name, average, peak in rows:
+            depth = name.count(".")
+            label = name.rsplit(".", 1)[-1]
+            text = font.render(f"{'  ' * depth}{label}", True, (220, 220, 220))
+            panel.blit(text, (text_x, text_y))
+            text = font.render(f"{average:.2f} / {peak:.2f}", True, (220, 220, 220))
+            panel.blit(text, (width - text.get_width() - 8, text_y))
+            text_y += line_height
+
+        # Entity counts
+        text_y += line_height // 2
+        for name, value in profiler.counts.items():
+            text = font.render(f"{name}: {value}", True, (150, 200, 255))
+            panel.blit(text, (text_x, text_y))
+            text_y += line_height
+
+        # Sparkline of recent frame times, scaled so the top is twice the budget
+        graph_y = height - graph_height - 8
+        graph_width = width - 16
+        budget_y = graph_y + graph_height // 2
+        pygame.draw.line(panel, (120, 60, 60), (text_x, budget_y), (text_x + graph_width, budget_y))
+        frame_times = list(profiler.frame_times)
+        if len(frame_times) > 1:
+            step = graph_width / (profiler.window - 1)
+            points = []
+            for i, frame_ms in enumerate(frame_times):
+                ratio = min(frame_ms / (FRAME_BUDGET_MS * 2), 1.0)
+                points.append((text_x + i * step, graph_y + graph_height - ratio * graph_height))
+            pygame.draw.lines(panel, (0, 255, 0), False, points)
+
+        return panel
+
     def _draw_ability_cooldowns(self, screen):
         """Draw cooldown indicators for abilities"""
         # Define ability slots with their display properties
@@ -371,7 +510,7 @@ class PlayState(GameState):
             {"pos": (210, 80), "color": (255, 100, 50), "label": "R", "ability_type": "ultimate"}
         ]
         
-        font = pygame.font.Font(None, 24)
+        font = self.game.assets.get_font("default", 24)
         character = self.game.selected_character
         
         # Draw each ability slot
@@ -385,10 +524,10 @@ class PlayState(GameState):
                     cooldown = getattr(self.player, slot["key"])
                     cooldown_max = getattr(self.player, slot["max_key"])
             # For abilities, use character config
-            elif "ability_type" in slot and character in self.character_abilities:
+            elif "ability_type" in slot and character in self.CHARACTER_ABILITIES:
                 ability_type = slot["ability_type"]
-                if ability_type in self.character_abilities[character]["cooldowns"]:
-                    cooldown_key, cooldown_max_key = self.character_abilities[character]["cooldowns"][ability_type]
+                if ability_type in self.CHARACTER_ABILITIES[character]["cooldowns"]:
+                    cooldown_key, cooldown_max_key = self.CHARACTER_ABILITIES[character]["cooldowns"][ability_type]
                     if hasattr(self.player, cooldown_key):
                         cooldown = getattr(self.player, cooldown_key)
                         cooldown_max = getattr(self.player, cooldown_max_key)
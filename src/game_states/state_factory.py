@@ -3,7 +3,8 @@ from src.constants import STATE_CHAMPION_SELECT, STATE_GAME_OVER, STATE_MENU, ST
 class StateFactory:
 
     @staticmethod
-    def create_state(state_name, game, **kwargs):
+    def create_state(state_name, game):
+        """Build a state object. Per-visit setup happens in the state's enter()."""
 
         if state_name == STATE_MENU:
             from src.game_states.menu_state import MenuState
@@ -23,7 +24,7 @@ class StateFactory:
         
         elif state_name == STATE_GAME_OVER:
             from src.game_states.game_over import GameOverState
-            return GameOverState(game, game.score)
+            return GameOverState(game)
         
         elif state_name == STATE_CHAMPION_SELECT:
             from src.game_states.champion_select_state import ChampionSelectState
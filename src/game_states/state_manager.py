@@ -0,0 +1,51 @@
+from src.game_states.state_factory import StateFactory
+
+class StateManager:
+    """Keeps a stack of game states and reuses each state instance across transitions."""
+
+    def __init__(self, game):
+        self.game = game
+        self.stack = []      # Active states, top of the stack is the current state
+        self.instances = {}  # State name -> state object, built on first use
+
+    @property
+    def current(self):
+        """The state on top of the stack (None if the stack is empty)."""
+        return self.stack[-1] if self.stack else None
+
+    def get_state(self, state_name):
+        """Return the cached instance of a state, creating it the first time it's needed."""
+        state = self.instances.get(state_name)
+        if state is None:
+            state = StateFactory.create_state(state_name, self.game)
+            if state is None:
+                raise ValueError(f"Unknown game state: {state_name}")
+            self.instances[state_name] = state
+        return state
+
+    def change_state(self, state_name, **kwargs):
+        """Leave every state on the stack and switch to a single new one."""
+        while self.stack:
+            self.stack.pop().exit()
+        return self.push_state(state_name, **kwargs)
+
+    def push_state(self, state_name, **kwargs):
+        """Put a state (such as the pause overlay) on top of the current one."""
+        state = self.get_state(state_name)
+        if state in self.stack:
+            # A state instance can only be on the stack once
+            print(f"State '{state_name}' is already active")
+            return state
+
+        self.stack.append(state)
+        state.enter(**kwargs)
+        return state
+
+    def pop_state(self):
+        """Leave the top state and return to the one beneath it."""
+        if len(self.stack) <= 1:
+            print("WARNING: Tried to pop the last game state")
+            return self.current
+
+        self.stack.pop().exit()
+        return self.current
@@ -0,0 +1,92 @@
+# src/latency.py
+import time
+
+def percentile(values, pct):
+    """Linear-interpolated percentile (0-100) of a list of numbers."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class LatencyTracker:
+    """Measures how long player input takes to show up on screen.
+
+    pygame events carry no timestamp, so each batch of input is stamped when
+    it is fetched from the queue. The effect of an input (a destination set,
+    a projectile spawned) is resolved on the next display flip. The time since
+    the previous fetch is kept too, as an upper bound on how long the input
+    sat in the queue before we saw it.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+
+        # Time of the current and previous input fetch
+        self.input_time = None
+        self.previous_input_time = None
+
+        # Effects waiting for the next flip: (kind, input time, time since previous fetch)
+        self.pending = []
+
+        # Measured samples per effect kind: kind -> list of (fetch -> flip ms, queue age bound ms)
+        self.samples = {}
+
+    def inputs_polled(self, now=None):
+        """Call right after fetching input events."""
+        if not self.enabled:
+            return
+        self.previous_input_time = self.input_time
+        self.input_time = now if now is not None else time.perf_counter()
+
+    def effect(self, kind):
+        """Record that input handled this frame changed the game (e.g. "move", "primary")."""
+        if not self.enabled or self.input_time is None:
+            return
+        queue_age = 0.0
+        if self.previous_input_time is not None:
+            queue_age = self.input_time - self.previous_input_time
+        self.pending.append((kind, self.input_time, queue_age))
+
+    def presented(self, now=None):
+        """Call right after the display flip: everything pending is now visible."""
+        if not self.enabled or not self.pending:
+            return
+        now = now if now is not None else time.perf_counter()
+        for kind, input_time, queue_age in self.pending:
+            self.samples.setdefault(kind, []).append(((now - input_time) * 1000, queue_age * 1000))
+        self.pending.clear()
+
+    def report(self):
+        """Return latency percentiles (ms) per effect kind and for all inputs."""
+        groups = dict(self.samples)
+        groups["all"] = [sample for samples in self.samples.values() for sample in samples]
+
+        report = {}
+        for kind, samples in groups.items():
+            if not samples:
+                continue
+            handled = [sample[0] for sample in samples]
+            report[kind] = {
+                "count": len(samples),
+                "p50": percentile(handled, 50),
+                "p95": percentile(handled, 95),
+                "p99": percentile(handled, 99),
+                "max": max(handled),
+                # Worst case including time spent in the queue before the fetch
+                "p95_with_queue": percentile([h + a for h, a in samples], 95)
+            }
+        return report
+
+    def print_report(self):
+        report = self.report()
+        if not report:
+            print("Input latency: no samples")
+            return
+        print("Input latency (ms, fetch -> flip):")
+        for kind, stats in report.items():
+            print(f"  {kind:<10} n={stats['count']:<5} p50={stats['p50']:.1f} p95={stats['p95']:.1f} "
+                  f"p99={stats['p99']:.1f} max={stats['max']:.1f} p95+queue={stats['p95_with_queue']:.1f}")
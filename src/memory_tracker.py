@@ -0,0 +1,144 @@
+# src/memory_tracker.py
+import gc
+import time
+import tracemalloc
+import pygame
+from src.constants import MEMORY_LEAK_WAVES, MEMORY_TOP_ALLOCATIONS
+
+class MemoryTracker:
+    """Snapshots live objects and allocations at the start of each wave to find leaks.
+
+    Each snapshot counts live objects by type after a full collection, plus
+    the player's effect lists (and how many of their entries point at dead
+    enemies). Surfaces and Rects aren't tracked by the garbage collector, so
+    they are counted through the Python objects that reference them. Objects
+    frozen after loading (see GCPolicy) are skipped; they don't change during
+    play. With tracemalloc running, the allocation sites that grew most
+    since the previous wave are listed too.
+
+    A watched count that grows at every one of the last MEMORY_LEAK_WAVES
+    wave transitions is flagged as a possible leak. Snapshots pause the game
+    for a moment, so this is only for diagnostic runs.
+    """
+
+    # Types (by class name) and effect lists checked for steady growth
+    WATCHED = (
+        "Enemy", "Enemy (dead)", "Projectile", "Surface", "Rect",
+        "visual_effects", "slowed_enemies", "marked_enemies", "effects on dead enemies"
+    )
+
+    def __init__(self, game, enabled=False, trace_frames=1):
+        self.game = game
+        self.enabled = enabled
+        self.trace_frames = trace_frames
+        self.history = []  # (wave, counts) per snapshot
+        self.allocations = None  # tracemalloc snapshot from the previous wave
+        self.flagged = set()
+
+    def start(self):
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+
+    def reset(self):
+        """Forget earlier snapshots (a new game starts again from wave 1)."""
+        self.history = []
+        self.allocations = None
+        self.flagged = set()
+
+    def wave_started(self, wave):
+        if self.enabled:
+            self.snapshot(wave)
+
+    def count_objects(self):
+        """Count live objects by class name, including Surfaces/Rects reachable from Python objects."""
+        counts = {}
+        untracked = {}  # id -> object, for types the garbage collector doesn't track
+        for obj in gc.get_objects():
+            name = type(obj).__name__
+            counts[name] = counts.get(name, 0) + 1
+            if name == "Enemy" and not obj.alive:
+                counts["Enemy (dead)"] = counts.get("Enemy (dead)", 0) + 1
+            for referent in gc.get_referents(obj):
+                if isinstance(referent, (pygame.Surface, pygame.Rect)):
+                    untracked[id(referent)] = referent
+        for obj in untracked.values():
+            name = type(obj).__name__
+            counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    def count_effects(self):
+        """Sizes of the player's per-effect lists and entries still holding dead enemies."""
+        player = self.game.player
+        counts = {"visual_effects": len(player.visual_effects)}
+        dead = 0
+        for attribute in ("slowed_enemies", "marked_enemies"):
+            entries = getattr(player, attribute, None)
+            if entries is not None:
+                counts[attribute] = len(entries)
+                dead += sum(1 for entry in entries if not entry["enemy"].alive)
+        counts["effects on dead enemies"] = dead
+        return counts
+
+    def snapshot(self, wave):
+        start = time.perf_counter()
+        gc.collect()
+        counts = self.count_objects()
+        counts.update(self.count_effects())
+        previous = self.history[-1][1] if self.history else None
+        self.history.append((wave, counts))
+
+        print(f"Memory at wave {wave}:")
+        line = ", ".join(f"{name}={counts.get(name, 0)}" for name in self.WATCHED if name in counts)
+        print(f"  {line}")
+
+        if previous is not None:
+            changes = [(counts.get(name, 0) - previous.get(name, 0), name) for name in set(counts) | set(previous)]
+            changes = sorted((change for change in changes if change[0]), reverse=True)[:MEMORY_TOP_ALLOCATIONS]
+            if changes:
+                print("  Biggest changes in live objects: " + ", ".join(f"{name} {change:+d}" for change, name in changes))
+
+        if tracemalloc.is_tracing():
+            self.report_allocations()
+
+        self.check_growth()
+        print(f"  (snapshot took {(time.perf_counter() - start) * 1000:.0f} ms)")
+
+    def report_allocations(self):
+        current, peak = tracemalloc.get_traced_memory()
+        print(f"  Traced memory: {current / 1024:.0f} KiB (peak {peak / 1024:.0f} KiB)")
+        allocations = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),  # The tracker's own history
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>")
+        ))
+        if self.allocations is not None:
+            print("  Allocation sites that grew most since the last wave:")
+            for stat in allocations.compare_to(self.allocations, "lineno")[:MEMORY_TOP_ALLOCATIONS]:
+                if stat.size_diff <= 0:
+                    break
+                frame = stat.traceback[0]
+                print(f"    {frame.filename}:{frame.lineno}: {stat.size_diff / 1024:+.1f} KiB ({stat.count_diff:+d} blocks)")
+        self.allocations = allocations
+
+    def check_growth(self):
+        """Flag watched counts that went up at each of the last MEMORY_LEAK_WAVES transitions."""
+        if len(self.history) <= MEMORY_LEAK_WAVES:
+            return
+        recent = self.history[-(MEMORY_LEAK_WAVES + 1):]
+        for name in self.WATCHED:
+            values = [counts.get(name, 0) for wave, counts in recent]
+            if all(later > earlier for earlier, later in zip(values, values[1:])):
+                self.flagged.add(name)
+                print(f"  Possible leak: {name} grew every wave ({' -> '.join(str(value) for value in values)})")
+
+    def print_report(self):
+        if not self.history:
+            print("Memory tracking: no waves recorded")
+            return
+        names = [name for name in self.WATCHED if any(name in counts for wave, counts in self.history)]
+        print("Live objects at the start of each wave:")
+        print("  wave  " + "  ".join(names))
+        for wave, counts in self.history:
+            print(f"  {wave:<4}  " + "  ".join(str(counts.get(name, 0)).ljust(len(name)) for name in names))
+        if self.flagged:
+            print(f"Possible leaks: {', '.join(sorted(self.flagged))}")
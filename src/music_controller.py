@@ -0,0 +1,124 @@
+# src/music_controller.py
+import io
+import os
+import threading
+import pygame
+from src.constants import MUSIC_FADE_MS
+
+class MusicController:
+    """Plays background music without blocking the frame loop on file I/O.
+
+    Track files are read into memory on a background thread (prefetch), and
+    switching tracks fades the current one out and queues the next one so it
+    starts as soon as the fade finishes.
+    """
+
+    def __init__(self, sound_dir, tracks):
+        self.sound_dir = sound_dir
+        self.tracks = tracks  # track name -> filename (shared with AssetManager.music_tracks)
+
+        # Prefetched file contents
+        self.cache = {}       # filename -> bytes
+        self.loading = set()  # filenames being read on a background thread
+        self.failed = set()   # filenames that couldn't be read or decoded
+        self.lock = threading.Lock()
+
+        # Playback state
+        self.current = None   # Name of the track playing (or queued to play next)
+        self.pending = None   # (track name, loops) waiting for its data
+        self.stream = None    # Keep the in-memory streams alive while SDL reads them
+        self.queued_stream = None
+        self.fade_ms = MUSIC_FADE_MS
+
+    def _filename(self, track_name):
+        return self.tracks.get(track_name, track_name)
+
+    def prefetch(self, track_name):
+        """Start reading a track into memory in the background."""
+        filename = self._filename(track_name)
+        with self.lock:
+            if filename in self.cache or filename in self.loading or filename in self.failed:
+                return
+            self.loading.add(filename)
+
+        thread = threading.Thread(target=self._read_track, args=(filename,), daemon=True)
+        thread.start()
+
+    def _read_track(self, filename):
+        """Background thread: read a music file into the cache."""
+        filepath = os.path.join(self.sound_dir, filename)
+        data = None
+        try:
+            with open(filepath, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            print(f"Error reading music '{filename}': {e}")
+
+        with self.lock:
+            self.loading.discard(filename)
+            if data:
+                self.cache[filename] = data
+            else:
+                self.failed.add(filename)
+
+    def play(self, track_name=None, loops=-1):
+        """Switch to a track. The change happens in update() once the track is in memory."""
+        if track_name is None:
+            # Restart the current track if it stopped
+            track_name = self.current
+            if track_name is None or pygame.mixer.music.get_busy():
+                return
+        elif track_name == self.current:
+            # Already playing, so cancel any switch away from it
+            self.pending = None
+            return
+
+        self.prefetch(track_name)
+        self.pending = (track_name, loops)
+
+    def stop(self):
+        """Stop music and cancel any pending switch."""
+        self.pending = None
+        self.current = None
+        pygame.mixer.music.stop()
+
+    def is_switching(self):
+        """True while a track change is waiting to happen."""
+        return self.pending is not None
+
+    def update(self):
+        """Start a pending track if its data is ready. Called once per frame."""
+        if self.pending is None:
+            return
+
+        track_name, loops = self.pending
+        filename = self._filename(track_name)
+        with self.lock:
+            data = self.cache.get(filename)
+            failed = filename in self.failed
+
+        if failed:
+            print(f"Music track '{track_name}' is unavailable")
+            self.pending = None
+            return
+        if data is None:
+            return  # Still loading
+
+        stream = io.BytesIO(data)
+        try:
+            if pygame.mixer.music.get_busy():
+                # Fade out and let the mixer start the next track when the fade ends
+                pygame.mixer.music.fadeout(self.fade_ms)
+                pygame.mixer.music.queue(stream, loops=loops)
+                self.queued_stream = stream
+            else:
+                pygame.mixer.music.load(stream)
+                pygame.mixer.music.play(loops, fade_ms=self.fade_ms)
+                self.stream = stream
+            self.current = track_name
+            print(f"Playing music track: {track_name}")
+        except pygame.error as e:
+            print(f"Error playing music '{track_name}': {e}")
+            with self.lock:
+                self.failed.add(filename)
+        self.pending = None
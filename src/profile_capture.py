@@ -0,0 +1,186 @@
+# src/profile_capture.py
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from src.game_states.play_state import PlayState
+
+class StackSampler:
+    """Samples the main thread's Python stack from a background thread.
+
+    Uses sys._current_frames(), so it needs no extra packages. Time spent in
+    C code (pygame blits, display flips) is charged to the Python frame
+    that called it. Stacks are counted in the "collapsed" format used by
+    flamegraph tools: "outer;inner;innermost count".
+    """
+
+    def __init__(self, interval_ms=1.0):
+        self.interval = interval_ms / 1000
+        self.thread_id = threading.main_thread().ident
+        self.counts = {}  # Collapsed stack -> samples
+        self.samples = 0
+        self.active = False
+        self.stopped = threading.Event()
+        self.thread = None
+        self.labels = {}  # Code object -> frame label
+        self.switch_interval = None
+
+    def start(self):
+        """Start sampling (the background thread is created on first use)."""
+        self.active = True
+        if self.switch_interval is None:
+            # Make the main thread hand over the GIL promptly; otherwise samples only
+            # land where it releases the GIL itself (display flips) and skew the results
+            self.switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(min(self.switch_interval, self.interval / 4))
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+
+    def pause(self):
+        self.active = False
+        if self.switch_interval is not None:
+            sys.setswitchinterval(self.switch_interval)
+            self.switch_interval = None
+
+    def stop(self):
+        self.pause()
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+
+    def _label(self, code):
+        label = self.labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            self.labels[code] = label.replace(";", ":")
+            label = self.labels[code]
+        return label
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            if not self.active:
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                key = ";".join(reversed(stack))
+                self.counts[key] = self.counts.get(key, 0) + 1
+                self.samples += 1
+
+    def write_collapsed(self, path):
+        with open(path, "w") as f:
+            for stack, count in sorted(self.counts.items()):
+                f.write(f"{stack} {count}\n")
+
+
+class ProfileCapture:
+    """Profiles a window of gameplay and writes the results when the window ends.
+
+    Only frames spent in PlayState are profiled and counted, so menus and
+    pauses don't show up in the results. The window is either a range of
+    waves (inclusive) or a range of gameplay frames. Mode "cprofile" writes
+    a pstats file and a text summary, "sample" writes a collapsed stack
+    file for flamegraphs, and "both" writes all of them.
+    """
+
+    def __init__(self, game, mode="cprofile", waves=None, frames=None, output="profile", sample_interval_ms=1.0):
+        self.game = game
+        self.mode = mode
+        self.waves = waves      # (first wave, last wave) or None
+        self.frames = frames    # (first frame, last frame) of gameplay or None
+        self.output = output
+        self.play_frames = 0    # Frames spent in PlayState so far
+        self.profiled_frames = 0
+        self.running = False
+        self.finished = False
+        self.started_at = None
+        self.elapsed = 0.0
+
+        self.profiler = cProfile.Profile() if mode in ("cprofile", "both") else None
+        self.sampler = StackSampler(sample_interval_ms) if mode in ("sample", "both") else None
+
+    def in_window(self):
+        if self.waves is not None:
+            wave = self.game.enemy_manager.current_wave
+            return self.waves[0] <= wave <= self.waves[1]
+        if self.frames is not None:
+            return self.frames[0] <= self.play_frames <= self.frames[1]
+        return True
+
+    def window_passed(self):
+        if self.waves is not None:
+            return self.game.enemy_manager.current_wave > self.waves[1]
+        if self.frames is not None:
+            return self.play_frames > self.frames[1]
+        return False
+
+    def begin_frame(self):
+        """Start or pause profiling for the frame about to run. Called at the top of each frame."""
+        if self.finished:
+            return
+
+        playing = isinstance(self.game.state, PlayState)
+        if playing:
+            self.play_frames += 1
+            if self.window_passed():
+                self.finish()
+                return
+
+        if playing and self.in_window():
+            self.profiled_frames += 1
+            if not self.running:
+                self._resume()
+        elif self.running:
+            self._pause()
+
+    def _resume(self):
+        self.running = True
+        self.started_at = time.perf_counter()
+        if self.profiler:
+            self.profiler.enable()
+        if self.sampler:
+            self.sampler.start()
+
+    def _pause(self):
+        self.running = False
+        self.elapsed += time.perf_counter() - self.started_at
+        if self.profiler:
+            self.profiler.disable()
+        if self.sampler:
+            self.sampler.pause()
+
+    def finish(self):
+        """Stop profiling and write the output files (also called when the game exits early)."""
+        if self.finished:
+            return
+        if self.running:
+            self._pause()
+        self.finished = True
+        if self.sampler:
+            self.sampler.stop()
+
+        if self.profiled_frames == 0:
+            print("Profile window was never reached, nothing written")
+            return
+
+        written = []
+        if self.profiler:
+            self.profiler.dump_stats(f"{self.output}.prof")
+            summary = io.StringIO()
+            stats = pstats.Stats(self.profiler, stream=summary)
+            stats.sort_stats("cumulative").print_stats(40)
+            with open(f"{self.output}.txt", "w") as f:
+                f.write(summary.getvalue())
+            written += [f"{self.output}.prof", f"{self.output}.txt"]
+        if self.sampler:
+            self.sampler.write_collapsed(f"{self.output}.collapsed")
+            written.append(f"{self.output}.collapsed")
+
+        print(f"Profiled {self.profiled_frames} gameplay frames ({self.elapsed:.1f} s): {', '.join(written)}")
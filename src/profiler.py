@@ -0,0 +1,101 @@
+# src/profiler.py
+import time
+from collections import deque
+from src.constants import PROFILER_WINDOW
+
+class _Scope:
+    """Times one named phase; reused every frame so timing doesn't allocate."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = (time.perf_counter() - self.start) * 1000
+        totals = self.profiler.current
+        totals[self.name] = totals.get(self.name, 0.0) + elapsed
+        return False
+
+
+class _NullScope:
+    """Stands in for a scope while profiling is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class FrameProfiler:
+    """Times named phases of each frame and keeps a rolling window of the results.
+
+    Phases are timed with `with profiler.scope("update.enemies"):` blocks. A
+    dot in the name marks a sub-phase, which the overlay indents under its
+    parent. Time for a phase entered several times in a frame is summed.
+    """
+
+    NULL_SCOPE = _NullScope()
+
+    def __init__(self, window=PROFILER_WINDOW):
+        self.enabled = False
+        self.show_overlay = True  # Benchmarks collect timings without drawing the panel
+        self.window = window
+        self.scopes = {}        # Phase name -> _Scope
+        self.current = {}       # Phase name -> ms so far this frame
+        self.history = {}       # Phase name -> deque of ms per frame
+        self.counts = {}        # Counter name -> latest value (e.g. entity counts)
+        self.frame_times = deque(maxlen=window)
+
+    def scope(self, name):
+        """Context manager timing one phase (does nothing while profiling is off)."""
+        if not self.enabled:
+            return self.NULL_SCOPE
+        scope = self.scopes.get(name)
+        if scope is None:
+            scope = self.scopes[name] = _Scope(self, name)
+        return scope
+
+    def set_count(self, name, value):
+        if self.enabled:
+            self.counts[name] = value
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.reset()
+        return self.enabled
+
+    def reset(self):
+        self.current.clear()
+        self.history.clear()
+        self.counts.clear()
+        self.frame_times.clear()
+
+    def end_frame(self, frame_ms):
+        """Store this frame's phase times in the rolling window."""
+        if not self.enabled:
+            return
+        self.frame_times.append(frame_ms)
+        for name in self.current:
+            if name not in self.history:
+                self.history[name] = deque(maxlen=self.window)
+        for name, samples in self.history.items():
+            samples.append(self.current.get(name, 0.0))
+        self.current.clear()
+
+    def report(self):
+        """Return (phase name, average ms, max ms) over the window, sorted by name so sub-phases follow their parent."""
+        rows = []
+        for name in sorted(self.history):
+            samples = self.history[name]
+            rows.append((name, sum(samples) / len(samples), max(samples)))
+        return rows
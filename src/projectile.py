@@ -88,8 +88,8 @@ class Projectile:
                            (self.x + self.width/2, self.y + self.height/2),
                            (trail_x + self.width/2, trail_y + self.height/2), 3)
     
-    def draw_with_camera(self, surface, camera_pos):
-        """Draw the projectile with camera offset"""
+    def draw_with_camera(self, surface, camera_pos, trail=True):
+        """Draw the projectile with camera offset (the trail can be skipped to save time)"""
         if not self.active:
             return
         
@@ -103,7 +103,7 @@ class Projectile:
         
         # Draw trail with camera offset
         trail_length = min(30, int(self.distance_traveled))
-        if trail_length > 0:
+        if trail and trail_length > 0:
             # Calculate trail position in world coordinates
             trail_x = self.x - self.velocity_x * (trail_length / self.speed)
             trail_y = self.y - self.velocity_y * (trail_length / self.speed)
@@ -0,0 +1,80 @@
+# src/quality_governor.py
+from collections import deque
+from src.constants import (
+    QUALITY_TIERS, QUALITY_WINDOW, QUALITY_HOLD_FRAMES, QUALITY_MAX_HOLD_FRAMES,
+    QUALITY_DOWNGRADE_RATIO, QUALITY_UPGRADE_RATIO, FRAME_BUDGET_MS
+)
+
+class QualityGovernor:
+    """Turns optional visual effects off when frames run over budget, and back on when there's headroom.
+
+    Tiers (QUALITY_TIERS) are ordered from full quality to minimal. In "auto"
+    mode the governor watches the average frame work time over a rolling
+    window and steps one tier at a time. Lowering quality only waits for a
+    full window; raising it waits longer, and the wait doubles each time a
+    raise has to be undone so it doesn't flip back and forth. Any other
+    preset pins a tier.
+    """
+
+    def __init__(self, preset="auto"):
+        self.tier_names = [name for name, features in QUALITY_TIERS]
+        self.frame_times = deque(maxlen=QUALITY_WINDOW)  # Recent frame work times (ms)
+        self.frames_since_change = 0
+        self.raise_hold = QUALITY_HOLD_FRAMES  # Frames to wait before raising quality again
+        self.last_change = None
+        self.tier = 0
+        self.features = {}
+        self.preset = "auto"
+        self.set_preset(preset)
+
+    @property
+    def auto(self):
+        return self.preset == "auto"
+
+    @property
+    def tier_name(self):
+        return self.tier_names[self.tier]
+
+    def set_preset(self, preset):
+        """Use "auto" or pin one of the tier names."""
+        if preset != "auto" and preset not in self.tier_names:
+            print(f"Unknown quality preset '{preset}', using auto")
+            preset = "auto"
+        self.preset = preset
+        self.set_tier(0 if preset == "auto" else self.tier_names.index(preset))
+
+    def set_tier(self, tier):
+        self.tier = max(0, min(tier, len(QUALITY_TIERS) - 1))
+        self.features = QUALITY_TIERS[self.tier][1]
+        self.frame_times.clear()
+        self.frames_since_change = 0
+
+    def allows(self, feature):
+        """True if the optional effect should be drawn at the current tier."""
+        return self.features.get(feature, True)
+
+    def average_frame_time(self):
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times)
+
+    def frame_finished(self, work_ms):
+        """Record how long the last frame's work took (excluding frame pacing)."""
+        self.frame_times.append(work_ms)
+        self.frames_since_change += 1
+        if not self.auto or len(self.frame_times) < QUALITY_WINDOW:
+            return
+
+        average = self.average_frame_time()
+        if average > FRAME_BUDGET_MS * QUALITY_DOWNGRADE_RATIO and self.tier < len(QUALITY_TIERS) - 1:
+            if self.last_change == "raise":
+                # The last raise didn't fit in the budget, so be slower to try again
+                self.raise_hold = min(self.raise_hold * 2, QUALITY_MAX_HOLD_FRAMES)
+            self.last_change = "lower"
+            self.set_tier(self.tier + 1)
+            print(f"Quality lowered to '{self.tier_name}' ({average:.1f} ms/frame)")
+        elif (average < FRAME_BUDGET_MS * QUALITY_UPGRADE_RATIO and self.tier > 0
+              and self.frames_since_change >= self.raise_hold):
+            self.last_change = "raise"
+            self.set_tier(self.tier - 1)
+            print(f"Quality raised to '{self.tier_name}' ({average:.1f} ms/frame)")
@@ -0,0 +1,440 @@
+# src/replay.py
+import os
+import struct
+import time
+import zlib
+from src.constants import (
+    FPS, MAP_WIDTH, MAP_HEIGHT, REPLAY_COORD_SCALE, REPLAY_COORD_MARGIN,
+    REPLAY_BLOCK_EVENTS, REPLAY_BLOCK_TICKS
+)
+from src.telemetry import JsonlWriter
+
+REPLAY_MAGIC = b"LRPL"
+REPLAY_INDEX_MAGIC = b"LRPI"
+REPLAY_VERSION = 1
+
+# Inputs are stored as a 3-bit action code
+ACTIONS = ("move", "flash", "primary", "secondary", "movement", "ultimate")
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+# Chunk types: every chunk is a type byte, a payload length (u32) and the payload
+CHUNK_SESSION = 1    # session, seed, invulnerable, character
+CHUNK_WAVE = 2       # session, wave, tick the wave started on
+CHUNK_BLOCK = 3      # session, first tick, wave, input count, zlib-compressed inputs
+CHUNK_END = 4        # session, tick count
+CHUNK_INDEX = 5      # every chunk above except blocks, which are replaced by block references
+CHUNK_BLOCK_REF = 6  # session, first tick, wave, input count, file offset of the block
+
+CHUNK_HEADER = struct.Struct("<BI")
+TRAILER = struct.Struct("<I4s")  # Offset of the index chunk, REPLAY_INDEX_MAGIC
+COORDS = struct.Struct("<HH")
+
+
+def write_varint(buffer, value):
+    """Append an unsigned LEB128 varint (7 bits per byte, small values take one byte)."""
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data, pos):
+    """Decode a varint at data[pos]; returns (value, position after it)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def quantize(value, size):
+    """World coordinate to a u16: 1/REPLAY_COORD_SCALE pixel steps, clamped to the map plus a margin."""
+    q = round((value + REPLAY_COORD_MARGIN) * REPLAY_COORD_SCALE)
+    return min(max(q, 0), (size + 2 * REPLAY_COORD_MARGIN) * REPLAY_COORD_SCALE)
+
+
+def dequantize(q):
+    return q / REPLAY_COORD_SCALE - REPLAY_COORD_MARGIN
+
+
+class ReplayWriter(JsonlWriter):
+    """The background file writer, writing replay chunks instead of JSON lines.
+
+    Records are tuples like ("block", session, first_tick, wave, count,
+    inputs). Blocks are compressed here, on the writer thread, so recording
+    costs the frame only a few bytes appended to a buffer. The writer keeps
+    every chunk but the blocks' contents for the index, which is written
+    on close along with a trailer pointing at it.
+    """
+
+    def __init__(self, path):
+        self.offset = 0
+        self.index = bytearray()
+        # Unbounded queue (max_queue=0): nothing is ever dropped and write() never blocks the frame.
+        # It only holds a few chunks per wave (blocks of up to REPLAY_BLOCK_EVENTS inputs), so it stays small.
+        super().__init__(path, max_queue=0, mode="wb")
+        self.write(("file",))
+
+    def close(self):
+        if not self.closed:
+            self.write(("index",))
+        super().close()
+
+    def encode(self, batch):
+        out = bytearray()
+        for record in batch:
+            kind = record[0]
+            payload = bytearray()
+            if kind == "file":
+                out += REPLAY_MAGIC + bytes([REPLAY_VERSION])
+                self.offset += len(REPLAY_MAGIC) + 1
+                continue
+            if kind == "index":
+                out += CHUNK_HEADER.pack(CHUNK_INDEX, len(self.index)) + self.index
+                out += TRAILER.pack(self.offset, REPLAY_INDEX_MAGIC)
+                self.offset += CHUNK_HEADER.size + len(self.index) + TRAILER.size
+                continue
+
+            if kind == "session":
+                session, seed, invulnerable, character = record[1:]
+                chunk_type = CHUNK_SESSION
+                write_varint(payload, session)
+                write_varint(payload, seed * 2 if seed >= 0 else -seed * 2 - 1)  # Zigzag, for negative seeds
+                payload.append(1 if invulnerable else 0)
+                name = character.encode("utf-8")
+                write_varint(payload, len(name))
+                payload += name
+            elif kind == "wave":
+                chunk_type = CHUNK_WAVE
+                for value in record[1:]:
+                    write_varint(payload, value)
+            elif kind == "end":
+                chunk_type = CHUNK_END
+                for value in record[1:]:
+                    write_varint(payload, value)
+            else:  # block
+                chunk_type = CHUNK_BLOCK
+                for value in record[1:5]:
+                    write_varint(payload, value)
+                ref = bytearray(payload)
+                write_varint(ref, self.offset)
+                self.index += CHUNK_HEADER.pack(CHUNK_BLOCK_REF, len(ref)) + ref
+                payload += zlib.compress(record[5], 9)
+
+            chunk = CHUNK_HEADER.pack(chunk_type, len(payload)) + payload
+            if chunk_type != CHUNK_BLOCK:
+                self.index += chunk
+            out += chunk
+            self.offset += len(chunk)
+        return bytes(out)
+
+
+class InputRecorder:
+    """Logs every gameplay input with the tick it happened on, so a session can be replayed exactly.
+
+    Recordings are a binary container (see ReplayWriter and ReplayFile).
+    Each game session (from a fresh world to the next reset) starts with a
+    chunk holding the RNG seed, character and invulnerability. Inputs are
+    packed as a varint of the ticks since the previous input (with the
+    action in the low 3 bits) and the target position quantized to a
+    1/16 pixel on the map, about 5 bytes each. They're collected into
+    blocks that close at every wave start, every REPLAY_BLOCK_EVENTS inputs
+    and every REPLAY_BLOCK_TICKS ticks; compression and disk writes happen
+    on the writer thread. Ticks count PlayState updates, so time spent
+    paused or in menus doesn't shift the inputs.
+    """
+
+    def __init__(self, game, path):
+        self.game = game
+        self.writer = ReplayWriter(path)
+        self.sessions = 0
+        self.inputs = 0
+        self.tick = 0
+        self.in_session = False
+        self.block = bytearray()
+        self.block_inputs = 0
+        self.block_tick = 0
+        self.block_wave = 0
+        self.last_tick = 0
+
+    def _ensure_session(self):
+        if self.in_session:
+            return
+        self.sessions += 1
+        self.tick = 0
+        self.in_session = True
+        game = self.game
+        self.writer.write(("session", self.sessions, game.seed, bool(game.player.invulnerable), game.selected_character))
+        self._start_block(game.enemy_manager.current_wave)
+
+    def _start_block(self, wave):
+        self.block_tick = self.last_tick = self.tick
+        self.block_wave = wave
+
+    def _end_block(self):
+        if self.block_inputs:
+            self.writer.write(("block", self.sessions, self.block_tick, self.block_wave, self.block_inputs, bytes(self.block)))
+            self.block = bytearray()
+            self.block_inputs = 0
+
+    def _end_session(self):
+        if self.in_session:
+            self._end_block()
+            self.writer.write(("end", self.sessions, self.tick))
+            self.in_session = False
+
+    def record(self, action, world_x, world_y):
+        """Log an input, which takes effect in the next tick. Returns the position as it will replay."""
+        self._ensure_session()
+        qx = quantize(world_x, MAP_WIDTH)
+        qy = quantize(world_y, MAP_HEIGHT)
+        write_varint(self.block, (self.tick - self.last_tick) << 3 | ACTION_CODES[action])
+        self.block += COORDS.pack(qx, qy)
+        self.last_tick = self.tick
+        self.block_inputs += 1
+        self.inputs += 1
+        if self.block_inputs >= REPLAY_BLOCK_EVENTS:
+            self._end_block()
+            self._start_block(self.block_wave)
+        # The game uses the quantized position too, so the replay matches exactly
+        return dequantize(qx), dequantize(qy)
+
+    def wave_started(self, wave):
+        """Start a new block, so a reader can find each wave's inputs from the index."""
+        self._ensure_session()
+        self._end_block()
+        self._start_block(wave)
+        self.writer.write(("wave", self.sessions, wave, self.tick))
+
+    def tick_finished(self):
+        self._ensure_session()
+        self.tick += 1
+        if self.block_inputs and self.tick - self.block_tick >= REPLAY_BLOCK_TICKS:
+            self._end_block()
+            self._start_block(self.block_wave)
+
+    def reset(self):
+        """The world was reset; the next input or tick starts a new session."""
+        self._end_session()
+
+    def close(self):
+        self._end_session()
+        self.writer.close()
+        print(f"Input recording: {self.sessions} sessions, {self.inputs} inputs, "
+              f"{self.writer.offset / 1024:.1f} KB written to {self.writer.path}")
+
+
+class ReplayFile:
+    """Reads a replay container: the sessions' headers, wave start ticks and input blocks.
+
+    The index at the end of the file gives everything but the inputs in one
+    read. A file that has no index (the game was killed while recording) is
+    scanned chunk by chunk instead, skipping over block contents, and a
+    chunk cut off at the end is ignored.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.size = os.path.getsize(path)
+        self.sessions = {}
+        self.indexed = False
+        with open(path, "rb") as f:
+            head = f.read(len(REPLAY_MAGIC) + 1)
+            if head[:len(REPLAY_MAGIC)] != REPLAY_MAGIC:
+                raise ValueError(f"{path} is not a replay file")
+            self.version = head[-1]
+            if self.version != REPLAY_VERSION:
+                raise ValueError(f"{path} is replay version {self.version}, expected {REPLAY_VERSION}")
+
+            if self.size >= len(head) + TRAILER.size:
+                f.seek(self.size - TRAILER.size)
+                index_offset, magic = TRAILER.unpack(f.read(TRAILER.size))
+                if magic == REPLAY_INDEX_MAGIC:
+                    f.seek(index_offset)
+                    chunk_type, length = CHUNK_HEADER.unpack(f.read(CHUNK_HEADER.size))
+                    index = f.read(length)
+                    pos = 0
+                    while pos < len(index):
+                        chunk_type, length = CHUNK_HEADER.unpack_from(index, pos)
+                        pos += CHUNK_HEADER.size
+                        self._add_chunk(chunk_type, index[pos:pos + length], None)
+                        pos += length
+                    self.indexed = True
+                    return
+
+            offset = len(head)
+            f.seek(offset)
+            while offset + CHUNK_HEADER.size <= self.size:
+                chunk_type, length = CHUNK_HEADER.unpack(f.read(CHUNK_HEADER.size))
+                if chunk_type == CHUNK_INDEX or offset + CHUNK_HEADER.size + length > self.size:
+                    break  # Cut off mid-write
+                if chunk_type == CHUNK_BLOCK:
+                    # Only the block's small header is needed now
+                    payload = f.read(min(length, 40))
+                    f.seek(offset + CHUNK_HEADER.size + length)
+                else:
+                    payload = f.read(length)
+                self._add_chunk(chunk_type, payload, offset)
+                offset += CHUNK_HEADER.size + length
+
+    def _add_chunk(self, chunk_type, payload, offset):
+        session, pos = read_varint(payload, 0)
+        if chunk_type == CHUNK_SESSION:
+            seed, pos = read_varint(payload, pos)
+            invulnerable = payload[pos] == 1
+            length, pos = read_varint(payload, pos + 1)
+            self.sessions[session] = {
+                "session": session,
+                "seed": seed // 2 if seed % 2 == 0 else -(seed + 1) // 2,
+                "character": payload[pos:pos + length].decode("utf-8"),
+                "invulnerable": invulnerable,
+                "waves": [],
+                "blocks": [],
+                "inputs": 0,
+                "end": None
+            }
+            return
+
+        info = self.sessions.get(session)
+        if info is None:
+            return
+        if chunk_type == CHUNK_WAVE:
+            wave, pos = read_varint(payload, pos)
+            tick, pos = read_varint(payload, pos)
+            info["waves"].append((wave, tick))
+        elif chunk_type == CHUNK_END:
+            info["end"], pos = read_varint(payload, pos)
+        elif chunk_type in (CHUNK_BLOCK, CHUNK_BLOCK_REF):
+            first_tick, pos = read_varint(payload, pos)
+            wave, pos = read_varint(payload, pos)
+            count, pos = read_varint(payload, pos)
+            if chunk_type == CHUNK_BLOCK_REF:
+                offset, pos = read_varint(payload, pos)
+            info["blocks"].append((first_tick, wave, count, offset))
+            info["inputs"] += count
+
+    def session(self, number):
+        if number not in self.sessions:
+            raise ValueError(f"{self.path} has no session {number}")
+        return self.sessions[number]
+
+    def wave_start(self, number, wave):
+        """The tick a wave started on in a session, or None if the recording never reached it."""
+        for recorded_wave, tick in self.session(number)["waves"]:
+            if recorded_wave == wave:
+                return tick
+        return None
+
+    def read_inputs(self, number, until_tick=None):
+        """Decode a session's inputs as (tick, action, x, y), stopping before `until_tick`.
+
+        Blocks that start at or after `until_tick` aren't read at all.
+        """
+        inputs = []
+        with open(self.path, "rb") as f:
+            for first_tick, wave, count, offset in self.session(number)["blocks"]:
+                if until_tick is not None and first_tick >= until_tick:
+                    break
+                f.seek(offset)
+                chunk_type, length = CHUNK_HEADER.unpack(f.read(CHUNK_HEADER.size))
+                payload = f.read(length)
+                pos = 0
+                for _ in range(4):  # Session, first tick, wave, count
+                    _, pos = read_varint(payload, pos)
+                data = zlib.decompress(payload[pos:])
+
+                tick = first_tick
+                pos = 0
+                for _ in range(count):
+                    value, pos = read_varint(data, pos)
+                    qx, qy = COORDS.unpack_from(data, pos)
+                    pos += COORDS.size
+                    tick += value >> 3
+                    if until_tick is not None and tick >= until_tick:
+                        return inputs
+                    inputs.append((tick, ACTIONS[value & 7], dequantize(qx), dequantize(qy)))
+        return inputs
+
+    def print_summary(self):
+        print(f"{self.path}: replay version {self.version}, {self.size / 1024:.1f} KB, "
+              f"{'indexed' if self.indexed else 'no index (recording was cut off)'}")
+        for info in self.sessions.values():
+            end = info["end"] if info["end"] is not None else "?"
+            print(f"  Session {info['session']}: {info['character']}, seed {info['seed']}, "
+                  f"{end} ticks, {info['inputs']} inputs in {len(info['blocks'])} blocks"
+                  f"{', invulnerable' if info['invulnerable'] else ''}")
+            if info["waves"]:
+                print("    Waves start at tick: " + ", ".join(f"{wave}@{tick}" for wave, tick in info["waves"]))
+
+
+def load_replay(path, session=1, until_wave=None):
+    """Read one session of a recording: (header, inputs as (tick, action, x, y), tick count).
+
+    With `until_wave`, only the ticks up to the end of that wave are
+    returned (found from the index, without decoding later blocks).
+    """
+    replay = ReplayFile(path)
+    header = replay.session(session)
+    end = header["end"]
+    if until_wave is not None:
+        next_wave = replay.wave_start(session, until_wave + 1)
+        if next_wave is not None:
+            end = next_wave
+    inputs = replay.read_inputs(session, until_tick=end)
+    if end is None:
+        # The recording was cut off (e.g. the game crashed): play up to the last input
+        end = inputs[-1][0] + 1 if inputs else 0
+    return header, inputs, end
+
+
+class InputReplayer:
+    """Feeds a recorded session's inputs back into PlayState at the ticks they happened on.
+
+    The game must be created with the session's seed, character and
+    invulnerability (see replay_options) and should run headless, so the
+    simulation runs uncapped. The game stops after the session's last tick.
+    """
+
+    def __init__(self, game, inputs, end):
+        self.game = game
+        self.inputs = inputs
+        self.end = end
+        self.next_input = 0
+        self.tick = 0
+        self.start_time = None
+
+    def before_tick(self, play_state):
+        """Apply every input recorded before this tick."""
+        if self.start_time is None:
+            self.start_time = time.perf_counter()
+        inputs = self.inputs
+        while self.next_input < len(inputs) and inputs[self.next_input][0] <= self.tick:
+            tick, action, world_x, world_y = inputs[self.next_input]
+            play_state.perform(action, world_x, world_y)
+            self.next_input += 1
+
+    def tick_finished(self):
+        self.tick += 1
+        if self.tick >= self.end:
+            self.game.running = False
+
+    def print_report(self):
+        elapsed = time.perf_counter() - self.start_time if self.start_time else 0
+        line = f"Replay: {self.tick}/{self.end} ticks, {self.next_input}/{len(self.inputs)} inputs"
+        if elapsed > 0:
+            line += f" in {elapsed:.1f} s ({self.tick / FPS / elapsed:.1f}x realtime)"
+        print(line)
+
+
+def replay_options(header):
+    """Launch options that recreate the recorded session's world."""
+    return {
+        "seed": header["seed"],
+        "selected_character": header["character"],
+        "invulnerable": header["invulnerable"],
+        "headless": True
+    }
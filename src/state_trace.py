@@ -0,0 +1,130 @@
+# src/state_trace.py
+import itertools
+import json
+import math
+import zlib
+from array import array
+from src.telemetry import JsonlWriter
+
+ENEMY_FIELDS = ("x", "y", "health", "alive", "angle", "velocity_x", "velocity_y",
+                "attack_cooldown", "direction_change_timer", "direction_change_delay")
+PROJECTILE_FIELDS = ("x", "y", "active", "distance_traveled")
+
+
+def _values(obj, fields):
+    """Field values as floats (None becomes NaN so it still hashes)."""
+    values = []
+    for name in fields:
+        value = getattr(obj, name, None)
+        values.append(math.nan if value is None else float(value))
+    return values
+
+
+def player_fields(player):
+    """Position, health, movement target and every ability cooldown of the player."""
+    cooldowns = sorted(name for name, value in vars(player).items()
+                       if name.endswith("cooldown") and isinstance(value, (int, float)))
+    return ("x", "y", "health", "target_x", "target_y") + tuple(cooldowns)
+
+
+def world_state(game):
+    """The simulated world as lists of field values, grouped into parts."""
+    player = game.player
+    enemies = game.enemy_manager.enemies
+    return {
+        "player": [_values(player, player_fields(player))],
+        "enemies": [_values(enemy, ENEMY_FIELDS) for enemy in enemies],
+        "enemy_projectiles": [_values(projectile, PROJECTILE_FIELDS)
+                              for enemy in enemies for projectile in enemy.projectiles],
+        "player_projectiles": [_values(projectile, PROJECTILE_FIELDS) for projectile in player.projectiles],
+        "game": [[game.score, game.enemy_manager.current_wave, game.enemy_manager.wave_timer]]
+    }
+
+
+def hash_part(rows):
+    """CRC32 of a part's values, packed as doubles (cheap, and the same in every process)."""
+    checksum = zlib.crc32(len(rows).to_bytes(4, "little"))
+    for row in rows:
+        checksum = zlib.crc32(array("d", row).tobytes(), checksum)
+    return checksum
+
+
+class StateTrace:
+    """Writes a hash of the world after every gameplay tick, to prove an optimization didn't change gameplay.
+
+    Each trace line holds the tick number, a CRC32 per part of the world
+    (player, enemies, enemy projectiles, player projectiles, score/wave)
+    and a rolling hash that chains every tick so far. With `full`, the raw
+    field values are written too, so a comparison can name the exact field
+    that diverged. Run the same seed and inputs before and after a change
+    and compare the traces with compare_traces().
+    """
+
+    def __init__(self, game, path, full=False):
+        self.game = game
+        self.full = full
+        self.tick = 0
+        self.rolling = 0
+        # Every line matters for a comparison, so block rather than drop if the writer falls behind
+        self.writer = JsonlWriter(path, mode="w", block_when_full=True)
+
+    def record(self):
+        """Hash the world as it is at the end of this tick."""
+        self.tick += 1
+        state = world_state(self.game)
+        parts = {name: hash_part(rows) for name, rows in state.items()}
+        for name in state:
+            self.rolling = zlib.crc32(parts[name].to_bytes(4, "little"), self.rolling)
+
+        line = {"tick": self.tick, "hash": self.rolling, "parts": parts}
+        if self.full:
+            line["state"] = state
+            line["player_fields"] = player_fields(self.game.player)
+        self.writer.write(line)
+
+    def close(self):
+        self.writer.close()
+        print(f"State trace: {self.tick} ticks written to {self.writer.path}")
+
+
+def _first_field_difference(line_a, line_b, part):
+    """Describe the first differing entry of one part, e.g. "enemies[3].x: 512.0 != 513.5, enemies[3].angle: ..."."""
+    rows_a, rows_b = line_a["state"][part], line_b["state"][part]
+    if len(rows_a) != len(rows_b):
+        return f"{part}: {len(rows_a)} entries != {len(rows_b)}"
+    fields = {"player": line_a["player_fields"], "enemies": ENEMY_FIELDS, "enemy_projectiles": PROJECTILE_FIELDS,
+              "player_projectiles": PROJECTILE_FIELDS, "game": ("score", "wave", "wave_timer")}[part]
+    for index, (row_a, row_b) in enumerate(zip(rows_a, rows_b)):
+        changes = [
+            f"{part}[{index}].{fields[column]}: {a} != {b}"
+            for column, (a, b) in enumerate(zip(row_a, row_b))
+            if a != b and not (a != a and b != b)  # NaN (None) on both sides counts as equal
+        ]
+        if changes:
+            return ", ".join(changes)
+    return f"{part}: values differ"
+
+
+def compare_traces(path_a, path_b):
+    """Print the first tick where two traces diverge and what changed; return True if they match."""
+    with open(path_a) as file_a, open(path_b) as file_b:
+        for line_a, line_b in itertools.zip_longest(file_a, file_b):
+            if line_a is None or line_b is None:
+                longer = path_a if line_b is None else path_b
+                print(f"Traces match for every shared tick, but {longer} has more ticks")
+                return False
+
+            a, b = json.loads(line_a), json.loads(line_b)
+            if a["hash"] == b["hash"]:
+                continue
+
+            parts = [name for name in a["parts"] if a["parts"][name] != b["parts"].get(name)]
+            print(f"Traces diverge at tick {a['tick']} in: {', '.join(parts)}")
+            if "state" in a and "state" in b:
+                for part in parts:
+                    print(f"  {_first_field_difference(a, b, part)}")
+            else:
+                print("  (record both traces with --trace-full to see which field changed)")
+            return False
+    print("Traces match")
+    return True
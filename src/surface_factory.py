@@ -0,0 +1,69 @@
+# src/surface_factory.py
+import weakref
+import pygame
+
+class SurfaceFactory:
+    """Creates and converts surfaces to the display's pixel format so blits take the fast path.
+
+    Static sprites can also be RLE-accelerated, which skips their transparent
+    pixels when blitting. Don't use RLE for surfaces that are drawn on or
+    filled after creation: every change has to decode and re-encode them.
+
+    Surfaces stored on long-lived objects can be tracked, so they are
+    converted again when the display is recreated (e.g. by a fullscreen
+    toggle) with a possibly different pixel format.
+    """
+
+    def __init__(self):
+        # Owner object -> {attribute name: (alpha, rle)}; owners are dropped once garbage collected
+        self.tracked = weakref.WeakKeyDictionary()
+
+    def display_ready(self):
+        return pygame.display.get_surface() is not None
+
+    def convert(self, surface, alpha=None, rle=False):
+        """Return a copy of a surface in display format. alpha=None keeps the surface's own choice."""
+        if alpha is None:
+            alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+        if not self.display_ready():
+            return surface  # Nothing to match yet (e.g. no window has been opened)
+
+        if alpha:
+            converted = surface.convert_alpha()
+            if rle:
+                converted.set_alpha(255, pygame.RLEACCEL)
+            elif converted.get_flags() & pygame.RLEACCELOK:
+                # Copies of an RLE sprite inherit RLE; clear it so drawing on the copy stays cheap
+                converted.set_alpha(converted.get_alpha(), 0)
+        else:
+            converted = surface.convert()
+            colorkey = surface.get_colorkey()
+            if colorkey is not None:
+                converted.set_colorkey(colorkey, pygame.RLEACCEL if rle else 0)
+        return converted
+
+    def create(self, size, alpha=False, fill=None):
+        """Create a new display-format surface, optionally filled with a color."""
+        surface = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+        if fill is not None:
+            surface.fill(fill)
+        return self.convert(surface, alpha)
+
+    def track(self, owner, attribute, alpha=None, rle=False):
+        """Re-convert owner.<attribute> whenever the display changes."""
+        self.tracked.setdefault(owner, {})[attribute] = (alpha, rle)
+
+    def reconvert_all(self):
+        """Convert every tracked surface to the current display format."""
+        count = 0
+        for owner, attributes in list(self.tracked.items()):
+            for attribute, (alpha, rle) in attributes.items():
+                surface = getattr(owner, attribute, None)
+                if surface is not None:
+                    setattr(owner, attribute, self.convert(surface, alpha, rle))
+                    count += 1
+        return count
+
+
+# Shared by everything that builds surfaces, including objects without a game reference (players)
+surface_factory = SurfaceFactory()
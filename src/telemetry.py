@@ -0,0 +1,136 @@
+# src/telemetry.py
+import gc
+import json
+import queue
+import threading
+import time
+from src.constants import TELEMETRY_QUEUE_SIZE, TELEMETRY_FLUSH_SECONDS
+
+class JsonlWriter:
+    """Appends records to a JSON Lines file from a background thread.
+
+    The frame thread only puts records on a bounded queue; serializing and
+    disk I/O happen on the writer thread, which flushes the file every
+    TELEMETRY_FLUSH_SECONDS. If the writer falls behind and the queue is
+    full, new records are dropped (and counted) rather than growing memory
+    or blocking the game. Writers that must not lose records (traces) can
+    ask to block instead.
+    """
+
+    _CLOSE = object()
+
+    def __init__(self, path, max_queue=TELEMETRY_QUEUE_SIZE, flush_seconds=TELEMETRY_FLUSH_SECONDS,
+                 mode="a", block_when_full=False):
+        self.path = path
+        self.mode = mode
+        self.block_when_full = block_when_full
+        self.flush_seconds = flush_seconds
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.written = 0
+        self.dropped = 0
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, name="telemetry-writer", daemon=True)
+        self.thread.start()
+
+    def write(self, record):
+        """Queue a record (a JSON-serializable dict); only blocks if created with block_when_full."""
+        if self.closed:
+            return
+        if self.block_when_full:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        """Write out everything queued so far and stop the writer thread."""
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(self._CLOSE)
+        self.thread.join()
+
+    def encode(self, batch):
+        """Serialize a batch of records for one write (runs on the writer thread)."""
+        return "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in batch)
+
+    def _run(self):
+        try:
+            f = open(self.path, self.mode)
+        except OSError as e:
+            print(f"Error opening telemetry file: {e}")
+            f = None
+
+        last_flush = time.monotonic()
+        closing = False
+        while not closing:
+            try:
+                batch = [self.queue.get(timeout=self.flush_seconds)]
+            except queue.Empty:
+                batch = []
+            # Take whatever else is waiting so it goes out in one write
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if batch and batch[-1] is self._CLOSE:
+                batch.pop()
+                closing = True
+            if f is None:
+                continue
+
+            if batch:
+                f.write(self.encode(batch))
+                self.written += len(batch)
+            if closing or time.monotonic() - last_flush >= self.flush_seconds:
+                f.flush()
+                last_flush = time.monotonic()
+
+        if f is not None:
+            f.close()
+
+
+class TelemetryRecorder:
+    """Builds a telemetry record every `interval` frames and hands it to a JsonlWriter."""
+
+    def __init__(self, game, writer, interval=1):
+        self.game = game
+        self.writer = writer
+        self.interval = max(1, interval)
+        self.frame = 0
+        self.start_time = time.perf_counter()
+
+    def frame_finished(self, frame_ms, events_ms, update_ms, render_ms):
+        """Record the frame that just ended (phase times in ms; render includes the flip)."""
+        self.frame += 1
+        if self.frame % self.interval:
+            return
+
+        game = self.game
+        enemy_manager = game.enemy_manager
+        self.writer.write({
+            "frame": self.frame,
+            "time": round(time.perf_counter() - self.start_time, 4),
+            "state": type(game.state).__name__,
+            "frame_ms": round(frame_ms, 3),
+            "events_ms": round(events_ms, 3),
+            "update_ms": round(update_ms, 3),
+            "render_ms": round(render_ms, 3),
+            "wave": enemy_manager.current_wave,
+            "in_wave_cooldown": enemy_manager.in_wave_cooldown,
+            "spawn_delay": enemy_manager.get_spawn_delay(),
+            "enemies": len(enemy_manager.enemies),
+            "player_projectiles": len(game.player.projectiles),
+            "enemy_projectiles": enemy_manager.count_projectiles(),
+            "quality": game.quality.tier_name,
+            # Collections so far per GC generation
+            "gc_collections": [generation["collections"] for generation in gc.get_stats()]
+        })
+
+    def close(self):
+        self.writer.close()
+        print(f"Telemetry: {self.writer.written} records written to {self.writer.path}, {self.writer.dropped} dropped")
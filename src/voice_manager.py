@@ -0,0 +1,117 @@
+# src/voice_manager.py
+import pygame
+from src.constants import VOICE_CATEGORIES, SOUND_VOICES, DEFAULT_SOUND_VOICE
+
+class VoiceManager:
+    """Hands out mixer channels to sound effects by category, instance cap and priority."""
+
+    def __init__(self):
+        # Reserve every channel so Sound.play() elsewhere can't grab one behind our back
+        total_channels = sum(VOICE_CATEGORIES.values())
+        pygame.mixer.set_num_channels(total_channels)
+        pygame.mixer.set_reserved(total_channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(total_channels)]
+
+        # Give each category its own block of channel indices
+        self.pools = {}
+        index = 0
+        for category, count in VOICE_CATEGORIES.items():
+            self.pools[category] = list(range(index, index + count))
+            index += count
+
+        # What each busy channel is playing: channel index -> (name, priority, frame started)
+        self.voices = {}
+
+        # Sounds already triggered this frame (identical triggers are coalesced)
+        self.frame = 0
+        self.triggered = set()
+
+        # Statistics
+        self.played = 0
+        self.coalesced = 0
+        self.dropped = {}  # sound name -> count
+        self.stolen = {}   # sound name of the voice that was cut off -> count
+
+    def begin_frame(self):
+        """Start a new frame so sounds can be triggered again."""
+        self.frame += 1
+        self.triggered.clear()
+
+    def play(self, name, sound):
+        """Play a sound on a channel from its category. Returns the channel or None."""
+        # Coalesce identical triggers within the same frame
+        if name in self.triggered:
+            self.coalesced += 1
+            return None
+        self.triggered.add(name)
+
+        category, max_instances, priority = SOUND_VOICES.get(name, DEFAULT_SOUND_VOICE)
+        pool = self.pools.get(category, self.pools[DEFAULT_SOUND_VOICE[0]])
+
+        # Find a free channel and count live instances of this sound
+        free_index = None
+        instances = 0
+        for index in pool:
+            if not self.channels[index].get_busy():
+                self.voices.pop(index, None)
+                if free_index is None:
+                    free_index = index
+            elif index in self.voices and self.voices[index][0] == name:
+                instances += 1
+
+        # Respect the per-sound instance cap
+        if instances >= max_instances:
+            self._record_drop(name)
+            return None
+
+        if free_index is None:
+            free_index = self._steal_voice(pool, priority)
+            if free_index is None:
+                self._record_drop(name)
+                return None
+
+        channel = self.channels[free_index]
+        channel.play(sound)
+        self.voices[free_index] = (name, priority, self.frame)
+        self.played += 1
+        return channel
+
+    def _steal_voice(self, pool, priority):
+        """Stop the lowest priority, oldest voice in a full pool if it doesn't outrank the new one."""
+        victim = None
+        victim_key = None
+        for index in pool:
+            # Unknown voices (shouldn't happen with reserved channels) are stolen first
+            name, voice_priority, started = self.voices.get(index, (None, -1, -1))
+            key = (voice_priority, started)
+            if victim_key is None or key < victim_key:
+                victim = index
+                victim_key = key
+
+        if victim is None or victim_key[0] > priority:
+            return None
+
+        victim_name = self.voices.get(victim, ("unknown",))[0]
+        self.stolen[victim_name] = self.stolen.get(victim_name, 0) + 1
+        self.channels[victim].stop()
+        self.voices.pop(victim, None)
+        return victim
+
+    def _record_drop(self, name):
+        self.dropped[name] = self.dropped.get(name, 0) + 1
+
+    def stop_all(self):
+        """Stop every sound effect voice."""
+        for channel in self.channels:
+            channel.stop()
+        self.voices.clear()
+
+    def report(self):
+        """Return voice statistics for debugging."""
+        return {
+            "played": self.played,
+            "coalesced": self.coalesced,
+            "dropped": dict(self.dropped),
+            "stolen": dict(self.stolen),
+            "busy_channels": sum(1 for channel in self.channels if channel.get_busy())
+        }
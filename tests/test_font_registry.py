@@ -0,0 +1,63 @@
+"""Screens must get their fonts from AssetManager instead of opening the font file again."""
+import os
+import sys
+import unittest
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Headless, from the project root (the game loads assets through relative paths)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pygame
+
+
+class FontRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(ROOT)
+        from src.game import Game
+        self.game = Game(options={"seed": 1, "invulnerable": True})
+
+    def tearDown(self):
+        self.game.gc_policy.close()
+        pygame.quit()
+        os.chdir(self.cwd)
+
+    def show(self, state):
+        """Let the state run and draw one frame, as the main loop would."""
+        self.assertIs(self.game.state, state)
+        state.update()
+        state.render(self.game.screen)
+
+    def test_no_fonts_opened_across_a_game(self):
+        from src.constants import STATE_MENU, STATE_PLAY, STATE_PAUSE, STATE_GAME_OVER
+        game = self.game
+        created = []
+        real_font = pygame.font.Font
+
+        def counting_font(*args, **kwargs):
+            created.append(args)
+            return real_font(*args, **kwargs)
+
+        with mock.patch.object(pygame.font, "Font", counting_font):
+            # Twice around, so screens are both built and reused
+            for _ in range(2):
+                self.show(game.states.change_state(STATE_MENU))
+                play = game.states.change_state(STATE_PLAY)
+                self.show(play)
+                self.show(game.states.push_state(STATE_PAUSE, previous_state=play))
+                game.states.pop_state()
+                self.show(game.states.change_state(STATE_GAME_OVER, score=100))
+                game.reset_game()
+
+        self.assertEqual(created, [], "fonts were opened after startup")
+
+
+if __name__ == "__main__":
+    unittest.main()